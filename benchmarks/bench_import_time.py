@@ -0,0 +1,82 @@
+"""
+Benchmark cold import time of the linkedin_agent package and entry point modules.
+
+Each module is imported in a fresh interpreter without GEMINI_API_KEY, so
+the numbers reflect what a CLI invocation pays before doing any work. The
+heavy column shows whether LangGraph or the Gemini client got loaded.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+MODULES = (
+    "linkedin_agent",
+    "linkedin_agent.config.settings",
+    "linkedin_agent.tools.crawler",
+    "linkedin_agent.storage.review_queue",
+    "linkedin_agent.workflow.graph",
+)
+
+HEAVY_PACKAGES = ("langgraph", "langchain_google_genai")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(elapsed, ','.join(heavy) or '-')
+"""
+
+def measure(module: str):
+    """
+    Import ``module`` in a new interpreter.
+    
+    Returns:
+        Tuple of the import time in seconds (None on failure) and the heavy packages loaded
+    """
+    env = {key: value for key, value in os.environ.items() if key != "GEMINI_API_KEY"}
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_PACKAGES)],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"
+        return None, error
+    elapsed, heavy = proc.stdout.split()
+    return float(elapsed), heavy
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of linkedin_agent modules.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module")
+    args = parser.parse_args()
+
+    print(f"{'module':<40} {'median ms':>10} {'min ms':>10}  heavy")
+    for module in MODULES:
+        samples, heavy = [], "-"
+        for _ in range(max(args.repeat, 1)):
+            elapsed, heavy = measure(module)
+            if elapsed is None:
+                break
+            samples.append(elapsed)
+        if not samples:
+            print(f"{module:<40} {'error':>10} {'':>10}  {heavy}")
+            continue
+        print(
+            f"{module:<40} {statistics.median(samples) * 1000:>10.1f} "
+            f"{min(samples) * 1000:>10.1f}  {heavy}"
+        )
+
+if __name__ == "__main__":
+    main()
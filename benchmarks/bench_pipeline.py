@@ -0,0 +1,248 @@
+"""
+Offline end-to-end benchmark of scraping, analysis and the full pipeline.
+
+Serves synthetic search and profile pages from a local fixture server,
+drives them with managed headless Chrome through the real scraping code, and
+analyzes the results with a deterministic fake chat model, so runs are
+repeatable and need neither a LinkedIn session nor API quota. Reports
+throughput and p50/p95 latency per stage for each profile count.
+
+Usage:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --sizes 10 100 --llm-latency 0.5 --modes batch
+    python benchmarks/bench_pipeline.py --skip-scrape  # analysis only, no Chrome needed
+    python benchmarks/bench_pipeline.py --skip-scrape --streaming  # streamed single-profile analyses
+
+Scraping requires Chrome (``--chrome-binary``) and a matching chromedriver
+(``CHROME_DRIVER_PATH`` or on PATH).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fixtures import RESULTS_PER_PAGE, FixtureServer, profile_fields
+
+SIZES = (10, 100, 1000)
+MODES = ("sequential", "parallel", "batch")
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Offline scraping and analysis benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Profile counts to benchmark")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES, help="Analysis modes to benchmark")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds per fake LLM call")
+    parser.add_argument("--page-delay", type=float, default=0.0, help="Seconds the fixture server waits per page")
+    parser.add_argument("--browsers", type=int, default=1, help="Managed headless Chrome instances in the pool")
+    parser.add_argument("--chrome-binary", default=os.getenv("CHROME_BINARY", "google-chrome"))
+    parser.add_argument("--skip-scrape", action="store_true", help="Only benchmark analysis")
+    parser.add_argument("--streaming", action="store_true", help="Stream single-profile analyses (LLM_STREAMING)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show the output of the code under test")
+    return parser.parse_args()
+
+def configure_environment(workdir: str, base_url: str, args: argparse.Namespace):
+    """
+    Point the settings at the fixture server, managed headless Chrome and a scratch directory.
+    
+    Must run before ``linkedin_agent`` is imported, since settings are read at import time.
+    """
+    os.environ.update({
+        "LINKEDIN_BASE_URL": base_url,
+        "CHROME_MODE": "managed",
+        "CHROME_BINARY": args.chrome_binary,
+        "CHROME_HEADLESS": "true",
+        "CHROME_MANAGED_BROWSERS": str(max(args.browsers, 1)),
+        "CHROME_PROFILE_DIR": os.path.join(workdir, "chrome_profiles"),
+        # The benchmark measures the code, not the production rate limits
+        "LINKEDIN_PAGES_PER_MINUTE": "1000000",
+        "LLM_REQUESTS_PER_MINUTE": "1000000",
+        "LLM_TOKENS_PER_MINUTE": "1000000000",
+        "LLM_CACHE_ENABLED": "false",
+        "LLM_STREAMING": str(args.streaming).lower(),
+        "REVIEW_MODE": "queue",
+        "REVIEW_QUEUE_PATH": os.path.join(workdir, "review_queue.sqlite"),
+        "CHECKPOINT_PATH": os.path.join(workdir, "checkpoints.sqlite"),
+        "SEEN_INDEX_PATH": os.path.join(workdir, "seen_profiles.sqlite"),
+        "HTML_ARCHIVE_DIR": os.path.join(workdir, "html_archive"),
+        "METRICS_DIR": os.path.join(workdir, "metrics")
+    })
+
+def install_fake_llm(latency: float):
+    """Replace the Gemini clients used by the workflow with the fake model."""
+    from fake_llm import FakeChatModel
+    from linkedin_agent.workflow.analysis import set_llm
+
+    model = FakeChatModel(latency=latency)
+    set_llm(model)
+    return model
+
+def _stage_timing(timings: Dict, name: str) -> Dict:
+    """Summary of the first timing called ``name``, whatever its labels."""
+    for label, timing in timings.items():
+        if label == name or label.startswith(name + "{"):
+            return timing
+    return {}
+
+def _report(stage: str, mode: str, count: int, elapsed: float, timing: Dict) -> Dict:
+    return {
+        "stage": stage,
+        "mode": mode,
+        "profiles": count,
+        "seconds": round(elapsed, 3),
+        "profiles_per_second": round(count / elapsed, 2) if elapsed else 0.0,
+        "p50_seconds": timing.get("p50_seconds", 0.0),
+        "p95_seconds": timing.get("p95_seconds", 0.0)
+    }
+
+def write_synthetic_profiles(path: str, base_url: str, count: int):
+    """Write ``count`` fixture profiles to a JSONL file, as the scraper would."""
+    from linkedin_agent.storage.jsonl import JsonlWriter
+
+    with JsonlWriter(path, append=False) as writer:
+        for index in range(count):
+            writer.write({"profile_url": f"{base_url}/in/profile-{index}/", **profile_fields(index)})
+
+def bench_scrape(server: FixtureServer, count: int, output_file: str) -> Dict:
+    """Crawl ``count`` fixture profiles into ``output_file``."""
+    from linkedin_agent.tools.crawler import crawl_profiles
+    from linkedin_agent.storage.jsonl import JsonlWriter
+    from linkedin_agent.monitoring.metrics import METRICS
+
+    server.total_profiles = count
+    METRICS.reset()
+    with JsonlWriter(output_file, append=False) as writer:
+        start = time.perf_counter()
+        profiles = crawl_profiles(
+            "benchmark",
+            max_pages=math.ceil(count / RESULTS_PER_PAGE),
+            on_profile=writer.write
+        )
+        elapsed = time.perf_counter() - start
+    timing = _stage_timing(METRICS.summary()["timings"], "profile_extract")
+    return _report("scrape", "", len(profiles), elapsed, timing)
+
+async def bench_analysis(source: str, mode: str, results_file: str) -> Dict:
+    """Run the analysis workflow in ``mode`` over the profiles streamed from ``source``."""
+    from linkedin_agent.workflow.graph import create_workflow
+    from linkedin_agent.workflow.states import new_results
+    from linkedin_agent.storage.jsonl import JsonlWriter
+    from linkedin_agent.monitoring.metrics import METRICS
+    from linkedin_agent.config.settings import WORKFLOW_RECURSION_LIMIT
+
+    app = create_workflow(mode)
+    initial_state = {
+        "profiles_data": [],
+        "profiles_source": source,
+        "profiles_filter": {},
+        "profiles_offset": 0,
+        "profiles_exhausted": False,
+        "current_profile_index": 0,
+        "analysis_results": [],
+        "analysis_index": {},
+        "results_source": results_file,
+        "results_offset": 0,
+        "action_taken": "",
+        "error": "",
+        "current_profile": None,
+        "message_to_send": ""
+    }
+
+    METRICS.reset()
+    analyzed = written = 0
+    start = time.perf_counter()
+    # Results are written out as the entry point does, so the summary reads them back
+    with JsonlWriter(results_file, append=False) as writer:
+        async for event in app.astream(initial_state, {"recursion_limit": WORKFLOW_RECURSION_LIMIT}):
+            results, written = new_results(next(iter(event.values())) or {}, written)
+            for result in results:
+                writer.write(result)
+            analyzed += len(results)
+    elapsed = time.perf_counter() - start
+
+    timings = METRICS.summary()["timings"]
+    kind = "batch" if mode == "batch" else "analyze"
+    timing = _stage_timing(timings, f"llm_latency{{kind={kind}}}")
+    return _report("analysis", mode, analyzed, elapsed, timing)
+
+async def bench_streaming_pipeline(server: FixtureServer, count: int) -> Dict:
+    """Crawl ``count`` fixture profiles and analyze each one as it is extracted."""
+    from linkedin_agent.workflow.pipeline import run_pipeline
+    from linkedin_agent.monitoring.metrics import METRICS
+
+    server.total_profiles = count
+    METRICS.reset()
+    start = time.perf_counter()
+    results = await run_pipeline("benchmark", max_pages=math.ceil(count / RESULTS_PER_PAGE))
+    elapsed = time.perf_counter() - start
+    timing = _stage_timing(METRICS.summary()["timings"], "llm_latency{kind=analyze}")
+    return _report("pipeline", "streaming", len(results), elapsed, timing)
+
+def print_results(results: List[Dict]):
+    """Print the results as an aligned table."""
+    header = f"{'stage':<10} {'mode':<11} {'profiles':>8} {'seconds':>9} {'prof/s':>9} {'p50 s':>9} {'p95 s':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['stage']:<10} {r['mode']:<11} {r['profiles']:>8} {r['seconds']:>9.3f} "
+            f"{r['profiles_per_second']:>9.2f} {r['p50_seconds']:>9.4f} {r['p95_seconds']:>9.4f}"
+        )
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="linkedin_bench_")
+    results: List[Dict] = []
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+
+    with FixtureServer(max(args.sizes), delay=args.page_delay) as server:
+        try:
+            configure_environment(workdir, server.base_url, args)
+            install_fake_llm(args.llm_latency)
+
+            for count in args.sizes:
+                profiles_file = os.path.join(workdir, f"profiles_{count}.jsonl")
+                with quiet:
+                    if args.skip_scrape:
+                        write_synthetic_profiles(profiles_file, server.base_url, count)
+                        scrape = None
+                    else:
+                        scrape = bench_scrape(server, count, profiles_file)
+                        results.append(scrape)
+
+                    for mode in args.modes:
+                        results_file = os.path.join(workdir, f"results_{count}_{mode}.jsonl")
+                        analysis = asyncio.run(bench_analysis(profiles_file, mode, results_file))
+                        results.append(analysis)
+                        if scrape:
+                            # The separate entry points run scraping and analysis as consecutive stages
+                            elapsed = scrape["seconds"] + analysis["seconds"]
+                            results.append(_report("pipeline", mode, analysis["profiles"], elapsed, {}))
+                    if not args.skip_scrape:
+                        # src/pipeline.py: scraping and analysis overlap
+                        results.append(asyncio.run(bench_streaming_pipeline(server, count)))
+                print(f"✅ Finished {count} profiles", file=sys.stderr)
+        finally:
+            if not args.skip_scrape:
+                from linkedin_agent.browser.selenium_manager import SeleniumManager
+                SeleniumManager.close()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark the per-step cost of the analysis workflow as the run grows.
+
+Runs the real sequential workflow graph, checkpointed to SQLite as in
+analyze_profiles.py, over n in-memory profiles with an instant fake chat
+model and reports the mean time per graph step. Profiles are analyzed
+ANALYSIS_CHUNK_SIZE at a time, so each step only copies and checkpoints the
+current chunk's results and its time stays flat as n grows. The
+single-chunk column loads the whole input as one chunk, as the workflow did
+before in-memory input was chunked, and grows with n. It is only run up to
+SINGLE_CHUNK_MAX profiles: its checkpoints grow quadratically and reach tens
+of gigabytes at 10000.
+
+Usage:
+    python benchmarks/bench_workflow_state.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+SIZES = (100, 1000, 10000)
+SINGLE_CHUNK_MAX = 1000
+
+# Designations cycling through the fake model's message, connection and skip decisions
+_DESIGNATIONS = ("Head of Engineering", "Engineering Manager", "Student")
+
+def _make_profile(i: int) -> dict:
+    designation = _DESIGNATIONS[i % len(_DESIGNATIONS)]
+    return {
+        "profile_url": f"https://www.linkedin.com/in/profile-{i}/",
+        "name": f"Person {i}",
+        "headline": f"{designation} at Company {i % 50}",
+        "company": f"Company {i % 50}",
+        "designation": designation
+    }
+
+def configure_environment(workdir: str):
+    """Keep rate limits, the response cache and the review queue out of the measurement."""
+    os.environ.update({
+        "LLM_REQUESTS_PER_MINUTE": "1000000000",
+        "LLM_TOKENS_PER_MINUTE": "1000000000000",
+        "LLM_CACHE_ENABLED": "false",
+        "REVIEW_MODE": "queue",
+        "REVIEW_QUEUE_PATH": os.path.join(workdir, "review_queue.sqlite"),
+        "METRICS_DIR": os.path.join(workdir, "metrics")
+    })
+
+async def bench_steps(n: int, chunk_size: int, workdir: str) -> float:
+    """Mean seconds per analysis graph step over ``n`` profiles loaded ``chunk_size`` at a time."""
+    from linkedin_agent.config.settings import WORKFLOW_RECURSION_LIMIT
+    from linkedin_agent.workflow import nodes
+    from linkedin_agent.workflow.checkpoint import open_checkpointer, new_thread_id
+    from linkedin_agent.workflow.graph import create_workflow
+
+    nodes.ANALYSIS_CHUNK_SIZE = chunk_size
+    initial_state = {
+        "profiles_data": [_make_profile(i) for i in range(n)],
+        "current_profile_index": 0,
+        "analysis_results": [],
+        "analysis_index": {},
+        "action_taken": "",
+        "error": "",
+        "current_profile": None,
+        "message_to_send": ""
+    }
+    config = {
+        "recursion_limit": max(WORKFLOW_RECURSION_LIMIT, 4 * n),
+        "configurable": {"thread_id": new_thread_id()}
+    }
+
+    steps = 0
+    elapsed = 0.0
+    checkpoint_path = os.path.join(workdir, f"checkpoints_{n}_{chunk_size}.sqlite")
+    async with open_checkpointer(checkpoint_path) as checkpointer:
+        app = create_workflow("sequential", checkpointer=checkpointer, prefilter=False)
+        last = time.perf_counter()
+        async for event in app.astream(initial_state, config):
+            now = time.perf_counter()
+            # The final summary is a single LLM call over the results, not a per-profile step
+            if "summarize" not in event:
+                steps += 1
+                elapsed += now - last
+            last = time.perf_counter()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(checkpoint_path + suffix):
+            os.remove(checkpoint_path + suffix)
+    return elapsed / max(steps, 1)
+
+async def run(out, workdir: str):
+    from fake_llm import FakeChatModel
+    from linkedin_agent.config.settings import ANALYSIS_CHUNK_SIZE
+    from linkedin_agent.workflow.analysis import set_llm
+
+    set_llm(FakeChatModel(latency=0))
+    print(f"{'profiles':>10} {'chunked (us/step)':>20} {'single chunk (us/step)':>24}", file=out, flush=True)
+    for n in SIZES:
+        chunked = await bench_steps(n, ANALYSIS_CHUNK_SIZE, workdir)
+        single = f"{await bench_steps(n, n, workdir) * 1e6:.1f}" if n <= SINGLE_CHUNK_MAX else "-"
+        print(f"{n:>10} {chunked * 1e6:>20.1f} {single:>24}", file=out, flush=True)
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        configure_environment(workdir)
+        # The workflow nodes print every step, which would drown the table
+        out = sys.stdout
+        with open(os.devnull, "w") as devnull:
+            sys.stdout = devnull
+            try:
+                asyncio.run(run(out, workdir))
+            finally:
+                sys.stdout = out
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Deterministic stand-in for the Gemini chat model used by offline benchmarks.
+
+Answers the single-profile, batched and summary prompts in their expected
+formats after a configurable delay, so the workflow runs end to end without
+network access or API quota. Streamed responses spread the delay evenly over
+their chunks, like a model generating tokens at a steady rate.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+# Designation keywords mapped to the action the fake model always picks
+_ACTION_RULES = (
+    (("chief", "officer", "head", "founder", "director"), "send_message"),
+    (("manager", "engineer", "lead"), "send_connection"),
+)
+
+# Characters per streamed chunk
+STREAM_CHUNK_SIZE = 16
+
+
+def decide(designation: str) -> Dict[str, str]:
+    """Deterministic analysis of a profile based on its designation."""
+    lowered = (designation or "").lower()
+    for keywords, action in _ACTION_RULES:
+        if any(keyword in lowered for keyword in keywords):
+            return {
+                "action": action,
+                "reason": f"{designation} matches the target audience",
+                "message": f"Hi, I came across your work as {designation} and would like to connect."
+            }
+    return {"action": "skip", "reason": f"{designation or 'Unknown role'} is outside the target audience", "message": ""}
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model returning rule-based answers after ``latency`` seconds.
+    """
+
+    latency: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-benchmark-chat"
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        self.calls += 1
+
+        if "Profiles (JSON):" in prompt:
+            payload = prompt.split("Profiles (JSON):", 1)[1].split("Based on this information", 1)[0]
+            profiles = json.loads(payload.strip())
+            content = json.dumps([
+                {"profile_url": profile.get("profile_url", ""), **decide(profile.get("designation", ""))}
+                for profile in profiles
+            ])
+        elif "Partial Summaries:" in prompt:
+            parts = len(re.findall(r"^\s*Part \d+:", prompt, re.MULTILINE))
+            content = f"Merged {parts} partial summaries with the benchmark model."
+        elif "Analysis Results" in prompt:
+            total = re.search(r"Total Profiles: (\d+)", prompt)
+            content = f"Analyzed {total.group(1) if total else 'the'} profiles with the benchmark model."
+        else:
+            designation = re.search(r"Designation: (.*)", prompt)
+            analysis = decide(designation.group(1).strip() if designation else "")
+            content = f"ACTION: {analysis['action']}\nREASON: {analysis['reason']}\nMESSAGE: {analysis['message']}"
+
+        input_tokens = len(prompt) // 4
+        output_tokens = len(content) // 4
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        message = self._respond(messages).generations[0].message
+        content = message.content
+        pieces = [content[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(content), STREAM_CHUNK_SIZE)] or [""]
+        for index, piece in enumerate(pieces):
+            if self.latency:
+                await asyncio.sleep(self.latency / len(pieces))
+            last = index == len(pieces) - 1
+            yield ChatGenerationChunk(message=AIMessageChunk(
+                content=piece,
+                usage_metadata=message.usage_metadata if last else None
+            ))
@@ -0,0 +1,168 @@
+"""
+Local HTTP server serving synthetic LinkedIn-like search and profile pages.
+
+The markup matches the selectors in ``SELECTORS`` so the real scraping code
+runs unchanged against it. A configurable per-request delay simulates page
+load latency.
+"""
+
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+RESULTS_PER_PAGE = 10
+
+_HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>Home</title></head>
+<body>
+<form action="/search/results/people/" method="get">
+  <input name="keywords" placeholder="Search" autocomplete="off">
+</form>
+</body></html>
+"""
+
+_PROFILE_PAGE = """<!DOCTYPE html>
+<html><head><title>{name}</title></head>
+<body>
+<div id="profile-content">
+  <div>
+    <div></div>
+    <div>
+      <div>
+        <div>
+          <main>
+            <section>
+              <h1 class="QODXqhgbehVMqqndqByrWzsHbvNlvxMyoZc">{name}</h1>
+              <div class="text-body-medium break-words">{headline}</div>
+            </section>
+            <section></section>
+            <section></section>
+            <section>
+              <div></div>
+              <div></div>
+              <div>
+                <ul>
+                  <li>
+                    <div>
+                      <div></div>
+                      <div>
+                        <div>
+                          <a href="#">
+                            <div><div><div><div><span>{designation}</span></div></div></div></div>
+                            <span><span>{company}</span></span>
+                          </a>
+                        </div>
+                      </div>
+                    </div>
+                  </li>
+                </ul>
+              </div>
+            </section>
+          </main>
+        </div>
+      </div>
+    </div>
+  </div>
+</div>
+</body></html>
+"""
+
+_DESIGNATIONS = ["Chief Technology Officer", "Software Engineer", "Head of Sales", "Product Manager", "Student"]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli"]
+
+
+def profile_fields(index: int) -> dict:
+    """Deterministic synthetic fields of profile number ``index``."""
+    designation = _DESIGNATIONS[index % len(_DESIGNATIONS)]
+    company = _COMPANIES[(index // len(_DESIGNATIONS)) % len(_COMPANIES)]
+    return {
+        "name": f"Person {index}",
+        "headline": f"{designation} at {company}",
+        "designation": designation,
+        "company": company
+    }
+
+
+def search_page(total_profiles: int, page: int) -> str:
+    """Results page ``page`` (1-based) of a search returning ``total_profiles`` members."""
+    start = (page - 1) * RESULTS_PER_PAGE
+    indices = range(start, min(start + RESULTS_PER_PAGE, total_profiles))
+    links = "\n".join(
+        f'<li><a href="/in/profile-{i}/?miniProfileUrn=urn%3Ali%3A{i}">Person {i}</a></li>'
+        for i in indices
+    )
+    return f"<!DOCTYPE html><html><head><title>Search</title></head><body><ul>{links}</ul></body></html>"
+
+
+def profile_page(index: int) -> str:
+    """Profile page of profile number ``index``."""
+    fields = {key: html.escape(value) for key, value in profile_fields(index).items()}
+    return _PROFILE_PAGE.format(**fields)
+
+
+class FixtureServer:
+    """
+    Serves the synthetic site on 127.0.0.1 from a background thread.
+    """
+
+    def __init__(self, total_profiles: int = 100, delay: float = 0.0, port: int = 0):
+        self.total_profiles = total_profiles
+        self.delay = delay
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                parts = [part for part in parsed.path.split("/") if part]
+                if server.delay:
+                    time.sleep(server.delay)
+
+                if not parts:
+                    body = _HOME_PAGE
+                elif parts[:3] == ["search", "results", "people"]:
+                    page = int(parse_qs(parsed.query).get("page", ["1"])[0])
+                    body = search_page(server.total_profiles, page)
+                elif len(parts) >= 2 and parts[0] == "in" and parts[1].startswith("profile-"):
+                    body = profile_page(int(parts[1].split("-", 1)[1]))
+                else:
+                    self.send_error(404)
+                    return
+
+                encoded = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server, usable as ``LINKEDIN_BASE_URL``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureServer":
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
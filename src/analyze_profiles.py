@@ -1,56 +1,221 @@
 """
 Entry point for LinkedIn profile analysis workflow.
-Processes profiles from JSON file using LangGraph workflow.
+Streams profiles from the profile store (or JSONL file) through the LangGraph workflow.
 """
 
+import os
 import json
 import asyncio
-from linkedin_agent.workflow.graph import create_analysis_workflow
-from linkedin_agent.workflow.states import ProfileAnalysisState
-from linkedin_agent.config.settings import OUTPUT_FILE
+import argparse
+from contextlib import nullcontext
+from typing import Optional
+from linkedin_agent.workflow.graph import create_workflow
+from linkedin_agent.workflow.states import ProfileAnalysisState, new_results
+from linkedin_agent.workflow.cache import get_response_cache
+from linkedin_agent.workflow.checkpoint import (
+    open_checkpointer,
+    new_thread_id,
+    save_last_thread_id,
+    load_last_thread_id
+)
+from linkedin_agent.storage.jsonl import JsonlWriter
+from linkedin_agent.storage.profile_store import get_profile_store
+from linkedin_agent.monitoring.metrics import METRICS
+from linkedin_agent.config.settings import (
+    OUTPUT_FILE,
+    ANALYSIS_OUTPUT_FILE,
+    ANALYSIS_FAILURES_FILE,
+    WORKFLOW_RECURSION_LIMIT,
+    PROFILE_STORAGE,
+    PROFILE_STORE_PATH
+)
 
-async def analyze_profiles():
-    """Run the profile analysis workflow on scraped profiles."""
+# Where scraped profiles are read from
+PROFILES_SOURCE = PROFILE_STORE_PATH if PROFILE_STORAGE == "sqlite" else OUTPUT_FILE
+
+def _retry_source(thread_id: str) -> str:
+    """File the failed profiles are moved to while run ``thread_id`` retries them."""
+    stem, ext = os.path.splitext(ANALYSIS_FAILURES_FILE)
+    return f"{stem}.{thread_id}{ext}"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze scraped LinkedIn profiles.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its last completed step"
+    )
+    parser.add_argument(
+        "--thread-id",
+        help="Run id to start or resume (defaults to a new id, or the last run with --resume)"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help=f"Only analyze the profiles whose analysis failed in earlier runs ({ANALYSIS_FAILURES_FILE}, JSONL storage only)"
+    )
+    parser.add_argument("--company", help="Only analyze profiles at this company (profile store only)")
+    parser.add_argument("--designation", help="Only analyze profiles with this designation (profile store only)")
+    return parser.parse_args()
+
+async def analyze_profiles(
+    resume: bool = False,
+    thread_id: Optional[str] = None,
+    retry_failed: bool = False,
+    company: Optional[str] = None,
+    designation: Optional[str] = None
+):
+    """
+    Run the profile analysis workflow on scraped profiles.
+    
+    With the profile store, only profiles not analyzed yet are read, and each
+    result is recorded back on its profile; profiles whose analysis fails stay
+    pending for the next run. From JSONL they are appended to
+    ANALYSIS_FAILURES_FILE instead, and ``retry_failed`` analyzes only those.
+    
+    Args:
+        resume (bool): Continue the run identified by ``thread_id`` (or the last run)
+        thread_id (Optional[str]): Checkpoint thread id of the run
+        retry_failed (bool): Analyze the profiles in ANALYSIS_FAILURES_FILE instead of all profiles
+        company (Optional[str]): Only analyze profiles at this company
+        designation (Optional[str]): Only analyze profiles with this designation
+    """
     try:
-        # Load profiles from JSON
-        print(f"\n📂 Loading profiles from {OUTPUT_FILE}...")
-        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-            profiles_data = json.load(f)
-
-        if not profiles_data:
-            print("❌ No profiles found in JSON file.")
-            return
-
-        print(f"✅ Loaded {len(profiles_data)} profiles.")
-
-        # Initialize workflow state
-        initial_state: ProfileAnalysisState = {
-            "profiles_data": profiles_data,
-            "current_profile_index": 0,
-            "analysis_results": [],
-            "action_taken": "",
-            "error": "",
-            "current_profile": None,
-            "message_to_send": ""
+        if resume:
+            thread_id = thread_id or load_last_thread_id()
+            if not thread_id:
+                print("❌ No previous run found to resume.")
+                return
+        else:
+            if not os.path.exists(PROFILES_SOURCE):
+                raise FileNotFoundError(PROFILES_SOURCE)
+            thread_id = thread_id or new_thread_id()
+        store = get_profile_store() if PROFILE_STORAGE == "sqlite" else None
+
+        source = PROFILES_SOURCE
+        if retry_failed and not resume:
+            if store:
+                print("ℹ️ Failed profiles stay pending in the profile store; a normal run retries them.")
+            elif not os.path.exists(ANALYSIS_FAILURES_FILE) or not os.path.getsize(ANALYSIS_FAILURES_FILE):
+                print("✅ No failed analyses to retry.")
+                return
+            else:
+                # Moved aside so profiles failing again are recorded afresh
+                source = _retry_source(thread_id)
+                os.replace(ANALYSIS_FAILURES_FILE, source)
+        save_last_thread_id(thread_id)
+
+        # Initialize workflow state; profiles are streamed from the file chunk by chunk
+        initial_state: Optional[ProfileAnalysisState] = None
+        if not resume:
+            print(f"\n📂 Streaming profiles from {source}...")
+            profiles_filter = {
+                key: value for key, value in (("company", company), ("designation", designation)) if value
+            }
+            initial_state = {
+                "profiles_data": [],
+                "profiles_source": source,
+                "profiles_filter": profiles_filter,
+                "profiles_offset": 0,
+                "profiles_exhausted": False,
+                "current_profile_index": 0,
+                "analysis_results": [],
+                "analysis_index": {},
+                # The summary reads this run's results back from where they are appended
+                "results_source": ANALYSIS_OUTPUT_FILE,
+                "results_offset": os.path.getsize(ANALYSIS_OUTPUT_FILE) if os.path.exists(ANALYSIS_OUTPUT_FILE) else 0,
+                "failed_profiles": [],
+                "analysis_failures": 0,
+                "action_taken": "",
+                "error": "",
+                "current_profile": None,
+                "message_to_send": ""
+            }
+
+        # Each profile takes up to two graph steps, far more than the default limit of 25
+        config = {
+            "recursion_limit": WORKFLOW_RECURSION_LIMIT,
+            "configurable": {"thread_id": thread_id}
         }
 
-        # Create and run workflow
-        app = create_analysis_workflow()
-        print("\n🔄 Starting profile analysis workflow...")
+        async with open_checkpointer() as checkpointer:
+            # Create and run workflow
+            app = create_workflow(checkpointer=checkpointer)
+
+            # Results of the current chunk already written; the checkpointed chunk's on resume
+            written = 0
+            if resume:
+                snapshot = await app.aget_state(config)
+                if not snapshot.values:
+                    print(f"❌ No checkpoint found for run {thread_id}.")
+                    return
+                if not snapshot.next:
+                    print(f"✅ Run {thread_id} has already completed.")
+                    return
+                written = len(snapshot.values.get("analysis_results") or [])
+                print(f"\n⏩ Resuming run {thread_id} from its last checkpoint...")
+            else:
+                print(f"\n🔄 Starting profile analysis workflow (run {thread_id})...")
+
+            analyzed = 0
+            # Failed profiles stay pending in the store; from JSONL they are kept for --retry-failed
+            failures_file = nullcontext() if store else JsonlWriter(ANALYSIS_FAILURES_FILE)
+            with JsonlWriter(ANALYSIS_OUTPUT_FILE) as writer, failures_file as failures_writer:
+                # A None input continues from the last checkpoint of the thread
+                async for event in app.astream(initial_state, config):
+                    # Each event maps the node that just ran to its state update
+                    update = next(iter(event.values())) or {}
+                    if update.get("error"):
+                        print(f"❌ Error: {update['error']}")
+                        break
+                    results, written = new_results(update, written)
+                    for result in results:
+                        writer.write(result)
+                        analyzed += 1
+                    if store and results:
+                        store.record_analyses(results)
+                    if failures_writer:
+                        for profile in update.get("failed_profiles") or []:
+                            failures_writer.write(profile)
 
-        async for state in app.astream(initial_state):
-            if state.get("error"):
-                print(f"❌ Error: {state['error']}")
-                break
+            # Counted over the whole run, including steps before a resume
+            final_state = await app.aget_state(config)
+            failed = final_state.values.get("analysis_failures", 0)
+            retried = final_state.values.get("profiles_source")
+            if not final_state.next and retried == _retry_source(thread_id) and os.path.exists(retried):
+                os.remove(retried)
 
-        print("\n✅ Profile analysis completed.")
+        print(f"\n✅ Profile analysis completed. {analyzed} results saved to {ANALYSIS_OUTPUT_FILE}.")
+        if failed:
+            where = "stay pending in the profile store" if store else f"were saved to {ANALYSIS_FAILURES_FILE}"
+            retry = "python src/analyze_profiles.py" if store else "python src/analyze_profiles.py --retry-failed"
+            print(f"⚠️ {failed} profiles failed analysis and {where}; retry them with: {retry}")
+
+        cache = get_response_cache()
+        if cache:
+            stats = cache.stats()
+            print(f"📦 LLM cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
 
     except FileNotFoundError:
-        print(f"❌ Error: {OUTPUT_FILE} not found. Please run the scraper first.")
+        print(f"❌ Error: {PROFILES_SOURCE} not found. Please run the scraper first.")
     except json.JSONDecodeError:
-        print(f"❌ Error: Invalid JSON in {OUTPUT_FILE}")
+        print(f"❌ Error: Invalid JSON in {PROFILES_SOURCE}")
     except Exception as e:
         print(f"❌ An unexpected error occurred: {e}")
+    finally:
+        json_path, prom_path = METRICS.write_reports("analysis")
+        print(f"📊 Metrics written to {json_path} and {prom_path}")
 
 if __name__ == "__main__":
-    asyncio.run(analyze_profiles()) 
\ No newline at end of file
+    args = parse_args()
+    try:
+        asyncio.run(analyze_profiles(
+            resume=args.resume,
+            thread_id=args.thread_id,
+            retry_failed=args.retry_failed,
+            company=args.company,
+            designation=args.designation
+        ))
+    except KeyboardInterrupt:
+        print("\n⏸️ Interrupted. Continue later with: python src/analyze_profiles.py --resume")
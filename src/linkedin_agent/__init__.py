@@ -1,10 +1,35 @@
 """
 LinkedIn Lead Generation Agent package.
 Provides tools and workflows for automated LinkedIn lead generation.
+
+Public names are imported on first access, so scrape-only entry points do
+not pay for loading LangGraph and the LLM client.
 """
 
-from .workflow.graph import create_workflow
-from .models.types import LinkedInAutomationState
-from .browser.selenium_manager import SeleniumManager
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'create_workflow': '.workflow.graph',
+    'LinkedInAutomationState': '.models.types',
+    'SeleniumManager': '.browser.selenium_manager'
+}
+
+if TYPE_CHECKING:
+    from .workflow.graph import create_workflow
+    from .models.types import LinkedInAutomationState
+    from .browser.selenium_manager import SeleniumManager
+
+__all__ = ['create_workflow', 'LinkedInAutomationState', 'SeleniumManager']
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
 
-__all__ = ['create_workflow', 'LinkedInAutomationState', 'SeleniumManager'] 
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,216 @@
+"""
+Managed headless Chrome processes with warm-up and memory-based recycling.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from typing import List, Optional
+
+import psutil
+from selenium import webdriver
+
+from ..config.settings import (
+    CHROME_BINARY,
+    CHROME_HEADLESS,
+    CHROME_PROFILE_DIR,
+    CHROME_PROFILE_TEMPLATE,
+    CHROME_STARTUP_TIMEOUT,
+    CHROME_WARMUP_URL,
+    CHROME_RECYCLE_PAGES,
+    CHROME_MAX_RSS_MB,
+    CHROME_RSS_CHECK_PAGES
+)
+from ..monitoring.metrics import METRICS
+from ..scheduling.rate_scheduler import SCHEDULER
+
+# Files Chrome uses to lock a profile to the running process; never copied from a template
+_PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ManagedChrome:
+    """
+    One Chrome process with remote debugging on a free local port.
+
+    The user-data dir persists across restarts, so cookies and the login
+    session survive recycling.
+    """
+
+    def __init__(self, profile_dir: str):
+        self.profile_dir = profile_dir
+        self.port: Optional[int] = None
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def endpoint(self) -> str:
+        """Debugger address in ``host:port`` form."""
+        return f"127.0.0.1:{self.port}"
+
+    def start(self):
+        """Launch Chrome and wait until its debug endpoint answers."""
+        if not os.path.exists(self.profile_dir) and CHROME_PROFILE_TEMPLATE:
+            shutil.copytree(
+                CHROME_PROFILE_TEMPLATE,
+                self.profile_dir,
+                ignore=shutil.ignore_patterns(*_PROFILE_LOCK_FILES)
+            )
+        os.makedirs(self.profile_dir, exist_ok=True)
+
+        self.port = _free_port()
+        args = [
+            CHROME_BINARY,
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={os.path.abspath(self.profile_dir)}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "about:blank"
+        ]
+        if CHROME_HEADLESS:
+            args.insert(1, "--headless=new")
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            # Chrome refuses to run as root with its sandbox, e.g. in Docker
+            args.insert(1, "--no-sandbox")
+
+        self.process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + CHROME_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                urllib.request.urlopen(f"http://{self.endpoint}/json/version", timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"Chrome did not open its debug port within {CHROME_STARTUP_TIMEOUT}s")
+
+    def rss_mb(self) -> float:
+        """Resident memory of the browser and all its child processes, in MB."""
+        if self.process is None:
+            return 0.0
+        try:
+            root = psutil.Process(self.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return 0.0
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.NoSuchProcess:
+                continue
+        return total / (1024 * 1024)
+
+    def stop(self):
+        """Terminate the browser, killing it if it does not exit promptly."""
+        if self.process is None:
+            return
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        finally:
+            self.process = None
+
+
+class ChromeFleet:
+    """
+    Launches and recycles managed Chrome instances.
+
+    Each instance gets its own persistent profile dir under ``profile_root``.
+    ``DriverPool`` reports pages served per instance and asks the fleet
+    whether to recycle it after ``CHROME_RECYCLE_PAGES`` pages or once its
+    memory exceeds ``CHROME_MAX_RSS_MB``.
+    """
+
+    def __init__(self, profile_root: str = CHROME_PROFILE_DIR):
+        self.profile_root = profile_root
+        self._browsers: List[ManagedChrome] = []
+        self._lock = threading.Lock()
+
+    def add(self) -> int:
+        """
+        Launch another browser.
+        
+        Returns:
+            int: Index of the browser in the fleet
+        """
+        with self._lock:
+            index = len(self._browsers)
+            browser = ManagedChrome(os.path.join(self.profile_root, f"browser-{index}"))
+            self._browsers.append(browser)
+        with METRICS.timer("browser_launch"):
+            browser.start()
+        print(f"🚀 Launched managed Chrome {index} on {browser.endpoint}")
+        return index
+
+    def endpoint(self, index: int) -> str:
+        """Debugger address of browser ``index``."""
+        return self._browsers[index].endpoint
+
+    def warm_up(self, driver: webdriver.Chrome):
+        """Load ``CHROME_WARMUP_URL`` once so DNS, TLS and the HTTP cache are primed."""
+        if not CHROME_WARMUP_URL:
+            return
+        try:
+            SCHEDULER.acquire_page_load()
+            with METRICS.timer("browser_warmup"):
+                driver.get(CHROME_WARMUP_URL)
+        except Exception as e:
+            print(f"⚠️ Browser warm-up failed: {e}")
+
+    def needs_recycle(self, index: int, pages: int) -> bool:
+        """
+        Whether browser ``index`` should be restarted.
+        
+        Args:
+            index (int): Browser index
+            pages (int): Pages served since the browser was (re)started
+            
+        Returns:
+            bool: True past the page limit or the memory ceiling
+        """
+        if CHROME_RECYCLE_PAGES and pages >= CHROME_RECYCLE_PAGES:
+            METRICS.incr("browser_recycles", reason="pages")
+            return True
+        if CHROME_MAX_RSS_MB and pages % max(CHROME_RSS_CHECK_PAGES, 1) == 0:
+            rss = self._browsers[index].rss_mb()
+            if rss > CHROME_MAX_RSS_MB:
+                METRICS.incr("browser_recycles", reason="memory")
+                print(f"♻️ Chrome {index} uses {rss:.0f} MB (limit {CHROME_MAX_RSS_MB:.0f} MB)")
+                return True
+        return False
+
+    def recycle(self, index: int) -> str:
+        """
+        Restart browser ``index`` with the same profile dir.
+        
+        Returns:
+            str: The new debugger address
+        """
+        browser = self._browsers[index]
+        with METRICS.timer("browser_recycle"):
+            browser.stop()
+            browser.start()
+        print(f"♻️ Restarted managed Chrome {index} on {browser.endpoint}")
+        return browser.endpoint
+
+    def close(self):
+        """Stop every browser."""
+        with self._lock:
+            for browser in self._browsers:
+                browser.stop()
+            self._browsers = []
@@ -0,0 +1,253 @@
+"""
+Pool of Selenium WebDriver sessions for concurrent LinkedIn automation.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Union
+
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from ..config.settings import (
+    PAGE_LOAD_WAIT,
+    DRIVER_ACQUIRE_TIMEOUT,
+    CHROME_RECYCLE_ATTEMPTS,
+    CHROME_RECYCLE_RETRY_DELAY
+)
+
+if TYPE_CHECKING:
+    from .chrome_fleet import ChromeFleet
+
+
+class DriverPoolError(RuntimeError):
+    """
+    Raised when no driver session can be checked out of the pool.
+    """
+
+
+class PooledDriver:
+    """
+    A WebDriver session bound to its own tab of an attached Chrome instance.
+    """
+
+    def __init__(self, driver: webdriver.Chrome, endpoint: str, browser: int = 0):
+        self.driver = driver
+        self.wait = WebDriverWait(driver, PAGE_LOAD_WAIT)
+        self.endpoint = endpoint
+        self.browser = browser
+        self.window_handle = driver.current_window_handle
+
+    def quit(self):
+        """Close the pooled tab and end the WebDriver session."""
+        try:
+            self.driver.close()
+        except Exception:
+            pass
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"Error closing pooled WebDriver ({self.endpoint}): {e}")
+
+
+class DriverPool:
+    """
+    Manages a fixed set of WebDriver sessions that workers check out and return.
+
+    Each Chrome debug endpoint contributes ``tabs_per_browser`` sessions, and each
+    session drives its own tab so workers never interfere with one another.
+
+    With a ``fleet`` of managed browsers, every returned session counts as one
+    page served by its browser. Once the fleet asks for a browser to be
+    recycled, its sessions are held back as they come in; when all of them
+    are back the browser is restarted and fresh sessions join the pool, while
+    the other browsers keep serving. A browser that cannot be restarted after
+    ``CHROME_RECYCLE_ATTEMPTS`` tries is dropped; once every browser is gone,
+    or the pool is closed, waiting workers are woken with a ``DriverPoolError``.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        tabs_per_browser: int = 1,
+        fleet: Optional["ChromeFleet"] = None,
+        browser_ids: Optional[List[int]] = None
+    ):
+        if not endpoints:
+            raise ValueError("DriverPool requires at least one Chrome debug endpoint.")
+        if tabs_per_browser < 1:
+            raise ValueError("tabs_per_browser must be at least 1.")
+
+        self._endpoints = list(endpoints)
+        self._tabs_per_browser = tabs_per_browser
+        self._fleet = fleet
+        self._browser_ids = list(browser_ids) if browser_ids is not None else list(range(len(endpoints)))
+        # Holds a DriverPoolError instead of a session once the pool cannot serve any more
+        self._available: "queue.Queue[Union[PooledDriver, DriverPoolError]]" = queue.Queue()
+        self._drivers: List[PooledDriver] = []
+        self._pages: List[int] = [0] * len(self._endpoints)
+        self._draining: Dict[int, List[PooledDriver]] = {}
+        self._dropped: Set[int] = set()
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def size(self) -> int:
+        """Number of driver sessions managed by the pool."""
+        return len(self._endpoints) * self._tabs_per_browser
+
+    def _open_sessions(self, browser: int) -> List[PooledDriver]:
+        """Attach to a browser and open one tab per pooled session."""
+        # Imported here to avoid a circular import with selenium_manager
+        from .selenium_manager import SeleniumManager
+
+        endpoint = self._endpoints[browser]
+        sessions = []
+        try:
+            for _ in range(self._tabs_per_browser):
+                driver = SeleniumManager.create_driver(endpoint)
+                try:
+                    driver.switch_to.new_window('tab')
+                except Exception:
+                    driver.quit()
+                    raise
+                sessions.append(PooledDriver(driver, endpoint, browser))
+                SeleniumManager.prepare_tab(driver)
+            if self._fleet is not None:
+                self._fleet.warm_up(sessions[0].driver)
+        except Exception:
+            for pooled in sessions:
+                pooled.quit()
+            raise
+        return sessions
+
+    def start(self):
+        """Attach to every endpoint and open one tab per pooled session."""
+        with self._lock:
+            if self._started:
+                return
+            print(f"Initializing driver pool ({self.size} sessions)...")
+            try:
+                for browser in range(len(self._endpoints)):
+                    for pooled in self._open_sessions(browser):
+                        self._drivers.append(pooled)
+                        self._available.put(pooled)
+            except Exception as e:
+                print(f"Error initializing driver pool: {e}")
+                self._close_all()
+                raise
+            self._started = True
+            print("Driver pool initialized successfully.")
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Check out a driver session, blocking until one is free.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, defaults to ``DRIVER_ACQUIRE_TIMEOUT``
+
+        Returns:
+            PooledDriver: The checked-out driver session
+
+        Raises:
+            DriverPoolError: If no session became free in time, or the pool cannot serve any more
+        """
+        if not self._started:
+            self.start()
+        timeout = DRIVER_ACQUIRE_TIMEOUT if timeout is None else timeout
+        try:
+            pooled = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise DriverPoolError(f"No driver session became free within {timeout:g}s") from None
+        if isinstance(pooled, DriverPoolError):
+            # Passed on so that every other waiter is woken too
+            self._available.put(pooled)
+            raise pooled
+        return pooled
+
+    def release(self, pooled: PooledDriver):
+        """Return a checked-out driver session to the pool."""
+        if self._fleet is None:
+            self._available.put(pooled)
+            return
+
+        browser = pooled.browser
+        with self._lock:
+            self._pages[browser] += 1
+            if browser not in self._draining and self._fleet.needs_recycle(
+                self._browser_ids[browser], self._pages[browser]
+            ):
+                self._draining[browser] = []
+            if browser not in self._draining:
+                self._available.put(pooled)
+                return
+            # Held back until every tab of the browser is idle
+            drained = self._draining[browser]
+            drained.append(pooled)
+            if len(drained) < self._tabs_per_browser:
+                return
+            del self._draining[browser]
+
+        self._recycle(browser, drained)
+
+    def _recycle(self, browser: int, sessions: List[PooledDriver]):
+        """
+        Restart a fully drained managed browser and pool fresh sessions for it.
+
+        Failed restarts are retried; a browser that still cannot be restarted
+        is dropped so the pool keeps serving from the remaining browsers.
+        """
+        for pooled in sessions:
+            pooled.quit()
+
+        fresh: List[PooledDriver] = []
+        for attempt in range(1, CHROME_RECYCLE_ATTEMPTS + 1):
+            try:
+                self._endpoints[browser] = self._fleet.recycle(self._browser_ids[browser])
+                fresh = self._open_sessions(browser)
+                break
+            except Exception as e:
+                print(f"❌ Restart {attempt}/{CHROME_RECYCLE_ATTEMPTS} of pooled Chrome {browser} failed: {e}")
+                if attempt < CHROME_RECYCLE_ATTEMPTS:
+                    time.sleep(CHROME_RECYCLE_RETRY_DELAY)
+
+        with self._lock:
+            self._pages[browser] = 0
+            self._drivers = [d for d in self._drivers if d.browser != browser] + fresh
+            if not fresh:
+                self._dropped.add(browser)
+                print(f"❌ Dropped pooled Chrome {browser}, {len(self._endpoints) - len(self._dropped)} browsers left")
+                if len(self._dropped) == len(self._endpoints):
+                    self._available.put(DriverPoolError("Every pooled browser failed to restart"))
+        for pooled in fresh:
+            self._available.put(pooled)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[PooledDriver]:
+        """Context manager that checks out a driver session and always returns it."""
+        pooled = self.acquire(timeout=timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def close(self):
+        """Close every pooled session."""
+        with self._lock:
+            if self._drivers:
+                print("Closing driver pool...")
+            self._close_all()
+            self._started = False
+
+    def _close_all(self):
+        for pooled in self._drivers:
+            pooled.quit()
+        self._drivers = []
+        self._draining = {}
+        self._dropped = set()
+        self._pages = [0] * len(self._endpoints)
+        # Wake workers still waiting on the old queue
+        self._available.put(DriverPoolError("Driver pool closed"))
+        self._available = queue.Queue()
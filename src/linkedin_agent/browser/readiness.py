@@ -0,0 +1,167 @@
+"""
+Event-driven page readiness detection with adaptive timeouts.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from ..monitoring.metrics import METRICS
+from ..config.settings import (
+    READINESS_HISTORY,
+    READINESS_PERCENTILE,
+    READINESS_MARGIN,
+    READINESS_MIN_TIMEOUT,
+    READINESS_MAX_TIMEOUT,
+    READINESS_POLL_INTERVAL,
+    NETWORK_IDLE_MS
+)
+
+# Number of resources the page has requested so far, per the Resource Timing API
+_RESOURCE_COUNT_SCRIPT = "return performance.getEntriesByType('resource').length;"
+
+
+class LatencyHistogram:
+    """
+    Rolling window of recent load latencies.
+    """
+
+    def __init__(self, size: int = READINESS_HISTORY):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        """Add a latency sample in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Get a percentile of the recorded samples.
+        
+        Args:
+            pct (float): Percentile in the range 0-100
+            
+        Returns:
+            Optional[float]: The percentile in seconds, or None without samples
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, max(0, int(round(pct / 100 * len(samples))) - 1))
+        return samples[rank]
+
+
+class PageReadiness:
+    """
+    Waits for concrete readiness signals instead of fixed sleeps.
+
+    A page counts as ready once ``document.readyState`` is ``complete``, the
+    optional root element is present and, if requested, the network has been
+    idle for ``NETWORK_IDLE_MS``. Timeouts adapt per page kind from a rolling
+    latency histogram of previous loads.
+    """
+
+    def __init__(
+        self,
+        percentile: float = READINESS_PERCENTILE,
+        margin: float = READINESS_MARGIN,
+        min_timeout: float = READINESS_MIN_TIMEOUT,
+        max_timeout: float = READINESS_MAX_TIMEOUT
+    ):
+        self.percentile = percentile
+        self.margin = margin
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, kind: str) -> LatencyHistogram:
+        """Get the latency histogram for a page kind, creating it on first use."""
+        with self._lock:
+            if kind not in self._histograms:
+                self._histograms[kind] = LatencyHistogram()
+            return self._histograms[kind]
+
+    def timeout_for(self, kind: str) -> float:
+        """
+        Compute the adaptive timeout for a page kind.
+        
+        Without history the maximum timeout is used; afterwards the timeout is
+        the configured percentile of recent loads times a safety margin.
+        
+        Args:
+            kind (str): Page kind, e.g. ``"search"`` or ``"profile"``
+            
+        Returns:
+            float: Timeout in seconds
+        """
+        observed = self.histogram(kind).percentile(self.percentile)
+        if observed is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, observed * self.margin))
+
+    def wait_until_ready(
+        self,
+        driver: webdriver.Chrome,
+        kind: str,
+        locator: Optional[Tuple[str, str]] = None,
+        network_idle: bool = False
+    ) -> bool:
+        """
+        Block until the current page is ready or the adaptive timeout expires.
+        
+        Args:
+            driver (webdriver.Chrome): Driver showing the page
+            kind (str): Page kind used to select the latency histogram
+            locator (Optional[Tuple[str, str]]): Element that must be present
+            network_idle (bool): Also wait for network quiescence
+            
+        Returns:
+            bool: True if the page became ready, False on timeout
+        """
+        timeout = self.timeout_for(kind)
+        idle = {"count": -1, "since": 0.0}
+
+        def _is_ready(drv: webdriver.Chrome) -> bool:
+            if drv.execute_script("return document.readyState") != "complete":
+                return False
+            if locator is not None and not drv.find_elements(*locator):
+                return False
+            if network_idle:
+                count = drv.execute_script(_RESOURCE_COUNT_SCRIPT)
+                now = time.monotonic()
+                if count != idle["count"]:
+                    idle["count"], idle["since"] = count, now
+                    return False
+                return (now - idle["since"]) * 1000 >= NETWORK_IDLE_MS
+            return True
+
+        start = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=READINESS_POLL_INTERVAL).until(_is_ready)
+        except TimeoutException:
+            # Record the timeout so the next wait on a slow site gets more headroom
+            self.histogram(kind).record(timeout)
+            METRICS.observe("readiness_wait", timeout, page=kind)
+            METRICS.incr("readiness_timeouts", page=kind)
+            print(f"⏳ {kind} page not ready after {timeout:.1f}s, continuing.")
+            return False
+
+        elapsed = time.monotonic() - start
+        self.histogram(kind).record(elapsed)
+        METRICS.observe("readiness_wait", elapsed, page=kind)
+        return True
+
+
+# Shared readiness tracker for all drivers in this process
+PAGE_READINESS = PageReadiness()
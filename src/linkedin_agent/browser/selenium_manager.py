@@ -10,9 +10,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from ..config.settings import (
     CHROME_HOST,
     CHROME_DEBUG_PORT,
+    CHROME_DEBUG_PORTS,
     CHROME_DRIVER_PATH,
-    PAGE_LOAD_WAIT
+    PAGE_LOAD_WAIT,
+    TABS_PER_BROWSER,
+    BLOCK_RESOURCES,
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_URL_PATTERNS,
+    CHROME_MODE,
+    CHROME_MANAGED_BROWSERS
 )
+from .chrome_fleet import ChromeFleet
+from .driver_pool import DriverPool
+from .resource_blocking import apply_resource_blocking, blocked_url_patterns
 
 class SeleniumManager:
     """
@@ -21,6 +31,39 @@ class SeleniumManager:
     _instance = None
     _driver = None
     _wait = None
+    _pool = None
+    _fleet = None
+
+    @classmethod
+    def create_driver(cls, debugger_address: str) -> webdriver.Chrome:
+        """
+        Attach a new WebDriver session to a Chrome debug endpoint.
+        
+        Args:
+            debugger_address (str): Chrome debug address in ``host:port`` form
+            
+        Returns:
+            webdriver.Chrome: The attached Chrome WebDriver instance
+        """
+        options = webdriver.ChromeOptions()
+        options.debugger_address = debugger_address
+        service = Service(CHROME_DRIVER_PATH)
+        return webdriver.Chrome(service=service, options=options)
+
+    @classmethod
+    def prepare_tab(cls, driver: webdriver.Chrome):
+        """
+        Apply per-tab settings to the driver's current tab.
+        
+        With ``BLOCK_RESOURCES`` on, images, media, fonts and trackers (per
+        ``BLOCKED_RESOURCE_TYPES`` and ``BLOCKED_URL_PATTERNS``) are blocked
+        through Chrome DevTools so profile pages load only what is scraped.
+        
+        Args:
+            driver (webdriver.Chrome): Driver whose current tab is configured
+        """
+        if BLOCK_RESOURCES:
+            apply_resource_blocking(driver, blocked_url_patterns(BLOCKED_RESOURCE_TYPES, BLOCKED_URL_PATTERNS))
 
     @classmethod
     def get_driver(cls) -> webdriver.Chrome:
@@ -33,12 +76,14 @@ class SeleniumManager:
         if cls._driver is None:
             try:
                 print("Initializing Chrome WebDriver...")
-                options = webdriver.ChromeOptions()
-                options.debugger_address = f"{CHROME_HOST}:{CHROME_DEBUG_PORT}"
-                
-                service = Service(CHROME_DRIVER_PATH)
-                
-                cls._driver = webdriver.Chrome(service=service, options=options)
+                if CHROME_MODE == "managed":
+                    fleet = cls.get_fleet()
+                    cls._driver = cls.create_driver(fleet.endpoint(fleet.add()))
+                    cls.prepare_tab(cls._driver)
+                    fleet.warm_up(cls._driver)
+                else:
+                    cls._driver = cls.create_driver(f"{CHROME_HOST}:{CHROME_DEBUG_PORT}")
+                    cls.prepare_tab(cls._driver)
                 cls._wait = WebDriverWait(cls._driver, PAGE_LOAD_WAIT)
                 print("Chrome WebDriver initialized successfully.")
             except Exception as e:
@@ -59,9 +104,58 @@ class SeleniumManager:
             cls.get_driver()  # This will initialize both driver and wait
         return cls._wait
 
+    @classmethod
+    def get_pool(cls) -> DriverPool:
+        """
+        Get or create the shared driver pool.
+        
+        The pool attaches to every port in ``CHROME_DEBUG_PORTS`` and opens
+        ``TABS_PER_BROWSER`` tabs per browser, one WebDriver session per tab.
+        
+        Returns:
+            DriverPool: The shared driver pool
+        """
+        if cls._pool is None:
+            if CHROME_MODE == "managed":
+                fleet = cls.get_fleet()
+                browser_ids = [fleet.add() for _ in range(max(CHROME_MANAGED_BROWSERS, 1))]
+                cls._pool = DriverPool(
+                    [fleet.endpoint(browser) for browser in browser_ids],
+                    tabs_per_browser=TABS_PER_BROWSER,
+                    fleet=fleet,
+                    browser_ids=browser_ids
+                )
+            else:
+                endpoints = [
+                    port if ":" in port else f"{CHROME_HOST}:{port}"
+                    for port in CHROME_DEBUG_PORTS
+                ]
+                cls._pool = DriverPool(endpoints, tabs_per_browser=TABS_PER_BROWSER)
+        return cls._pool
+
+    @classmethod
+    def get_fleet(cls) -> ChromeFleet:
+        """
+        Get or create the fleet of managed Chrome processes.
+        
+        Used when ``CHROME_MODE`` is ``"managed"``: the shared driver and each
+        pooled browser run in their own headless Chrome, and pooled browsers
+        are recycled after ``CHROME_RECYCLE_PAGES`` pages or above
+        ``CHROME_MAX_RSS_MB``.
+        
+        Returns:
+            ChromeFleet: The shared fleet
+        """
+        if cls._fleet is None:
+            cls._fleet = ChromeFleet()
+        return cls._fleet
+
     @classmethod
     def close(cls):
         """Close the WebDriver instance and clean up resources."""
+        if cls._pool is not None:
+            cls._pool.close()
+            cls._pool = None
         if cls._driver:
             print("Closing Chrome WebDriver...")
             try:
@@ -71,4 +165,7 @@ class SeleniumManager:
             finally:
                 cls._driver = None
                 cls._wait = None
-                print("Chrome WebDriver closed.") 
\ No newline at end of file
+                print("Chrome WebDriver closed.")
+        if cls._fleet is not None:
+            cls._fleet.close()
+            cls._fleet = None 
\ No newline at end of file
@@ -14,28 +14,144 @@ ENV_PATH = os.path.join(PROJECT_ROOT, '.env-dev')
 # Load the .env-dev file
 load_dotenv(dotenv_path=ENV_PATH)
 
-# Get API key with debug logging
+# Only required once an LLM client is created, so scrape-only runs work without it
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
-    raise ValueError(f"GEMINI_API_KEY not found in environment. Please check {ENV_PATH}")
 
 # LLM Configuration
 LLM_MODEL = "gemini-1.5-flash"  # Default model for Gemini Pro
 LLM_TEMPERATURE = 0.7     # Default temperature for more creative responses
 LLM_MAX_TOKENS = 1000    # Maximum tokens for LLM responses
+# Stream single-profile analyses and cancel them once a skip and its reason have arrived
+LLM_STREAMING = os.getenv("LLM_STREAMING", "false").lower() == "true"
+
+# Analysis Configuration
+# "sequential": one profile per graph step; "parallel": all profiles analyzed concurrently;
+# "batch": ANALYSIS_BATCH_SIZE profiles per LLM request, batches sent concurrently
+ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "sequential")
+ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", "5"))  # Max in-flight LLM requests
+ANALYSIS_BATCH_SIZE = int(os.getenv("ANALYSIS_BATCH_SIZE", "10"))  # Profiles per batched request
+LLM_BATCH_MAX_TOKENS = 8192  # Maximum tokens for batched LLM responses
+# "queue": decisions go to the persistent review queue; "inline": prompt for approval during the run
+REVIEW_MODE = os.getenv("REVIEW_MODE", "queue")
+REVIEW_QUEUE_PATH = os.getenv("REVIEW_QUEUE_PATH", "review_queue.sqlite")
+CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", "workflow_checkpoints.sqlite")  # Durable workflow checkpoints
+WORKFLOW_RECURSION_LIMIT = int(os.getenv("WORKFLOW_RECURSION_LIMIT", "100000"))  # Max graph steps per run
+# Runs larger than SUMMARY_CHUNK_SIZE results are summarized in chunks whose summaries are then merged
+SUMMARY_CHUNK_SIZE = int(os.getenv("SUMMARY_CHUNK_SIZE", "100"))  # Results per summary request
+SUMMARY_MERGE_FANIN = int(os.getenv("SUMMARY_MERGE_FANIN", "10"))  # Partial summaries per merge request
+SUMMARY_TOP_N = 5  # Companies and designations listed in the summary statistics
+
+# Pre-filter Configuration
+# Profiles are scored locally against the ideal customer profile before analysis;
+# those without data or below the threshold are skipped without an LLM call
+PREFILTER_ENABLED = os.getenv("PREFILTER_ENABLED", "true").lower() == "true"
+ICP_KEYWORDS = [
+    keyword.strip()
+    for keyword in os.getenv("ICP_KEYWORDS", "").split(",")
+    if keyword.strip()
+]  # e.g. "founder,cto,head of engineering,saas"; empty = only skip profiles without data
+PREFILTER_THRESHOLD = float(os.getenv("PREFILTER_THRESHOLD", "0.5"))  # Minimum share of one keyword's words found
+
+# LLM Response Cache Configuration
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite")
+LLM_CACHE_TTL = 7 * 24 * 60 * 60  # seconds, 0 = never expire
+LLM_CACHE_MAX_ENTRIES = 50000  # Least recently used entries are evicted beyond this
+
+# LinkedIn Configuration
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
 
 # Chrome Configuration
 CHROME_HOST = "127.0.0.1"
-CHROME_DEBUG_PORT = "9222"
+CHROME_DEBUG_PORT = os.getenv("CHROME_DEBUG_PORT", "9222")
 CHROME_DRIVER_PATH = os.getenv(
     "CHROME_DRIVER_PATH",
     # "C:\Users\AISpr\Downloads\chromedriver-win64\chromedriver-win64\chromedriver.exe"
 )
 
+# Driver Pool Configuration
+CHROME_DEBUG_PORTS = [
+    port.strip()
+    for port in os.getenv("CHROME_DEBUG_PORTS", CHROME_DEBUG_PORT).split(",")
+    if port.strip()
+]  # One attached Chrome instance per port
+TABS_PER_BROWSER = int(os.getenv("TABS_PER_BROWSER", "1"))  # Pooled tabs per Chrome instance
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "0"))  # 0 = one worker per pooled tab
+DRIVER_ACQUIRE_TIMEOUT = float(os.getenv("DRIVER_ACQUIRE_TIMEOUT", "600"))  # seconds a worker waits for a free tab
+
+# Managed Chrome Configuration
+# "attach": use Chrome instances started by hand on CHROME_DEBUG_PORTS;
+# "managed": launch headless Chrome processes on free ports and recycle them
+CHROME_MODE = os.getenv("CHROME_MODE", "attach")
+CHROME_BINARY = os.getenv("CHROME_BINARY", "google-chrome")
+CHROME_HEADLESS = os.getenv("CHROME_HEADLESS", "true").lower() == "true"
+CHROME_MANAGED_BROWSERS = int(os.getenv("CHROME_MANAGED_BROWSERS", "1"))  # Pool browsers in managed mode
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", "chrome_profiles")  # One persistent user-data dir per browser
+CHROME_PROFILE_TEMPLATE = os.getenv("CHROME_PROFILE_TEMPLATE")  # Logged-in profile copied into new profile dirs
+CHROME_STARTUP_TIMEOUT = 20  # seconds
+CHROME_WARMUP_URL = os.getenv("CHROME_WARMUP_URL", f"{LINKEDIN_BASE_URL}/")  # Empty = no warm-up
+CHROME_RECYCLE_PAGES = int(os.getenv("CHROME_RECYCLE_PAGES", "200"))  # Restart after this many pages, 0 = never
+CHROME_RECYCLE_ATTEMPTS = 3  # Restart attempts before a browser is dropped from the pool
+CHROME_RECYCLE_RETRY_DELAY = 5  # seconds between restart attempts
+CHROME_MAX_RSS_MB = float(os.getenv("CHROME_MAX_RSS_MB", "1500"))  # Restart above this memory, 0 = no ceiling
+CHROME_RSS_CHECK_PAGES = 10  # Pages between memory checks
+
+# Resource Blocking Configuration
+# Blocks requests the scraper never reads via Chrome DevTools Network.setBlockedURLs
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "false").lower() == "true"
+BLOCKED_RESOURCE_TYPES = [
+    resource_type.strip()
+    for resource_type in os.getenv("BLOCKED_RESOURCE_TYPES", "image,media,font,tracker").split(",")
+    if resource_type.strip()
+]  # Any of: image, media, font, stylesheet, tracker
+BLOCKED_URL_PATTERNS = [
+    pattern.strip()
+    for pattern in os.getenv("BLOCKED_URL_PATTERNS", "").split(",")
+    if pattern.strip()
+]  # Extra wildcard URL patterns, e.g. "*.licdn.com/sc/h/*"
+
 # Timing Configuration
 PAGE_LOAD_WAIT = 10  # seconds
-PROFILE_LOAD_DELAY = 3  # seconds
-SEARCH_LOAD_DELAY = 3  # seconds
+
+# Rate Scheduler Configuration
+LINKEDIN_PAGES_PER_MINUTE = float(os.getenv("LINKEDIN_PAGES_PER_MINUTE", "20"))
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "15"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "1000000"))
+RATE_BURST_SECONDS = 5  # Bucket capacity, in seconds' worth of the rate
+RATE_BACKOFF_FACTOR = 0.5  # Rate multiplier applied on each throttling signal
+RATE_MIN_FACTOR = 0.1  # Lowest fraction of the configured rate after backoff
+RATE_RECOVERY_STEP = 0.05  # Rate fraction regained per successful call
+RATE_COOLDOWN_SECONDS = 30  # Pause after a throttling signal without Retry-After
+LLM_MAX_RETRIES = 5  # Retries of a throttled LLM call
+
+# Page Readiness Configuration
+READINESS_HISTORY = 50  # Recent loads kept per page kind
+READINESS_PERCENTILE = 95  # Percentile of recent loads used as the timeout basis
+READINESS_MARGIN = 1.5  # Multiplier applied to the observed percentile
+READINESS_MIN_TIMEOUT = 1  # seconds
+READINESS_MAX_TIMEOUT = PAGE_LOAD_WAIT  # seconds, also used until history exists
+READINESS_POLL_INTERVAL = 0.1  # seconds
+READINESS_NETWORK_IDLE = os.getenv("READINESS_NETWORK_IDLE", "false").lower() == "true"
+NETWORK_IDLE_MS = 500  # No new network requests for this long counts as idle
+
+# Search Crawl Configuration
+SEARCH_MAX_PAGES = int(os.getenv("SEARCH_MAX_PAGES", "10"))  # Results pages walked per query
+CRAWL_QUEUE_SIZE = 50  # Profile URLs buffered between the search producer and extractors
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "50"))  # Scraped profiles buffered before analysis in src/pipeline.py
+
+# Seen Profile Index Configuration
+SEEN_INDEX_PATH = os.getenv("SEEN_INDEX_PATH", "seen_profiles.sqlite")
+PROFILE_FRESHNESS_DAYS = float(os.getenv("PROFILE_FRESHNESS_DAYS", "30"))  # Profiles scraped more recently are skipped
+BLOOM_FILTER_CAPACITY = 1000000  # Expected number of indexed profiles
+BLOOM_FILTER_ERROR_RATE = 0.01  # False positive rate at capacity
+
+# Extraction Configuration
+# "wait": one explicit wait per field; "script": all fields in one execute_script call;
+# "offline": capture page_source and parse it with lxml outside the browser
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "wait")
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", "0"))  # 0 = one parser process per CPU
+ARCHIVE_PAGE_SOURCE = os.getenv("ARCHIVE_PAGE_SOURCE", "false").lower() == "true"
+HTML_ARCHIVE_DIR = os.getenv("HTML_ARCHIVE_DIR", "html_archive")
 
 # LinkedIn Selectors
 SELECTORS = {
@@ -47,6 +163,10 @@ SELECTORS = {
         "type": "xpath",
         "value": '//a[contains(@href, "/in/")]'
     },
+    "profile_root": {
+        "type": "css",
+        "value": "#profile-content"
+    },
     "name": {
         "type": "class",
         "value": "QODXqhgbehVMqqndqByrWzsHbvNlvxMyoZc"
@@ -65,5 +185,24 @@ SELECTORS = {
     }
 }
 
+# Metrics Configuration
+METRICS_DIR = os.getenv("METRICS_DIR", "metrics")  # End-of-run JSON and Prometheus reports
+METRICS_SAMPLE_SIZE = 10000  # Recent samples kept per timing for percentiles
+
 # Output Configuration
-OUTPUT_FILE = "linkedin_profiles.json" 
\ No newline at end of file
+# "sqlite": scraped profiles and analysis results live in the indexed PROFILE_STORE_PATH;
+# "jsonl": profiles are appended to OUTPUT_FILE and analysis streams from it
+PROFILE_STORAGE = os.getenv("PROFILE_STORAGE", "sqlite")
+PROFILE_STORE_PATH = os.getenv("PROFILE_STORE_PATH", "profiles.sqlite")
+OUTPUT_FILE = os.getenv("OUTPUT_FILE", "linkedin_profiles.jsonl")  # JSONL, one profile per line; legacy .json is still readable
+ANALYSIS_OUTPUT_FILE = os.getenv("ANALYSIS_OUTPUT_FILE", "analysis_results.jsonl")
+ANALYSIS_FAILURES_FILE = os.getenv("ANALYSIS_FAILURES_FILE", "analysis_failures.jsonl")  # JSONL storage only: profiles whose analysis failed, for --retry-failed
+ANALYSIS_CHUNK_SIZE = 100  # Profiles read into the workflow at a time 
+
+# Job Queue Configuration
+# src/worker.py scrape/analyze workers share the queue database, e.g. on a common volume
+JOB_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", "jobs.sqlite")
+JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "300"))  # seconds a leased job stays hidden
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))  # Leases per job before it fails for good
+JOB_RETRY_DELAY = float(os.getenv("JOB_RETRY_DELAY", "30"))  # seconds before the first retry, doubled per attempt
+WORKER_POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", "2"))  # seconds an idle worker waits between polls
@@ -0,0 +1,173 @@
+"""
+Per-stage timing and counter metrics with JSON and Prometheus export.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Tuple
+
+from ..config.settings import METRICS_DIR, METRICS_SAMPLE_SIZE
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+def _key(name: str, labels: Dict[str, str]) -> _Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class _Timing:
+    """Running totals of a timed stage plus a bounded window of recent samples."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=METRICS_SAMPLE_SIZE)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of stage timings and counters.
+
+    Timings are identified by a stage name plus labels (e.g. the profile
+    field), counters likewise. ``write_reports`` dumps a JSON summary and a
+    Prometheus text-format file at the end of a run.
+    """
+
+    def __init__(self):
+        self._timings: Dict[_Key, _Timing] = {}
+        self._counters: Dict[_Key, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Record the duration of one execution of a stage."""
+        key = _key(name, labels)
+        with self._lock:
+            if key not in self._timings:
+                self._timings[key] = _Timing()
+            self._timings[key].add(seconds)
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """Increment a counter."""
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Context manager recording the duration of its block as a stage timing."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        """Drop every recorded metric."""
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+
+    def summary(self) -> Dict:
+        """
+        Summarize every metric.
+        
+        Returns:
+            Dict: ``timings`` with count/total/mean/p50/p95/max seconds and
+                ``counters`` with their values, each keyed by name and labels
+        """
+        with self._lock:
+            timings = {key: (t.count, t.total, t.max, list(t.samples)) for key, t in self._timings.items()}
+            counters = dict(self._counters)
+
+        def _label(key: _Key) -> str:
+            name, labels = key
+            return name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else "")
+
+        return {
+            "timings": {
+                _label(key): {
+                    "count": count,
+                    "total_seconds": round(total, 6),
+                    "mean_seconds": round(total / count, 6) if count else 0.0,
+                    "p50_seconds": round(_percentile(samples, 50), 6),
+                    "p95_seconds": round(_percentile(samples, 95), 6),
+                    "max_seconds": round(maximum, 6)
+                }
+                for key, (count, total, maximum, samples) in sorted(timings.items())
+            },
+            "counters": {_label(key): value for key, value in sorted(counters.items())}
+        }
+
+    def to_prometheus(self, prefix: str = "linkedin_agent") -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            timings = {key: (t.count, t.total, list(t.samples)) for key, t in self._timings.items()}
+            counters = dict(self._counters)
+
+        def _labels(labels: Tuple[Tuple[str, str], ...], **extra) -> str:
+            pairs = list(labels) + [(k, str(v)) for k, v in extra.items()]
+            if not pairs:
+                return ""
+            escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for _, v in pairs)
+            return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+        lines = []
+        for name in sorted({key[0] for key in timings}):
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for (metric_name, labels), (count, total, samples) in sorted(timings.items()):
+                if metric_name != name:
+                    continue
+                for quantile in (0.5, 0.95):
+                    value = _percentile(samples, quantile * 100)
+                    lines.append(f"{metric}{_labels(labels, quantile=quantile)} {value:.6f}")
+                lines.append(f"{metric}_sum{_labels(labels)} {total:.6f}")
+                lines.append(f"{metric}_count{_labels(labels)} {count}")
+        for name in sorted({key[0] for key in counters}):
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (metric_name, labels), value in sorted(counters.items()):
+                if metric_name == name:
+                    lines.append(f"{metric}{_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def write_reports(self, run_name: str, metrics_dir: str = METRICS_DIR) -> Tuple[str, str]:
+        """
+        Write the JSON summary and Prometheus file for a run.
+        
+        Args:
+            run_name (str): Name used for the report files, e.g. ``"scrape"``
+            metrics_dir (str): Directory receiving the reports
+            
+        Returns:
+            Tuple[str, str]: Paths of the JSON and Prometheus files
+        """
+        os.makedirs(metrics_dir, exist_ok=True)
+        json_path = os.path.join(metrics_dir, f"{run_name}_metrics.json")
+        prom_path = os.path.join(metrics_dir, f"{run_name}_metrics.prom")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=4)
+        with open(prom_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        return json_path, prom_path
+
+
+# Shared registry for the whole process
+METRICS = MetricsRegistry()
@@ -0,0 +1,237 @@
+"""
+Shared token-bucket rate scheduler for LinkedIn page loads and LLM calls.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from ..config.settings import (
+    LINKEDIN_PAGES_PER_MINUTE,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+    RATE_BURST_SECONDS,
+    RATE_BACKOFF_FACTOR,
+    RATE_MIN_FACTOR,
+    RATE_RECOVERY_STEP,
+    RATE_COOLDOWN_SECONDS
+)
+
+# Bucket names used by the call sites
+LINKEDIN_PAGES = "linkedin_pages"
+LLM_REQUESTS = "llm_requests"
+LLM_TOKENS = "llm_tokens"
+
+# Configured rate per bucket, per minute
+_RATES = {
+    LINKEDIN_PAGES: LINKEDIN_PAGES_PER_MINUTE,
+    LLM_REQUESTS: LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS: LLM_TOKENS_PER_MINUTE
+}
+
+# Seconds a process waits for another process's write lock on a shared bucket
+_BUSY_TIMEOUT = 30
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive rate.
+
+    Callers reserve tokens and sleep for the returned delay, so concurrent
+    callers are queued fairly instead of polling. On a throttling signal the
+    effective rate is cut by ``RATE_BACKOFF_FACTOR`` and the bucket pauses for
+    a cooldown; each success recovers the rate by ``RATE_RECOVERY_STEP``.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, burst_seconds: float = RATE_BURST_SECONDS):
+        self.name = name
+        self.base_rate = rate_per_minute / 60.0
+        self.factor = 1.0
+        self.capacity = max(1.0, self.base_rate * burst_seconds)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._clock = time.monotonic
+
+    def _locked(self):
+        """Hold exclusive access to the bucket state."""
+        return self._lock
+
+    @property
+    def rate(self) -> float:
+        """Current effective rate in tokens per second."""
+        return self.base_rate * self.factor
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens, going into debt if necessary.
+        
+        Args:
+            tokens (float): Tokens to take from the bucket
+            
+        Returns:
+            float: Seconds the caller must wait before proceeding
+        """
+        with self._locked():
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            delay = max(0.0, -self._tokens / self.rate) if self.rate > 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def adjust(self, tokens: float):
+        """Take (positive) or give back (negative) tokens after the fact, e.g. actual vs estimated usage."""
+        with self._locked():
+            self._tokens = min(self.capacity, self._tokens - tokens)
+
+    def acquire(self, tokens: float = 1.0):
+        """Block the calling thread until the tokens are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """Wait without blocking the event loop until the tokens are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """Back off after a throttling signal from the remote side."""
+        with self._locked():
+            self.factor = max(RATE_MIN_FACTOR, self.factor * RATE_BACKOFF_FACTOR)
+            cooldown = retry_after if retry_after is not None else RATE_COOLDOWN_SECONDS
+            self._paused_until = max(self._paused_until, self._clock() + cooldown)
+        print(f"🐢 {self.name} throttled, rate reduced to {self.rate * 60:.1f}/min")
+
+    def succeeded(self):
+        """Recover the rate gradually after a successful call."""
+        with self._locked():
+            self.factor = min(1.0, self.factor + RATE_RECOVERY_STEP)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a SQLite database shared by processes.
+
+    Every process using the same database and bucket name draws from one
+    budget, so N workers together stay within the configured rate instead of
+    N times it. Each operation reads, updates and writes the bucket row in a
+    single write transaction; wall-clock time is used so that processes on
+    different hosts agree on refills and cooldowns.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, path: str, burst_seconds: float = RATE_BURST_SECONDS):
+        super().__init__(name, rate_per_minute, burst_seconds)
+        self.path = path
+        self._clock = time.time
+        self._updated = self._clock()
+        self._conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL,
+                factor REAL NOT NULL,
+                paused_until REAL NOT NULL
+            )
+            """
+        )
+        # The first process to start creates the row; later ones join its budget
+        self._conn.execute(
+            "INSERT OR IGNORE INTO rate_buckets (name, tokens, updated, factor, paused_until) VALUES (?, ?, ?, ?, 0)",
+            (name, self._tokens, self._updated, self.factor)
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._tokens, self._updated, self.factor, self._paused_until = self._conn.execute(
+                    "SELECT tokens, updated, factor, paused_until FROM rate_buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                yield
+                self._conn.execute(
+                    "UPDATE rate_buckets SET tokens = ?, updated = ?, factor = ?, paused_until = ? WHERE name = ?",
+                    (self._tokens, self._updated, self.factor, self._paused_until, self.name)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """Wait without blocking the event loop, including on another process's write lock."""
+        delay = await asyncio.to_thread(self.reserve, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class RateScheduler:
+    """
+    Central registry of the token buckets shared by every call site.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(name, rate) for name, rate in _RATES.items()
+        }
+
+    def share(self, path: str):
+        """
+        Keep the buckets in a SQLite database, so that every process sharing
+        it stays within one set of rates.
+
+        Args:
+            path (str): Database file shared by the processes, e.g. the job queue
+        """
+        self.buckets = {name: SharedTokenBucket(name, rate, path) for name, rate in _RATES.items()}
+
+    def acquire_page_load(self):
+        """Block until another LinkedIn page load is allowed."""
+        self.buckets[LINKEDIN_PAGES].acquire()
+
+    def page_throttled(self):
+        """Back off page loads after LinkedIn shows a rate-limit or security checkpoint."""
+        self.buckets[LINKEDIN_PAGES].throttled()
+
+    def page_succeeded(self):
+        """Recover the page load rate after a normal page load."""
+        self.buckets[LINKEDIN_PAGES].succeeded()
+
+    async def acquire_llm_call(self, estimated_tokens: int):
+        """Wait until an LLM request of ``estimated_tokens`` tokens is allowed."""
+        await self.buckets[LLM_REQUESTS].acquire_async()
+        await self.buckets[LLM_TOKENS].acquire_async(estimated_tokens)
+
+    def llm_throttled(self, retry_after: Optional[float] = None):
+        """Back off both LLM buckets after a 429/quota error."""
+        self.buckets[LLM_REQUESTS].throttled(retry_after)
+        self.buckets[LLM_TOKENS].throttled(retry_after)
+
+    def llm_succeeded(self, estimated_tokens: int, actual_tokens: Optional[int] = None):
+        """Recover LLM rates and correct the token bucket with actual usage."""
+        self.buckets[LLM_REQUESTS].succeeded()
+        self.buckets[LLM_TOKENS].succeeded()
+        if actual_tokens is not None:
+            self.buckets[LLM_TOKENS].adjust(actual_tokens - estimated_tokens)
+
+
+# Shared scheduler for the whole process
+SCHEDULER = RateScheduler()
@@ -0,0 +1,278 @@
+"""
+Durable SQLite job queue shared by scrape and analysis workers.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from ..config.settings import JOB_QUEUE_PATH, JOB_MAX_ATTEMPTS, JOB_VISIBILITY_TIMEOUT, JOB_RETRY_DELAY
+
+# Statuses a job moves through; "leased" jobs whose lease expired are leased again
+JOB_STATUSES = ("queued", "leased", "done", "failed")
+
+# Job kinds: a search query to page through, a profile URL to extract, a profile to analyze
+JOB_KINDS = ("search", "scrape", "analyze")
+
+# Seconds a worker process waits for another process's write lock
+_BUSY_TIMEOUT = 30
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue with leases, visibility timeouts and retries.
+
+    Any number of worker processes sharing the database file lease jobs of a
+    kind; a lease hides the job from other workers for the visibility timeout.
+    Jobs whose worker dies become visible again once the lease expires, and
+    failed jobs are retried with exponential backoff up to ``max_attempts``.
+    Every lease carries a fresh token, so only the current lease holder can
+    complete or fail a job and a result is written at most once.
+    """
+
+    def __init__(self, path: str = JOB_QUEUE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                lease_token TEXT,
+                leased_by TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                UNIQUE (kind, job_key)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (kind, status, available_at)")
+        self._conn.commit()
+
+    def enqueue(
+        self,
+        kind: str,
+        key: str,
+        payload: Dict[str, Any],
+        requeue: bool = False,
+        max_attempts: int = JOB_MAX_ATTEMPTS
+    ) -> bool:
+        """
+        Add a job unless one with the same kind and key already exists.
+
+        A job that is queued or leased is never duplicated. With ``requeue``,
+        a finished (done or failed) job is queued again with the new payload.
+
+        Args:
+            kind (str): One of ``JOB_KINDS``
+            key (str): Identity of the job within its kind, e.g. the profile URL
+            payload (Dict[str, Any]): JSON-serializable job input
+            requeue (bool): Run a finished job with the same key again
+            max_attempts (int): Leases allowed before the job fails for good
+
+        Returns:
+            bool: True if the job was added or queued again
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        now = time.time()
+        on_conflict = (
+            """
+            DO UPDATE SET payload = excluded.payload, status = 'queued', attempts = 0,
+                available_at = excluded.available_at, result = NULL, error = NULL, updated_at = excluded.updated_at
+            WHERE status IN ('done', 'failed')
+            """
+            if requeue else "DO NOTHING"
+        )
+        with self._lock:
+            cursor = self._conn.execute(
+                f"""
+                INSERT INTO jobs (kind, job_key, payload, max_attempts, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kind, job_key) {on_conflict}
+                """,
+                (kind, key, json.dumps(payload, ensure_ascii=False), max(max_attempts, 1), now, now, now)
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def lease(self, kind: str, worker: str, visibility_timeout: float = JOB_VISIBILITY_TIMEOUT) -> Optional[Dict]:
+        """
+        Lease the oldest job of a kind that is ready to run.
+
+        Args:
+            kind (str): Job kind to lease
+            worker (str): Name of the leasing worker, for inspection only
+            visibility_timeout (float): Seconds the job stays hidden from other workers
+
+        Returns:
+            Optional[Dict]: Job with id, kind, key, payload, attempts and
+                lease_token, or None if no job is ready
+        """
+        now = time.time()
+        token = uuid.uuid4().hex
+        with self._lock:
+            # Jobs whose last allowed lease expired are given up on
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = 'failed', lease_token = NULL, updated_at = ?,
+                    error = COALESCE(error, 'Lease expired')
+                WHERE kind = ? AND status = 'leased' AND lease_expires <= ? AND attempts >= max_attempts
+                """,
+                (now, kind, now)
+            )
+            # A single statement, so concurrent workers never lease the same job
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_token = ?, leased_by = ?,
+                    lease_expires = ?, updated_at = ?
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE kind = ? AND (
+                        (status = 'queued' AND available_at <= ?)
+                        OR (status = 'leased' AND lease_expires <= ?)
+                    )
+                    ORDER BY id LIMIT 1
+                )
+                """,
+                (token, worker, now + visibility_timeout, now, kind, now, now)
+            )
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT id, kind, job_key, payload, attempts, lease_token FROM jobs WHERE lease_token = ?",
+                (token,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "key": row["job_key"],
+            "payload": json.loads(row["payload"]),
+            "attempts": row["attempts"],
+            "lease_token": row["lease_token"]
+        }
+
+    def _update_leased(self, job: Dict, assignments: str, params: tuple) -> bool:
+        """Update a job only while ``job``'s lease is still the current one."""
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ? AND status = 'leased' AND lease_token = ?",
+                (*params, time.time(), job["id"], job["lease_token"])
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def extend(self, job: Dict, visibility_timeout: float = JOB_VISIBILITY_TIMEOUT) -> bool:
+        """
+        Keep a long-running job hidden for another ``visibility_timeout`` seconds.
+
+        Returns:
+            bool: False if the lease was lost and the job may run elsewhere
+        """
+        return self._update_leased(job, "lease_expires = ?", (time.time() + visibility_timeout,))
+
+    def complete(self, job: Dict, result: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Mark a leased job as done and store its result.
+
+        Args:
+            job (Dict): Job returned by ``lease``
+            result (Optional[Dict[str, Any]]): JSON-serializable job output
+
+        Returns:
+            bool: False if the lease was lost, in which case nothing is written
+        """
+        return self._update_leased(
+            job,
+            "status = 'done', result = ?, error = NULL, lease_token = NULL",
+            (json.dumps(result, ensure_ascii=False) if result is not None else None,)
+        )
+
+    def fail(self, job: Dict, error: str, retry_delay: float = JOB_RETRY_DELAY) -> Optional[str]:
+        """
+        Record a failed attempt, scheduling a retry while attempts remain.
+
+        Retries are delayed exponentially: ``retry_delay`` after the first
+        attempt, twice that after the second, and so on.
+
+        Args:
+            job (Dict): Job returned by ``lease``
+            error (str): Error description
+            retry_delay (float): Seconds before the first retry
+
+        Returns:
+            Optional[str]: The new status ("queued" or "failed"), or None if the lease was lost
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT max_attempts FROM jobs WHERE id = ?", (job["id"],)).fetchone()
+        if row is None:
+            return None
+        status = "queued" if job["attempts"] < row["max_attempts"] else "failed"
+        available_at = time.time() + retry_delay * 2 ** (job["attempts"] - 1)
+        updated = self._update_leased(
+            job,
+            "status = ?, error = ?, available_at = ?, lease_token = NULL",
+            (status, error, available_at)
+        )
+        return status if updated else None
+
+    def retry_failed(self, kind: Optional[str] = None) -> int:
+        """
+        Queue failed jobs again with a fresh attempt budget.
+
+        Args:
+            kind (Optional[str]): Only jobs of this kind
+
+        Returns:
+            int: Number of jobs queued again
+        """
+        sql = "UPDATE jobs SET status = 'queued', attempts = 0, available_at = ?, updated_at = ? WHERE status = 'failed'"
+        now = time.time()
+        params: list = [now, now]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Get the number of jobs per kind and status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, status, COUNT(*) FROM jobs GROUP BY kind, status").fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in rows:
+            counts.setdefault(kind, {})[status] = count
+        return counts
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_queue: Optional[JobQueue] = None
+
+def get_job_queue() -> JobQueue:
+    """Get the shared job queue."""
+    global _queue
+    if _queue is None:
+        _queue = JobQueue()
+    return _queue
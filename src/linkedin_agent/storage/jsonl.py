@@ -0,0 +1,108 @@
+"""
+Streaming JSONL record storage for scraped profiles and analysis results.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class JsonlWriter:
+    """
+    Appends one JSON record per line, flushing after every record.
+
+    A crash loses at most the record being written; everything before it is
+    already on disk and readable.
+    """
+
+    def __init__(self, path: str, append: bool = True, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, record: Dict):
+        """Write a record and flush it to disk."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        """Close the underlying file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_profiles(path: str, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+    """
+    Read a chunk of records starting at an offset.
+    
+    For JSONL files the offset is a byte position, so reading resumes without
+    rescanning earlier records. A trailing line without a newline (a record
+    still being written or cut off by a crash) is left unread. Legacy JSON
+    array files are supported with the offset counting records instead.
+    
+    Args:
+        path (str): JSONL (or legacy JSON array) file
+        offset (int): Position returned by the previous call, 0 to start
+        limit (Optional[int]): Maximum number of records to read
+        
+    Returns:
+        Tuple[List[Dict], int]: The records read and the offset to continue from
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        end = len(records) if limit is None else min(len(records), offset + limit)
+        return records[offset:end], end
+
+    records = []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while limit is None or len(records) < limit:
+            line = f.readline()
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                print(f"❌ Skipping malformed record at byte {offset - len(line)} of {path}")
+    return records, offset
+
+
+def iter_profiles(path: str, chunk_size: int = 1000, offset: int = 0) -> Iterator[Dict]:
+    """
+    Lazily iterate over every record of a profiles file.
+    
+    Args:
+        path (str): JSONL (or legacy JSON array) file
+        chunk_size (int): Records read per chunk
+        offset (int): Byte position of a JSONL file to start at, e.g. where a run began appending
+        
+    Yields:
+        Dict: Each record in file order
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+        return
+
+    while True:
+        records, next_offset = read_profiles(path, offset, chunk_size)
+        if next_offset == offset:
+            return
+        offset = next_offset
+        yield from records
@@ -0,0 +1,292 @@
+"""
+Indexed SQLite store of scraped profiles and their analysis results.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config.settings import PROFILE_STORE_PATH
+from ..models.types import LinkedInProfile
+from .jsonl import JsonlWriter, iter_profiles
+
+# Columns holding the scraped LinkedInProfile fields
+PROFILE_COLUMNS = ("profile_url", "name", "headline", "company", "designation")
+
+# Columns holding the analysis result of a profile
+ANALYSIS_COLUMNS = ("action", "reason", "message")
+
+# Analysis statuses of a stored profile
+ANALYSIS_STATUSES = ("pending", "analyzed")
+
+def is_profile_store(path: str) -> bool:
+    """Whether ``path`` names a profile store rather than a JSON/JSONL file."""
+    return bool(path) and path.endswith((".sqlite", ".db"))
+
+
+class ProfileStore:
+    """
+    SQLite-backed profile storage with incremental selection.
+
+    Scraped profiles are upserted by profile_url, analysis results are
+    recorded on the same rows, and the workflow selects only profiles that
+    are still pending analysis, in insertion order, a chunk at a time.
+    """
+
+    def __init__(self, path: str = PROFILE_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                profile_url TEXT NOT NULL UNIQUE,
+                name TEXT,
+                headline TEXT,
+                company TEXT,
+                designation TEXT,
+                scraped_at REAL NOT NULL,
+                analysis_status TEXT NOT NULL DEFAULT 'pending',
+                action TEXT,
+                reason TEXT,
+                message TEXT,
+                analyzed_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_company ON profiles (company COLLATE NOCASE)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_designation ON profiles (designation COLLATE NOCASE)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_status ON profiles (analysis_status, id)")
+        self._conn.commit()
+
+    def upsert_profiles(self, profiles: Iterable[LinkedInProfile]) -> int:
+        """
+        Insert scraped profiles or refresh the stored ones.
+        
+        A profile whose name, headline, company or designation changed since
+        it was analyzed goes back to pending analysis.
+        
+        Args:
+            profiles (Iterable[LinkedInProfile]): Scraped profiles
+            
+        Returns:
+            int: Number of profiles written
+        """
+        now = time.time()
+        rows = [
+            tuple(profile.get(column) for column in PROFILE_COLUMNS) + (now,)
+            for profile in profiles
+            if profile.get("profile_url")
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO profiles (profile_url, name, headline, company, designation, scraped_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (profile_url) DO UPDATE SET
+                    analysis_status = CASE
+                        WHEN profiles.name IS excluded.name
+                            AND profiles.headline IS excluded.headline
+                            AND profiles.company IS excluded.company
+                            AND profiles.designation IS excluded.designation
+                        THEN profiles.analysis_status
+                        ELSE 'pending'
+                    END,
+                    name = excluded.name,
+                    headline = excluded.headline,
+                    company = excluded.company,
+                    designation = excluded.designation,
+                    scraped_at = excluded.scraped_at
+                """,
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def upsert_profile(self, profile: LinkedInProfile) -> int:
+        """Insert or refresh a single scraped profile."""
+        return self.upsert_profiles([profile])
+
+    def record_analyses(self, results: Iterable[Dict]) -> int:
+        """
+        Store analysis results and mark their profiles as analyzed.
+        
+        Results for profiles not in the store yet are inserted with their
+        profile fields.
+        
+        Args:
+            results (Iterable[Dict]): Profiles merged with action, reason and message
+            
+        Returns:
+            int: Number of results written
+        """
+        now = time.time()
+        rows = [
+            tuple(result.get(column) for column in PROFILE_COLUMNS)
+            + tuple(result.get(column, "") for column in ANALYSIS_COLUMNS)
+            + (now, now)
+            for result in results
+            if result.get("profile_url")
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO profiles
+                    (profile_url, name, headline, company, designation,
+                     action, reason, message, scraped_at, analyzed_at, analysis_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'analyzed')
+                ON CONFLICT (profile_url) DO UPDATE SET
+                    action = excluded.action,
+                    reason = excluded.reason,
+                    message = excluded.message,
+                    analyzed_at = excluded.analyzed_at,
+                    analysis_status = 'analyzed'
+                """,
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def record_analysis(self, result: Dict) -> int:
+        """Store a single analysis result."""
+        return self.record_analyses([result])
+
+    def _where(
+        self,
+        status: Optional[str],
+        company: Optional[str],
+        designation: Optional[str],
+        after_id: int
+    ) -> Tuple[str, list]:
+        clauses, params = ["id > ?"], [after_id]
+        if status:
+            clauses.append("analysis_status = ?")
+            params.append(status)
+        if company:
+            clauses.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if designation:
+            clauses.append("designation = ? COLLATE NOCASE")
+            params.append(designation)
+        return " WHERE " + " AND ".join(clauses), params
+
+    def select(
+        self,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        designation: Optional[str] = None,
+        after_id: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Select stored rows matching the filters, in insertion order.
+        
+        Args:
+            status (Optional[str]): Analysis status, None for any
+            company (Optional[str]): Company name, case-insensitive
+            designation (Optional[str]): Designation, case-insensitive
+            after_id (int): Only rows with a larger id, for keyset pagination
+            limit (Optional[int]): Maximum number of rows
+            
+        Returns:
+            List[Dict]: Matching rows with their id, profile and analysis columns
+        """
+        where, params = self._where(status, company, designation, after_id)
+        sql = f"SELECT * FROM profiles{where} ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def read_unanalyzed(
+        self,
+        after_id: int = 0,
+        limit: Optional[int] = None,
+        company: Optional[str] = None,
+        designation: Optional[str] = None
+    ) -> Tuple[List[LinkedInProfile], int]:
+        """
+        Read the next chunk of profiles pending analysis.
+        
+        Args:
+            after_id (int): Id returned by the previous call, 0 to start
+            limit (Optional[int]): Maximum number of profiles
+            company (Optional[str]): Only profiles at this company
+            designation (Optional[str]): Only profiles with this designation
+            
+        Returns:
+            Tuple[List[LinkedInProfile], int]: The profiles and the id to continue after
+        """
+        rows = self.select("pending", company, designation, after_id, limit)
+        profiles = [{column: row[column] or "" for column in PROFILE_COLUMNS} for row in rows]
+        return profiles, rows[-1]["id"] if rows else after_id
+
+    def import_file(self, path: str) -> int:
+        """Upsert every profile of a JSONL (or legacy JSON) file."""
+        count, batch = 0, []
+        for profile in iter_profiles(path):
+            batch.append(profile)
+            if len(batch) >= 1000:
+                count += self.upsert_profiles(batch)
+                batch = []
+        return count + self.upsert_profiles(batch)
+
+    def export(self, path: str, status: Optional[str] = None, include_analysis: bool = False, **filters) -> int:
+        """
+        Export stored profiles to a JSON array (``.json``) or JSONL file.
+        
+        Args:
+            path (str): Output file; a ``.json`` suffix selects a JSON array
+            status (Optional[str]): Only profiles with this analysis status
+            include_analysis (bool): Also export action, reason and message
+            **filters: ``company`` and/or ``designation`` filters
+            
+        Returns:
+            int: Number of exported profiles
+        """
+        columns = PROFILE_COLUMNS + (ANALYSIS_COLUMNS if include_analysis else ())
+        records = (
+            {column: row[column] or "" for column in columns}
+            for row in self.select(status, filters.get("company"), filters.get("designation"))
+        )
+        if path.endswith(".json"):
+            records = list(records)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=4, ensure_ascii=False)
+            return len(records)
+        count = 0
+        with JsonlWriter(path, append=False) as writer:
+            for record in records:
+                writer.write(record)
+                count += 1
+        return count
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of profiles per analysis status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT analysis_status, COUNT(*) FROM profiles GROUP BY analysis_status"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, ProfileStore] = {}
+_stores_lock = threading.Lock()
+
+def get_profile_store(path: str = PROFILE_STORE_PATH) -> ProfileStore:
+    """Get the shared profile store for ``path``."""
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = ProfileStore(path)
+        return _stores[path]
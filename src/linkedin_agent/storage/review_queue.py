@@ -0,0 +1,194 @@
+"""
+Persistent queue of outreach decisions awaiting human review.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from ..config.settings import REVIEW_QUEUE_PATH
+
+# Review statuses an item can move to from "pending"
+REVIEW_DECISIONS = ("approved", "rejected", "skipped")
+
+
+class ReviewQueue:
+    """
+    SQLite-backed queue decoupling LLM analysis from human review.
+
+    The workflow enqueues send_message/send_connection decisions and moves on;
+    operators approve or reject them later, one by one or in batches.
+    """
+
+    def __init__(self, path: str = REVIEW_QUEUE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS review_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                profile_url TEXT NOT NULL UNIQUE,
+                name TEXT,
+                headline TEXT,
+                company TEXT,
+                designation TEXT,
+                action TEXT NOT NULL,
+                reason TEXT,
+                message TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at REAL NOT NULL,
+                reviewed_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_review_status ON review_items (status)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_review_company ON review_items (company COLLATE NOCASE)")
+        self._conn.commit()
+
+    def enqueue(self, result: Dict) -> bool:
+        """
+        Add an analysis result for review.
+        
+        A profile that is still pending gets its decision refreshed; a profile
+        that was already reviewed is left alone.
+        
+        Args:
+            result (Dict): Analysis result with profile fields, action, reason and message
+            
+        Returns:
+            bool: True if the item is pending review after the call
+        """
+        profile_url = result.get("profile_url") or result.get("name", "")
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO review_items
+                    (profile_url, name, headline, company, designation, action, reason, message, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (profile_url) DO UPDATE SET
+                    action = excluded.action,
+                    reason = excluded.reason,
+                    message = excluded.message
+                WHERE review_items.status = 'pending'
+                """,
+                (
+                    profile_url,
+                    result.get("name"),
+                    result.get("headline"),
+                    result.get("company"),
+                    result.get("designation"),
+                    result["action"],
+                    result.get("reason", ""),
+                    result.get("message", ""),
+                    time.time()
+                )
+            )
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT status FROM review_items WHERE profile_url = ?", (profile_url,)
+            ).fetchone()
+        return row is not None and row["status"] == "pending"
+
+    def _where(
+        self,
+        status: Optional[str],
+        company: Optional[str],
+        action: Optional[str],
+        ids: Optional[Sequence[int]]
+    ) -> tuple:
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if company:
+            clauses.append("company = ? COLLATE NOCASE")
+            params.append(company)
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if ids:
+            clauses.append(f"id IN ({', '.join('?' for _ in ids)})")
+            params.extend(ids)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def list_items(
+        self,
+        status: Optional[str] = "pending",
+        company: Optional[str] = None,
+        action: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        List review items matching the filters, oldest first.
+        
+        Args:
+            status (Optional[str]): Item status, None for any
+            company (Optional[str]): Company name, case-insensitive
+            action (Optional[str]): Proposed action
+            limit (Optional[int]): Maximum number of items
+            
+        Returns:
+            List[Dict]: Matching review items
+        """
+        where, params = self._where(status, company, action, None)
+        sql = f"SELECT * FROM review_items{where} ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def decide(
+        self,
+        decision: str,
+        company: Optional[str] = None,
+        action: Optional[str] = None,
+        ids: Optional[Sequence[int]] = None
+    ) -> int:
+        """
+        Record a decision for every pending item matching the filters.
+        
+        Args:
+            decision (str): One of ``REVIEW_DECISIONS``
+            company (Optional[str]): Only items for this company, case-insensitive
+            action (Optional[str]): Only items proposing this action
+            ids (Optional[Sequence[int]]): Only these item ids
+            
+        Returns:
+            int: Number of items updated
+        """
+        if decision not in REVIEW_DECISIONS:
+            raise ValueError(f"Unknown review decision: {decision}")
+        where, params = self._where("pending", company, action, ids)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE review_items SET status = ?, reviewed_at = ?{where}",
+                [decision, time.time(), *params]
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of items per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM review_items GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_queue: Optional[ReviewQueue] = None
+
+def get_review_queue() -> ReviewQueue:
+    """Get the shared review queue."""
+    global _queue
+    if _queue is None:
+        _queue = ReviewQueue()
+    return _queue
@@ -0,0 +1,136 @@
+"""
+Persistent index of already scraped profiles with freshness tracking.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from ..config.settings import (
+    SEEN_INDEX_PATH,
+    PROFILE_FRESHNESS_DAYS,
+    BLOOM_FILTER_CAPACITY,
+    BLOOM_FILTER_ERROR_RATE
+)
+
+# Seconds a process waits for another process's write lock
+_BUSY_TIMEOUT = 30
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter for fast "definitely not seen" checks.
+    """
+
+    def __init__(self, capacity: int = BLOOM_FILTER_CAPACITY, error_rate: float = BLOOM_FILTER_ERROR_RATE):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: two 64-bit halves of one digest generate every position
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str):
+        """Add an item to the filter."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class SeenProfileIndex:
+    """
+    SQLite-backed record of when each canonical profile URL was last scraped.
+
+    A Bloom filter built at startup answers most "never seen" checks without
+    touching the database; only possible hits are confirmed in SQLite. The
+    filter only knows the profiles this process has seen, so when several
+    processes share the database, ``bloom=False`` checks SQLite every time.
+    """
+
+    def __init__(self, path: str = SEEN_INDEX_PATH, freshness_days: float = PROFILE_FRESHNESS_DAYS, bloom: bool = True):
+        self.path = path
+        self.ttl = freshness_days * 24 * 60 * 60
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_profiles (
+                profile_url TEXT PRIMARY KEY,
+                last_scraped REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        self._bloom: Optional[BloomFilter] = None
+        if bloom:
+            self._bloom = BloomFilter()
+            for (profile_url,) in self._conn.execute("SELECT profile_url FROM seen_profiles"):
+                self._bloom.add(profile_url)
+
+    def last_scraped(self, profile_url: str) -> Optional[float]:
+        """
+        Get when a profile was last scraped.
+        
+        Args:
+            profile_url (str): Canonical profile URL
+            
+        Returns:
+            Optional[float]: Unix timestamp, or None if never scraped
+        """
+        with self._lock:
+            if self._bloom is not None and profile_url not in self._bloom:
+                return None
+            row = self._conn.execute(
+                "SELECT last_scraped FROM seen_profiles WHERE profile_url = ?", (profile_url,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, profile_url: str) -> bool:
+        """Whether a profile was scraped within the freshness window."""
+        scraped_at = self.last_scraped(profile_url)
+        return scraped_at is not None and time.time() - scraped_at < self.ttl
+
+    def filter_stale(self, profile_urls: Iterable[str]) -> List[str]:
+        """
+        Keep only profiles that were never scraped or whose data is stale.
+        
+        Args:
+            profile_urls (Iterable[str]): Canonical profile URLs
+            
+        Returns:
+            List[str]: URLs that should be (re)scraped, in input order
+        """
+        return [url for url in profile_urls if not self.is_fresh(url)]
+
+    def mark_scraped(self, profile_url: str, scraped_at: Optional[float] = None):
+        """
+        Record that a profile has just been scraped.
+        
+        Args:
+            profile_url (str): Canonical profile URL
+            scraped_at (Optional[float]): Unix timestamp, defaults to now
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seen_profiles (profile_url, last_scraped) VALUES (?, ?)",
+                (profile_url, scraped_at or time.time())
+            )
+            self._conn.commit()
+            if self._bloom is not None:
+                self._bloom.add(profile_url)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
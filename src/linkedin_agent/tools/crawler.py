@@ -0,0 +1,178 @@
+"""
+Pipelined search crawler that overlaps result paging with profile extraction.
+"""
+
+import queue
+import threading
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from ..browser.selenium_manager import SeleniumManager
+from ..config.settings import SEARCH_MAX_PAGES, CRAWL_QUEUE_SIZE, SCRAPE_CONCURRENCY, EXTRACTION_MODE
+from ..models.types import LinkedInProfile
+from .html_parser import ProfileParserPool
+from .linkedin_tools import (
+    iter_search_result_pages,
+    extract_pooled_profile,
+    capture_pooled_profile,
+    finish_parsed_profile
+)
+
+# Tells an extraction worker that the URL producer has finished
+_DONE = object()
+
+def _extract_produced(
+    produce: Callable[[Callable[[str], None]], None],
+    on_profile: Optional[Callable[[LinkedInProfile], None]],
+    max_workers: Optional[int],
+    queue_size: int
+) -> List[LinkedInProfile]:
+    """
+    Extract the profiles whose URLs ``produce`` emits, over the driver pool.
+    
+    ``produce`` runs in its own thread and passes each URL to the function it
+    is called with, which pushes it into a bounded queue; extraction workers
+    drain the queue with drivers from the pool. When the queue is full the
+    producer waits, so it never runs far ahead of extraction. In ``offline``
+    extraction mode workers only capture page sources under the checkout and
+    hand them to a shared parser process pool; each worker collects its
+    previous profile while capturing the next, so parsing overlaps browsing.
+    
+    Returns:
+        List[LinkedInProfile]: Extracted profiles in the order their URLs were produced
+    """
+    pool = SeleniumManager.get_pool()
+    pool.start()
+    workers = max(min(max_workers or SCRAPE_CONCURRENCY or pool.size, pool.size), 1)
+
+    url_queue: "queue.Queue" = queue.Queue(maxsize=max(queue_size, 1))
+    extracted: List[Tuple[int, LinkedInProfile]] = []
+    extracted_lock = threading.Lock()
+    produced = [0]
+
+    def _put(profile_url: str):
+        url_queue.put((produced[0], profile_url))
+        produced[0] += 1
+
+    def _produce():
+        try:
+            produce(_put)
+        finally:
+            for _ in range(workers):
+                url_queue.put(_DONE)
+
+    def _collect(position: int, profile: Optional[LinkedInProfile]):
+        if profile is not None:
+            with extracted_lock:
+                extracted.append((position, profile))
+
+    def _consume(parser: Optional[ProfileParserPool]):
+        pending = None  # (position, profile_url, future) being parsed while the next page is captured
+        while True:
+            item = url_queue.get()
+            if item is _DONE:
+                break
+            position, profile_url = item
+            if parser is None:
+                _collect(position, extract_pooled_profile(pool, profile_url, on_profile))
+                continue
+            future = capture_pooled_profile(pool, parser, profile_url)
+            if pending:
+                _collect(pending[0], finish_parsed_profile(*pending[1:], on_profile))
+            pending = (position, profile_url, future) if future else None
+        if pending:
+            _collect(pending[0], finish_parsed_profile(*pending[1:], on_profile))
+
+    parser = ProfileParserPool() if EXTRACTION_MODE == "offline" else None
+    threads = [threading.Thread(target=_produce, name="url-producer", daemon=True)]
+    threads += [
+        threading.Thread(target=_consume, args=(parser,), name=f"extract-worker-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if parser:
+            parser.close()
+
+    return [profile for _, profile in sorted(extracted, key=lambda item: item[0])]
+
+def extract_profiles(
+    profile_urls: Iterable[str],
+    max_workers: Optional[int] = None,
+    on_profile: Optional[Callable[[LinkedInProfile], None]] = None,
+    queue_size: int = CRAWL_QUEUE_SIZE
+) -> List[LinkedInProfile]:
+    """
+    Extract data from many LinkedIn profiles concurrently over the driver pool.
+    
+    Each worker checks out a pooled driver for one profile and returns it
+    afterwards, so throughput scales with the number of pooled tabs. In
+    ``offline`` extraction mode workers only capture page sources, which are
+    parsed in a shared process pool while the browser moves on to the next
+    profile. ``profile_urls`` is consumed lazily, so it can be a generator.
+    
+    Args:
+        profile_urls (Iterable[str]): URLs of the LinkedIn profiles
+        max_workers (Optional[int]): Concurrency limit, defaults to
+            ``SCRAPE_CONCURRENCY`` or the pool size
+        on_profile (Optional[Callable[[LinkedInProfile], None]]): Called from a
+            worker thread as soon as each profile is extracted
+        queue_size (int): Maximum number of URLs waiting for extraction
+        
+    Returns:
+        List[LinkedInProfile]: Extracted profiles in input order; failed
+            profiles are reported and left out
+    """
+    def _produce(put: Callable[[str], None]):
+        for profile_url in profile_urls:
+            put(profile_url)
+
+    return _extract_produced(_produce, on_profile, max_workers, queue_size)
+
+def crawl_profiles(
+    query: str,
+    max_pages: int = SEARCH_MAX_PAGES,
+    url_filter: Optional[Callable[[str], bool]] = None,
+    on_profile: Optional[Callable[[LinkedInProfile], None]] = None,
+    max_workers: Optional[int] = None,
+    queue_size: int = CRAWL_QUEUE_SIZE
+) -> List[LinkedInProfile]:
+    """
+    Walk search result pages and extract profiles at the same time.
+    
+    A producer thread pages through the results with the shared driver and
+    feeds new profile URLs to the pooled extraction workers of
+    ``extract_profiles`` as soon as each page loads.
+    
+    Args:
+        query (str): Search query for finding LinkedIn members
+        max_pages (int): Maximum number of results pages to walk
+        url_filter (Optional[Callable[[str], bool]]): Returns False for URLs to skip
+        on_profile (Optional[Callable[[LinkedInProfile], None]]): Called from a
+            worker thread as soon as each profile is extracted
+        max_workers (Optional[int]): Extraction workers, defaults to
+            ``SCRAPE_CONCURRENCY`` or the pool size
+        queue_size (int): Maximum number of URLs waiting for extraction
+        
+    Returns:
+        List[LinkedInProfile]: Extracted profiles in the order they were found
+    """
+    counts = {"found": 0, "skipped": 0}
+
+    def _produce(put: Callable[[str], None]):
+        seen = set()
+        for page_urls in iter_search_result_pages(query, max_pages):
+            for profile_url in sorted(page_urls - seen):
+                seen.add(profile_url)
+                counts["found"] += 1
+                if url_filter and not url_filter(profile_url):
+                    counts["skipped"] += 1
+                    continue
+                put(profile_url)
+
+    profiles = _extract_produced(_produce, on_profile, max_workers, queue_size)
+    print(f"\n🔎 {counts['found']} profiles found, {counts['skipped']} skipped, {len(profiles)} extracted.")
+    return profiles
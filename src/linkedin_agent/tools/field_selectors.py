@@ -0,0 +1,63 @@
+"""
+Profile field definitions and selector compilation helpers.
+"""
+
+import json
+from typing import Dict, Iterable
+
+from ..config.settings import SELECTORS
+
+# Profile fields extracted from a profile page, in extraction order
+PROFILE_FIELDS = ("name", "headline", "designation", "company")
+
+# Placeholder stored when a field cannot be found on the page
+FIELD_NOT_FOUND = {field: f"{field.capitalize()} not found" for field in PROFILE_FIELDS}
+
+_EXTRACTION_SCRIPT_TEMPLATE = """
+const selectors = %s;
+const find = (selector) => {
+    try {
+        if (selector.type === "xpath") {
+            return document.evaluate(
+                selector.value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        if (selector.type === "class") {
+            return document.getElementsByClassName(selector.value)[0] || null;
+        }
+        if (selector.type === "css") {
+            return document.querySelector(selector.value);
+        }
+    } catch (e) {}
+    return null;
+};
+const result = {};
+for (const [field, selector] of Object.entries(selectors)) {
+    const element = find(selector);
+    const text = element ? (element.innerText || element.textContent || "").trim() : "";
+    result[field] = text || null;
+}
+return result;
+"""
+
+
+def build_extraction_script(fields: Iterable[str] = PROFILE_FIELDS) -> str:
+    """
+    Compile the selectors of the given fields into a single JavaScript snippet.
+    
+    The snippet is meant for ``driver.execute_script`` and returns a dict of
+    field -> text, with ``null`` for every field whose element is missing.
+    
+    Args:
+        fields (Iterable[str]): Keys of ``SELECTORS`` to extract
+        
+    Returns:
+        str: JavaScript source returning the extracted fields
+    """
+    selectors: Dict[str, Dict[str, str]] = {field: SELECTORS[field] for field in fields}
+    return _EXTRACTION_SCRIPT_TEMPLATE % json.dumps(selectors)
+
+
+# Compiled once at import, shared by every extraction call
+PROFILE_EXTRACTION_SCRIPT = build_extraction_script()
@@ -0,0 +1,139 @@
+"""
+Offline profile parsing from captured page source, decoupled from the browser.
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from lxml import html as lxml_html
+
+from ..config.settings import SELECTORS, HTML_ARCHIVE_DIR, PARSER_WORKERS
+from ..models.types import LinkedInProfile
+from .field_selectors import PROFILE_FIELDS, FIELD_NOT_FOUND
+
+
+def _find_text(tree: lxml_html.HtmlElement, selector: dict) -> Optional[str]:
+    """Return the stripped text of the first element matching a SELECTORS entry."""
+    try:
+        if selector["type"] == "xpath":
+            matches = tree.xpath(selector["value"])
+        elif selector["type"] == "class":
+            matches = tree.find_class(selector["value"])
+        elif selector["type"] == "css":
+            matches = tree.cssselect(selector["value"])
+        else:
+            return None
+    except Exception:
+        return None
+
+    for match in matches:
+        text = match.text_content() if hasattr(match, "text_content") else str(match)
+        if text and text.strip():
+            return text.strip()
+    return None
+
+
+def parse_profile_html(profile_url: str, page_source: str) -> LinkedInProfile:
+    """
+    Parse profile fields from a captured page source.
+    
+    Uses the lxml equivalents of ``SELECTORS`` so results match live extraction.
+    
+    Args:
+        profile_url (str): URL the page source was captured from
+        page_source (str): Full HTML of the profile page
+        
+    Returns:
+        LinkedInProfile: Parsed profile data
+    """
+    tree = lxml_html.fromstring(page_source)
+    profile = {"profile_url": profile_url}
+    for field in PROFILE_FIELDS:
+        profile[field] = _find_text(tree, SELECTORS[field]) or FIELD_NOT_FOUND[field]
+    return profile
+
+
+class ProfileParserPool:
+    """
+    Parses captured page sources in a process pool so the browser can move on.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ProcessPoolExecutor(max_workers=max_workers or PARSER_WORKERS or None)
+
+    def submit(self, profile_url: str, page_source: str) -> "Future[LinkedInProfile]":
+        """Schedule a page source for parsing and return its future."""
+        return self._executor.submit(parse_profile_html, profile_url, page_source)
+
+    def close(self):
+        """Wait for pending parses and shut the pool down."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ProfileParserPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def archive_page_source(profile_url: str, page_source: str, archive_dir: str = HTML_ARCHIVE_DIR) -> str:
+    """
+    Store a captured page source so it can be re-parsed later.
+    
+    Args:
+        profile_url (str): URL the page source was captured from
+        page_source (str): Full HTML of the profile page
+        archive_dir (str): Directory holding archived pages
+        
+    Returns:
+        str: Path of the archived page
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    digest = hashlib.sha1(profile_url.encode("utf-8")).hexdigest()
+    path = os.path.join(archive_dir, f"{digest}.json.gz")
+    record = {"profile_url": profile_url, "captured_at": time.time(), "page_source": page_source}
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False)
+    return path
+
+
+def iter_archived_pages(archive_dir: str = HTML_ARCHIVE_DIR) -> Iterator[Tuple[str, str]]:
+    """
+    Iterate over archived pages.
+    
+    Args:
+        archive_dir (str): Directory holding archived pages
+        
+    Yields:
+        Tuple[str, str]: Profile URL and page source of each archived page
+    """
+    for path in sorted(glob.glob(os.path.join(archive_dir, "*.json.gz"))):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Skipping unreadable archive {path}: {e}")
+            continue
+        yield record["profile_url"], record["page_source"]
+
+
+def reparse_archive(archive_dir: str = HTML_ARCHIVE_DIR, max_workers: Optional[int] = None) -> List[LinkedInProfile]:
+    """
+    Re-parse every archived page with the current selectors.
+    
+    Args:
+        archive_dir (str): Directory holding archived pages
+        max_workers (Optional[int]): Parser processes, defaults to ``PARSER_WORKERS``
+        
+    Returns:
+        List[LinkedInProfile]: Parsed profiles in archive order
+    """
+    with ProfileParserPool(max_workers=max_workers) as parser:
+        futures = [parser.submit(url, source) for url, source in iter_archived_pages(archive_dir)]
+        return [future.result() for future in futures]
@@ -2,34 +2,126 @@
 LinkedIn interaction tools using Selenium for profile data extraction.
 """
 
-import time
-from typing import List, Set, Dict
+from concurrent.futures import Future
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Dict
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
+from ..browser.driver_pool import DriverPool
+from ..browser.readiness import PAGE_READINESS
 from ..browser.selenium_manager import SeleniumManager
-from ..config.settings import SELECTORS, SEARCH_LOAD_DELAY, PROFILE_LOAD_DELAY
+from ..config.settings import (
+    SELECTORS,
+    LINKEDIN_BASE_URL,
+    READINESS_NETWORK_IDLE,
+    SEARCH_MAX_PAGES,
+    EXTRACTION_MODE,
+    ARCHIVE_PAGE_SOURCE
+)
 from ..models.types import LinkedInProfile
+from ..monitoring.metrics import METRICS
+from ..scheduling.rate_scheduler import SCHEDULER
+from .field_selectors import PROFILE_FIELDS, FIELD_NOT_FOUND, PROFILE_EXTRACTION_SCRIPT
+from .html_parser import ProfileParserPool, archive_page_source, parse_profile_html
+from .urls import normalize_profile_url
 
-def search_linkedin_profiles(query: str) -> Set[str]:
+# Selenium locator strategy for each selector type in SELECTORS
+_BY_TYPE = {
+    "xpath": By.XPATH,
+    "class": By.CLASS_NAME,
+    "css": By.CSS_SELECTOR
+}
+
+# URL fragments LinkedIn redirects to when it rate-limits or challenges a session
+_THROTTLE_URL_MARKERS = ("/checkpoint/", "/authwall", "/uas/login")
+
+def _locator(selector_name: str) -> tuple:
+    """Build a Selenium locator tuple for a named entry in SELECTORS."""
+    selector = SELECTORS[selector_name]
+    return (_BY_TYPE[selector["type"]], selector["value"])
+
+def _navigate(driver: webdriver.Chrome, url: str, page: str):
+    """Load a LinkedIn page through the shared rate scheduler."""
+    with METRICS.timer("rate_limit_wait", bucket="linkedin_pages"):
+        SCHEDULER.acquire_page_load()
+    with METRICS.timer("navigate", page=page):
+        driver.get(url)
+    if any(marker in driver.current_url for marker in _THROTTLE_URL_MARKERS):
+        METRICS.incr("page_throttled", page=page)
+        SCHEDULER.page_throttled()
+    else:
+        SCHEDULER.page_succeeded()
+
+def _record_selector_misses(profile: LinkedInProfile):
+    """Count the profile fields that could not be found."""
+    for field in PROFILE_FIELDS:
+        if profile.get(field) == FIELD_NOT_FOUND[field]:
+            METRICS.incr("selector_misses", field=field)
+
+def _require_fields(profile: LinkedInProfile):
     """
-    Search LinkedIn and collect profile URLs.
+    Reject an extraction that found no field at all.
+    
+    That happens on an authwall or checkpoint page, or when the page never
+    rendered before the readiness timeout; saving it would overwrite good
+    data with placeholders and mark the profile fresh.
+    """
+    if all(profile.get(field) == FIELD_NOT_FOUND[field] for field in PROFILE_FIELDS):
+        METRICS.incr("empty_extractions")
+        raise ValueError(f"No profile field found on {profile['profile_url']}")
+
+def _collect_profile_urls(driver: webdriver.Chrome) -> Set[str]:
+    """Collect the canonical profile URLs linked from the current page."""
+    profile_urls = set()
+    for link in driver.find_elements(*_locator("profile_links")):
+        profile_url = normalize_profile_url(link.get_attribute('href'))
+        if profile_url:
+            profile_urls.add(profile_url)
+    return profile_urls
+
+def _with_page(results_url: str, page: int) -> str:
+    """Set the ``page`` query parameter of a search results URL."""
+    parsed = urlparse(results_url)
+    params = dict(parse_qsl(parsed.query))
+    params["page"] = str(page)
+    return urlunparse(parsed._replace(query=urlencode(params)))
+
+def iter_search_result_pages(
+    query: str,
+    max_pages: int = SEARCH_MAX_PAGES,
+    driver: Optional[webdriver.Chrome] = None,
+    wait: Optional[WebDriverWait] = None,
+    raise_errors: bool = False
+) -> Iterator[Set[str]]:
+    """
+    Search LinkedIn and yield the profile URLs of each results page as it loads.
+    
+    The first page is reached through the search box; later pages are loaded
+    by setting the ``page`` parameter of the results URL. Iteration stops at
+    ``max_pages`` or at the first page without profile links.
     
     Args:
         query (str): Search query for finding LinkedIn members
+        max_pages (int): Maximum number of results pages to walk
+        driver (Optional[webdriver.Chrome]): Driver to use, defaults to the shared driver
+        wait (Optional[WebDriverWait]): Wait bound to ``driver``, defaults to the shared wait
+        raise_errors (bool): Re-raise search errors instead of only reporting them
+            and stopping, e.g. so a job queue can retry the search
         
-    Returns:
-        Set[str]: Set of profile URLs
+    Yields:
+        Set[str]: Canonical profile URLs found on each page
     """
-    driver = SeleniumManager.get_driver()
-    wait = SeleniumManager.get_wait()
-    profile_urls = set()
+    driver = driver or SeleniumManager.get_driver()
+    wait = wait or SeleniumManager.get_wait()
 
     try:
         # Go to LinkedIn homepage
-        driver.get("https://www.linkedin.com/")
-        time.sleep(2)
+        _navigate(driver, f"{LINKEDIN_BASE_URL}/", "home")
+        PAGE_READINESS.wait_until_ready(driver, "home", _locator("search_box"))
 
         # Search for profiles
         search_box = wait.until(EC.presence_of_element_located(
@@ -37,89 +129,275 @@ def search_linkedin_profiles(query: str) -> Set[str]:
         ))
         search_box.clear()
         search_box.send_keys(query)
+        SCHEDULER.acquire_page_load()
         search_box.send_keys(Keys.RETURN)
 
-        # Wait for results
-        time.sleep(SEARCH_LOAD_DELAY)
+        # Wait for the results page to replace the homepage, then for results
+        wait.until(EC.url_contains("/search/"))
+        results_url = driver.current_url
 
-        # Extract profile URLs
-        profile_links = wait.until(EC.presence_of_all_elements_located(
-            (By.XPATH, SELECTORS["profile_links"]["value"])
-        ))
-        
-        for link in profile_links:
-            href = link.get_attribute('href')
-            if href:
-                profile_urls.add(href)
+        for page in range(1, max_pages + 1):
+            if page > 1:
+                _navigate(driver, _with_page(results_url, page), "search")
+            PAGE_READINESS.wait_until_ready(
+                driver, "search", _locator("profile_links"), network_idle=READINESS_NETWORK_IDLE
+            )
+
+            # Extract profile URLs
+            profile_urls = _collect_profile_urls(driver)
+            if not profile_urls:
+                break
+            print(f"📄 Search page {page}: {len(profile_urls)} profile links")
+            yield profile_urls
 
     except Exception as e:
         print("❌ Error during profile search:")
         print(e)
+        if raise_errors:
+            raise
 
+def search_linkedin_profiles(query: str, max_pages: int = 1) -> Set[str]:
+    """
+    Search LinkedIn and collect profile URLs.
+    
+    Args:
+        query (str): Search query for finding LinkedIn members
+        max_pages (int): Number of results pages to read
+        
+    Returns:
+        Set[str]: Set of canonical profile URLs
+    """
+    profile_urls = set()
+    for page_urls in iter_search_result_pages(query, max_pages):
+        profile_urls.update(page_urls)
     return profile_urls
 
-def extract_profile_data(profile_url: str) -> LinkedInProfile:
+def _extract_fields_with_waits(wait: WebDriverWait) -> Dict[str, str]:
+    """
+    Extract profile fields with one explicit wait per field.
+    
+    Args:
+        wait (WebDriverWait): Wait bound to the driver showing the profile
+        
+    Returns:
+        Dict[str, str]: Field name -> extracted text or its not-found placeholder
+    """
+    fields = {}
+    for field in PROFILE_FIELDS:
+        with METRICS.timer("field_extract", field=field):
+            try:
+                element = wait.until(EC.presence_of_element_located(_locator(field)))
+                fields[field] = element.text
+            except Exception:
+                fields[field] = FIELD_NOT_FOUND[field]
+    return fields
+
+def _extract_fields_with_script(driver: webdriver.Chrome) -> Dict[str, str]:
+    """
+    Extract every profile field in a single ``execute_script`` round trip.
+    
+    Missing fields are marked immediately instead of waiting for a timeout.
+    
+    Args:
+        driver (webdriver.Chrome): Driver showing the profile
+        
+    Returns:
+        Dict[str, str]: Field name -> extracted text or its not-found placeholder
+    """
+    try:
+        with METRICS.timer("field_extract", field="all"):
+            values = driver.execute_script(PROFILE_EXTRACTION_SCRIPT) or {}
+    except Exception as e:
+        print(f"❌ Script extraction failed: {e}")
+        values = {}
+    return {field: values.get(field) or FIELD_NOT_FOUND[field] for field in PROFILE_FIELDS}
+
+def _open_profile(profile_url: str, driver: webdriver.Chrome):
+    """Navigate to a profile and wait until it is ready."""
+    print(f"\n🔗 Opening profile: {profile_url}")
+    _navigate(driver, profile_url, "profile")
+    PAGE_READINESS.wait_until_ready(
+        driver, "profile", _locator("profile_root"), network_idle=READINESS_NETWORK_IDLE
+    )
+
+def _print_profile(profile: LinkedInProfile):
+    """Print the extracted fields of a profile."""
+    print(f"👤 Name: {profile['name']}")
+    print(f"💼 Headline: {profile['headline']}")
+    print(f"🏢 Company: {profile['company']}")
+    print(f"🪪 Designation: {profile['designation']}")
+
+def capture_profile_page(profile_url: str, driver: Optional[webdriver.Chrome] = None) -> str:
+    """
+    Open a profile and capture its page source for offline parsing.
+    
+    The page source is archived when ``ARCHIVE_PAGE_SOURCE`` is enabled so it
+    can be re-parsed later without revisiting LinkedIn.
+    
+    Args:
+        profile_url (str): URL of the LinkedIn profile
+        driver (Optional[webdriver.Chrome]): Driver to use, defaults to the shared driver
+        
+    Returns:
+        str: Full HTML of the profile page
+    """
+    driver = driver or SeleniumManager.get_driver()
+    _open_profile(profile_url, driver)
+    with METRICS.timer("page_capture"):
+        page_source = driver.page_source
+    if ARCHIVE_PAGE_SOURCE:
+        archive_page_source(profile_url, page_source)
+    return page_source
+
+def extract_profile_data(
+    profile_url: str,
+    driver: Optional[webdriver.Chrome] = None,
+    wait: Optional[WebDriverWait] = None
+) -> LinkedInProfile:
     """
     Extract data from a single LinkedIn profile.
     
     Args:
         profile_url (str): URL of the LinkedIn profile
+        driver (Optional[webdriver.Chrome]): Driver to use, defaults to the shared driver
+        wait (Optional[WebDriverWait]): Wait bound to ``driver``, defaults to the shared wait
         
     Returns:
         LinkedInProfile: Extracted profile data
+
+    Raises:
+        ValueError: If no profile field was found on the page
     """
-    driver = SeleniumManager.get_driver()
-    wait = SeleniumManager.get_wait()
-    
-    print(f"\n🔗 Opening profile: {profile_url}")
-    driver.get(profile_url)
-    time.sleep(PROFILE_LOAD_DELAY)
+    driver = driver or SeleniumManager.get_driver()
+    wait = wait or SeleniumManager.get_wait()
 
-    try:
-        # Extract Name
-        name_elem = wait.until(EC.presence_of_element_located(
-            (By.CLASS_NAME, SELECTORS["name"]["value"])
-        ))
-        name = name_elem.text
-    except:
-        name = "Name not found"
+    with METRICS.timer("profile_extract", mode=EXTRACTION_MODE):
+        if EXTRACTION_MODE == "offline":
+            page_source = capture_profile_page(profile_url, driver)
+            with METRICS.timer("html_parse"):
+                profile = parse_profile_html(profile_url, page_source)
+        else:
+            _open_profile(profile_url, driver)
+            if EXTRACTION_MODE == "script":
+                fields = _extract_fields_with_script(driver)
+            else:
+                fields = _extract_fields_with_waits(wait)
+            profile = {"profile_url": profile_url, **fields}
+
+    _record_selector_misses(profile)
+    _require_fields(profile)
+    _print_profile(profile)
+    return profile
 
+def extract_pooled_profile(
+    pool: DriverPool,
+    profile_url: str,
+    on_profile: Optional[Callable[[LinkedInProfile], None]] = None
+) -> Optional[LinkedInProfile]:
+    """
+    Extract one profile with a driver checked out of the pool.
+    
+    Args:
+        pool (DriverPool): Pool to check a driver out of
+        profile_url (str): URL of the LinkedIn profile
+        on_profile (Optional[Callable[[LinkedInProfile], None]]): Called with the extracted profile
+        
+    Returns:
+        Optional[LinkedInProfile]: Extracted profile data, or None on failure
+    """
     try:
-        # Extract Headline
-        headline_elem = wait.until(EC.presence_of_element_located(
-            (By.CSS_SELECTOR, SELECTORS["headline"]["value"])
-        ))
-        headline = headline_elem.text
-    except:
-        headline = "Headline not found"
+        with pool.checkout() as pooled:
+            profile = extract_profile_data(profile_url, driver=pooled.driver, wait=pooled.wait)
+        if on_profile:
+            on_profile(profile)
+        return profile
+    except Exception as e:
+        METRICS.incr("profile_errors")
+        print(f"❌ Error processing profile {profile_url}:")
+        print(e)
+        return None
 
+def extract_profiles(
+    profile_urls: Iterable[str],
+    max_workers: Optional[int] = None,
+    on_profile: Optional[Callable[[LinkedInProfile], None]] = None
+) -> List[LinkedInProfile]:
+    """
+    Extract data from many LinkedIn profiles concurrently over the driver pool.
+    
+    See ``crawler.extract_profiles``, which shares its extraction workers and,
+    in ``offline`` mode, its parser process pool with the search crawler.
+    
+    Args:
+        profile_urls (Iterable[str]): URLs of the LinkedIn profiles
+        max_workers (Optional[int]): Concurrency limit, defaults to
+            ``SCRAPE_CONCURRENCY`` or the pool size
+        on_profile (Optional[Callable[[LinkedInProfile], None]]): Called from a
+            worker thread as soon as each profile is extracted
+        
+    Returns:
+        List[LinkedInProfile]: Extracted profiles in input order; failed
+            profiles are reported and left out
+    """
+    # Imported here to avoid a circular import with the crawler
+    from .crawler import extract_profiles as _extract_profiles
+    return _extract_profiles(profile_urls, max_workers=max_workers, on_profile=on_profile)
+
+def capture_pooled_profile(
+    pool: DriverPool,
+    parser: ProfileParserPool,
+    profile_url: str
+) -> Optional["Future[LinkedInProfile]"]:
+    """
+    Capture one profile page with a pooled driver and queue it for parsing.
+    
+    The driver goes back to the pool as soon as the page source is captured;
+    the page is parsed in ``parser``'s processes while the browser moves on.
+    
+    Args:
+        pool (DriverPool): Pool to check a driver out of
+        parser (ProfileParserPool): Process pool parsing the captured page
+        profile_url (str): URL of the LinkedIn profile
+        
+    Returns:
+        Optional[Future[LinkedInProfile]]: Future of the parsed profile, or None on failure
+    """
     try:
-        # Extract Designation
-        designation_elem = wait.until(EC.presence_of_element_located(
-            (By.XPATH, SELECTORS["designation"]["value"])
-        ))
-        designation = designation_elem.text
-    except:
-        designation = "Designation not found"
+        with pool.checkout() as pooled:
+            page_source = capture_profile_page(profile_url, driver=pooled.driver)
+        return parser.submit(profile_url, page_source)
+    except Exception as e:
+        METRICS.incr("profile_errors")
+        print(f"❌ Error processing profile {profile_url}:")
+        print(e)
+        return None
 
+def finish_parsed_profile(
+    profile_url: str,
+    future: "Future[LinkedInProfile]",
+    on_profile: Optional[Callable[[LinkedInProfile], None]] = None
+) -> Optional[LinkedInProfile]:
+    """
+    Wait for a profile queued by ``capture_pooled_profile`` and report it.
+    
+    Args:
+        profile_url (str): URL of the LinkedIn profile
+        future (Future[LinkedInProfile]): Future returned by ``capture_pooled_profile``
+        on_profile (Optional[Callable[[LinkedInProfile], None]]): Called with the parsed profile
+        
+    Returns:
+        Optional[LinkedInProfile]: Parsed profile data, or None on failure
+    """
     try:
-        # Extract Company
-        company_elem = wait.until(EC.presence_of_element_located(
-            (By.XPATH, SELECTORS["company"]["value"])
-        ))
-        company = company_elem.text
-    except:
-        company = "Company not found"
-
-    print(f"👤 Name: {name}")
-    print(f"💼 Headline: {headline}")
-    print(f"🏢 Company: {company}")
-    print(f"🪪 Designation: {designation}")
-
-    return {
-        "profile_url": profile_url,
-        "name": name,
-        "headline": headline,
-        "company": company,
-        "designation": designation
-    } 
\ No newline at end of file
+        profile = future.result()
+        _record_selector_misses(profile)
+        _require_fields(profile)
+    except Exception as e:
+        METRICS.incr("profile_errors")
+        print(f"❌ Error parsing profile page {profile_url}:")
+        print(e)
+        return None
+    _print_profile(profile)
+    if on_profile:
+        on_profile(profile)
+    return profile
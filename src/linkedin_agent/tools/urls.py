@@ -0,0 +1,42 @@
+"""
+Canonical LinkedIn profile URL handling.
+"""
+
+from typing import Optional
+from urllib.parse import quote, unquote, urljoin, urlparse
+
+from ..config.settings import LINKEDIN_BASE_URL
+
+_BASE = urlparse(LINKEDIN_BASE_URL)
+
+def normalize_profile_url(href: str) -> Optional[str]:
+    """
+    Reduce a profile link to its canonical form.
+    
+    Query strings, fragments, sub-pages (``/overlay/...``, ``/details/...``),
+    host variants and trailing slashes are dropped and the slug is lowercased,
+    so every link to the same member maps to ``<LINKEDIN_BASE_URL>/in/<slug>/``.
+    
+    Args:
+        href (str): Profile link, absolute or relative
+        
+    Returns:
+        Optional[str]: The canonical profile URL, or None if ``href`` is not a profile link
+    """
+    if not href:
+        return None
+
+    parsed = urlparse(urljoin(LINKEDIN_BASE_URL + "/", href.strip()))
+    host = parsed.netloc.lower()
+    if host != _BASE.netloc.lower() and not (host == "linkedin.com" or host.endswith(".linkedin.com")):
+        return None
+
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) < 2 or parts[0].lower() != "in":
+        return None
+
+    # Re-encode so percent-encoded, raw and differently cased variants of the same slug match
+    slug = quote(unquote(parts[1]).strip().lower(), safe="")
+    if not slug:
+        return None
+    return f"{_BASE.scheme}://{_BASE.netloc}/in/{slug}/"
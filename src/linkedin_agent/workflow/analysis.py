@@ -0,0 +1,411 @@
+"""
+LLM-backed profile analysis shared by the workflow nodes.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..config.settings import (
+    ENV_PATH,
+    GEMINI_API_KEY,
+    LLM_MODEL,
+    LLM_TEMPERATURE,
+    LLM_MAX_TOKENS,
+    LLM_BATCH_MAX_TOKENS,
+    ANALYSIS_CONCURRENCY,
+    ANALYSIS_BATCH_SIZE,
+    LLM_MAX_RETRIES,
+    LLM_STREAMING
+)
+from ..monitoring.metrics import METRICS
+from ..scheduling.rate_scheduler import SCHEDULER
+from .cache import ResponseCache, get_response_cache
+from .prompts import ANALYZE_PROFILE_PROMPT, BATCH_ANALYZE_PROFILES_PROMPT
+
+# Actions the analysis prompts allow the LLM to choose
+VALID_ACTIONS = ("send_message", "send_connection", "skip")
+
+# Chat model clients by role, created on first use or installed with set_llm
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+def _create_llm(max_output_tokens: int):
+    """Create a Gemini chat model client with the configured model settings."""
+    if not GEMINI_API_KEY:
+        raise ValueError(f"GEMINI_API_KEY not found in environment. Please check {ENV_PATH}")
+
+    # Imported here so modules that never call the LLM do not load the client library
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    try:
+        return ChatGoogleGenerativeAI(
+            google_api_key=GEMINI_API_KEY,
+            model=LLM_MODEL,
+            temperature=LLM_TEMPERATURE,
+            max_output_tokens=max_output_tokens
+        )
+    except Exception as e:
+        raise Exception(f"Failed to initialize ChatGoogleGenerativeAI: {str(e)}")
+
+def _get_client(role: str, max_output_tokens: int):
+    with _clients_lock:
+        if role not in _clients:
+            _clients[role] = _create_llm(max_output_tokens)
+        return _clients[role]
+
+def get_llm():
+    """
+    Get the shared chat model for single-profile and summary requests.
+    
+    Returns:
+        The chat model, created on first call unless overridden with ``set_llm``
+    """
+    return _get_client("default", LLM_MAX_TOKENS)
+
+def get_batch_llm():
+    """
+    Get the shared chat model for batched requests.
+    
+    Batched requests answer for many profiles at once and need a larger output budget.
+    
+    Returns:
+        The chat model, created on first call unless overridden with ``set_llm``
+    """
+    return _get_client("batch", LLM_BATCH_MAX_TOKENS)
+
+def set_llm(client, batch_client=None):
+    """
+    Override the chat models used by the workflow, e.g. with a fake model.
+    
+    Args:
+        client: Chat model for single-profile and summary requests, or None
+            to go back to lazily created Gemini clients
+        batch_client: Chat model for batched requests, defaults to ``client``
+    """
+    with _clients_lock:
+        _clients.clear()
+        if client is not None:
+            _clients["default"] = client
+            _clients["batch"] = batch_client or client
+
+def is_throttling_error(error: Exception) -> bool:
+    """Whether an LLM error is a 429/quota response that should be retried."""
+    if getattr(error, "code", None) == 429 or getattr(error, "status_code", None) == 429:
+        return True
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in ("429", "resourceexhausted", "resource exhausted", "quota", "rate limit"))
+
+def estimate_tokens(messages: list, max_output_tokens: int) -> int:
+    """Rough token estimate of a request: ~4 characters per prompt token plus the output budget."""
+    return sum(len(str(message.content)) for message in messages) // 4 + max_output_tokens
+
+async def _call_with_retries(call, estimated: int, kind: str):
+    """
+    Run an LLM call through the shared rate scheduler, retrying throttled calls.
+    
+    Args:
+        call: Coroutine function returning the result and its usage metadata
+        estimated (int): Token estimate reserved from the token bucket
+        kind (str): Call type used to label metrics
+        
+    Returns:
+        The result of ``call``
+    """
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        with METRICS.timer("rate_limit_wait", bucket="llm"):
+            await SCHEDULER.acquire_llm_call(estimated)
+        METRICS.incr("llm_requests", kind=kind)
+        start = time.perf_counter()
+        try:
+            result, usage = await call()
+        except Exception as e:
+            METRICS.observe("llm_latency", time.perf_counter() - start, kind=kind)
+            if attempt < LLM_MAX_RETRIES and is_throttling_error(e):
+                METRICS.incr("llm_throttled", kind=kind)
+                print(f"⏳ LLM throttled, retrying ({attempt + 1}/{LLM_MAX_RETRIES})")
+                # Shared buckets may wait on another process's write lock, so off the event loop
+                await asyncio.to_thread(SCHEDULER.llm_throttled)
+                continue
+            METRICS.incr("llm_errors", kind=kind)
+            raise
+        METRICS.observe("llm_latency", time.perf_counter() - start, kind=kind)
+        METRICS.incr("llm_prompt_tokens", usage.get("input_tokens", 0), kind=kind)
+        METRICS.incr("llm_completion_tokens", usage.get("output_tokens", 0), kind=kind)
+        await asyncio.to_thread(SCHEDULER.llm_succeeded, estimated, usage.get("total_tokens"))
+        return result
+
+async def invoke_llm(client, messages: list, max_output_tokens: int = LLM_MAX_TOKENS, kind: str = "analyze"):
+    """
+    Call the LLM through the shared rate scheduler, retrying throttled calls.
+    
+    Args:
+        client: Chat model to invoke
+        messages (list): Rendered prompt messages
+        max_output_tokens (int): Output budget of ``client``, used for the token estimate
+        kind (str): Call type used to label metrics
+        
+    Returns:
+        The chat model response
+    """
+    async def _invoke():
+        response = await client.ainvoke(messages)
+        return response, getattr(response, "usage_metadata", None) or {}
+
+    return await _call_with_retries(_invoke, estimate_tokens(messages, max_output_tokens), kind)
+
+def _completed_field(content: str, field: str) -> Optional[str]:
+    """Value of a ``FIELD:`` line of a partial response, once the line is complete."""
+    for line in content.split('\n')[:-1]:
+        if line.startswith(f'{field}:'):
+            return line.split(':', 1)[1].strip()
+    return None
+
+async def stream_analysis(client, messages: list, max_output_tokens: int = LLM_MAX_TOKENS, kind: str = "analyze") -> str:
+    """
+    Stream a single-profile analysis, stopping early on skip decisions.
+    
+    The ACTION/REASON/MESSAGE response is parsed as it arrives. Once a
+    ``skip`` action and its complete reason have been received the stream is
+    closed, cancelling the rest of the generation. The time until the action
+    is known is recorded as ``llm_time_to_decision``.
+    
+    Args:
+        client: Chat model to stream from
+        messages (list): Rendered ANALYZE_PROFILE_PROMPT messages
+        max_output_tokens (int): Output budget of ``client``, used for the token estimate
+        kind (str): Call type used to label metrics
+        
+    Returns:
+        str: The response text, cut after the reason for skip decisions
+    """
+    async def _stream():
+        start = time.perf_counter()
+        message = None
+        decided = False
+        stream = client.astream(messages)
+        try:
+            async for chunk in stream:
+                message = chunk if message is None else message + chunk
+                content = message.content if isinstance(message.content, str) else ""
+                action = _completed_field(content, 'ACTION')
+                if action is None:
+                    continue
+                if not decided:
+                    METRICS.observe("llm_time_to_decision", time.perf_counter() - start, kind=kind, action=action)
+                    decided = True
+                if action == 'skip' and _completed_field(content, 'REASON') is not None:
+                    METRICS.incr("llm_stream_cancelled", kind=kind)
+                    break
+        finally:
+            await stream.aclose()
+        if message is None:
+            return "", {}
+        return message.content, getattr(message, "usage_metadata", None) or {}
+
+    return await _call_with_retries(_stream, estimate_tokens(messages, max_output_tokens), kind)
+
+def parse_analysis_response(content: str) -> Dict[str, str]:
+    """
+    Parse the ACTION/REASON/MESSAGE lines of an analysis response.
+    
+    Args:
+        content (str): Raw LLM response text
+        
+    Returns:
+        Dict[str, str]: The action, reason and message; action defaults to 'skip'
+    """
+    lines = content.strip().split('\n')
+    action = next((line.split(':', 1)[1].strip() for line in lines if line.startswith('ACTION:')), 'skip')
+    reason = next((line.split(':', 1)[1].strip() for line in lines if line.startswith('REASON:')), '')
+    message = next((line.split(':', 1)[1].strip() for line in lines if line.startswith('MESSAGE:')), '')
+    return {"action": action, "reason": reason, "message": message}
+
+def format_analysis_response(analysis: Dict[str, str]) -> str:
+    """Render an analysis in the single-profile ACTION/REASON/MESSAGE format."""
+    return f"ACTION: {analysis['action']}\nREASON: {analysis['reason']}\nMESSAGE: {analysis['message']}"
+
+def _render_profile_messages(profile: Dict) -> list:
+    """Render ANALYZE_PROFILE_PROMPT for a single profile."""
+    return ANALYZE_PROFILE_PROMPT.format_messages(
+        **{key: profile.get(key, "") for key in ANALYZE_PROFILE_PROMPT.input_variables}
+    )
+
+async def analyze_profile(profile: Dict) -> Dict:
+    """
+    Analyze a single profile with the LLM.
+    
+    Responses are served from the persistent response cache when the rendered
+    prompt and model settings match a previous call.
+    
+    Args:
+        profile (Dict): Profile data with name, headline, company and designation
+        
+    Returns:
+        Dict: The profile merged with its action, reason and message
+    """
+    messages = _render_profile_messages(profile)
+    cache = get_response_cache()
+    key = ResponseCache.make_key(messages) if cache else None
+
+    content = cache.get(key) if cache else None
+    if cache:
+        METRICS.incr("llm_cache_hits" if content is not None else "llm_cache_misses")
+    if content is None:
+        if LLM_STREAMING:
+            content = await stream_analysis(get_llm(), messages, LLM_MAX_TOKENS)
+        else:
+            response = await invoke_llm(get_llm(), messages, LLM_MAX_TOKENS)
+            content = response.content
+        if cache:
+            cache.put(key, content)
+
+    return {**profile, **parse_analysis_response(content)}
+
+async def _analyze_each(profiles: List[Dict], concurrency: int) -> List[Optional[Dict]]:
+    """Analyze profiles concurrently; failed analyses are reported and come back as None."""
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _analyze(profile: Dict) -> Optional[Dict]:
+        async with semaphore:
+            print(f"DEBUG: Analyzing profile: {profile.get('name')}")
+            try:
+                return await analyze_profile(profile)
+            except Exception as e:
+                METRICS.incr("analysis_failures")
+                print(f"❌ Analysis failed for {profile.get('name')}: {e}")
+                return None
+
+    # gather preserves input order regardless of completion order
+    return list(await asyncio.gather(*(_analyze(profile) for profile in profiles)))
+
+async def analyze_profiles_concurrently(profiles: List[Dict], concurrency: int = ANALYSIS_CONCURRENCY) -> List[Dict]:
+    """
+    Analyze many profiles concurrently with a cap on in-flight LLM requests.
+    
+    Profiles whose analysis fails are reported and left out of the results,
+    so they stay pending and are analyzed again by a later run.
+    
+    Args:
+        profiles (List[Dict]): Profiles to analyze
+        concurrency (int): Maximum number of concurrent LLM requests
+        
+    Returns:
+        List[Dict]: Analysis results in the same order as ``profiles``
+    """
+    return [result for result in await _analyze_each(profiles, concurrency) if result is not None]
+
+def parse_batch_response(content: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a batched analysis response into per-profile analyses.
+    
+    Entries without a profile_url or with an unknown action are dropped, so
+    their profiles fall back to single-profile analysis.
+    
+    Args:
+        content (str): Raw LLM response text, a JSON array optionally in a code fence
+        
+    Returns:
+        Dict[str, Dict[str, str]]: profile_url -> action, reason and message
+    """
+    text = content.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+    try:
+        entries = json.loads(text)
+    except ValueError:
+        return {}
+    if not isinstance(entries, list):
+        return {}
+
+    parsed = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        action = str(entry.get("action", "")).strip()
+        profile_url = entry.get("profile_url")
+        if not profile_url or action not in VALID_ACTIONS:
+            continue
+        parsed[profile_url] = {
+            "action": action,
+            "reason": str(entry.get("reason", "")).strip(),
+            "message": str(entry.get("message", "")).strip()
+        }
+    return parsed
+
+async def _analyze_batch(batch: List[Dict]) -> List[Optional[Dict[str, str]]]:
+    """Analyze one batch of profiles in a single LLM request."""
+    fields = ["profile_url", "name", "headline", "company", "designation"]
+    payload = json.dumps([{key: profile.get(key, "") for key in fields} for profile in batch], ensure_ascii=False)
+    messages = BATCH_ANALYZE_PROFILES_PROMPT.format_messages(profiles=payload)
+    try:
+        response = await invoke_llm(get_batch_llm(), messages, LLM_BATCH_MAX_TOKENS, kind="batch")
+        parsed = parse_batch_response(response.content)
+    except Exception as e:
+        print(f"❌ Batch analysis failed for {len(batch)} profiles: {e}")
+        parsed = {}
+    return [parsed.get(profile.get("profile_url")) for profile in batch]
+
+async def analyze_profiles_batched(
+    profiles: List[Dict],
+    batch_size: int = ANALYSIS_BATCH_SIZE,
+    concurrency: int = ANALYSIS_CONCURRENCY
+) -> List[Dict]:
+    """
+    Analyze profiles with several profiles packed into each LLM request.
+    
+    Cached profiles are answered from the response cache; the rest are sent in
+    batches of ``batch_size``. Any profile missing from or unparseable in its
+    batch response is re-analyzed with a single-profile request; profiles
+    whose single-profile analysis fails too are left out of the results.
+    
+    Args:
+        profiles (List[Dict]): Profiles to analyze
+        batch_size (int): Profiles per batched request
+        concurrency (int): Maximum number of concurrent LLM requests
+        
+    Returns:
+        List[Dict]: Analysis results in the same order as ``profiles``
+    """
+    cache = get_response_cache()
+    keys = [ResponseCache.make_key(_render_profile_messages(profile)) if cache else None for profile in profiles]
+    analyses: List[Optional[Dict[str, str]]] = [None] * len(profiles)
+
+    if cache:
+        for idx, key in enumerate(keys):
+            content = cache.get(key)
+            METRICS.incr("llm_cache_hits" if content is not None else "llm_cache_misses")
+            if content is not None:
+                analyses[idx] = parse_analysis_response(content)
+
+    pending = [idx for idx, analysis in enumerate(analyses) if analysis is None]
+    batches = [pending[i:i + max(batch_size, 1)] for i in range(0, len(pending), max(batch_size, 1))]
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _run_batch(indices: List[int]):
+        async with semaphore:
+            print(f"DEBUG: Analyzing batch of {len(indices)} profiles")
+            batch_results = await _analyze_batch([profiles[idx] for idx in indices])
+        for idx, analysis in zip(indices, batch_results):
+            if analysis is None:
+                METRICS.incr("batch_parse_failures")
+                continue
+            analyses[idx] = analysis
+            if cache:
+                # Stored in single-profile form so later runs in any mode hit it
+                cache.put(keys[idx], format_analysis_response(analysis))
+
+    await asyncio.gather(*(_run_batch(indices) for indices in batches))
+
+    # Fall back to single-profile requests for entries the batches did not answer
+    fallback = [idx for idx, analysis in enumerate(analyses) if analysis is None]
+    if fallback:
+        print(f"DEBUG: Falling back to single-profile analysis for {len(fallback)} profiles")
+        results = await _analyze_each([profiles[idx] for idx in fallback], concurrency)
+        for idx, result in zip(fallback, results):
+            if result is not None:
+                analyses[idx] = {key: result[key] for key in ("action", "reason", "message")}
+
+    return [{**profile, **analysis} for profile, analysis in zip(profiles, analyses) if analysis is not None]
@@ -0,0 +1,178 @@
+"""
+Persistent content-addressed cache for LLM responses.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from langchain_core.messages import BaseMessage
+
+from ..config.settings import (
+    LLM_MODEL,
+    LLM_TEMPERATURE,
+    LLM_MAX_TOKENS,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_ENTRIES
+)
+
+# Share of the size limit evicted at once, so the LRU scan runs once per that many new entries
+_EVICT_FRACTION = 0.1
+
+
+class ResponseCache:
+    """
+    SQLite-backed LLM response cache with TTL and size-based eviction.
+
+    Keys are hashes of the rendered prompt messages plus the model settings,
+    so any change to the prompt, the profile fields or the model misses.
+    Expired entries are dropped when they are looked up. The entry count is
+    tracked, and once it exceeds ``max_entries`` the least recently used
+    entries are evicted down to ``_EVICT_FRACTION`` below the limit.
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl: float = LLM_CACHE_TTL,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)")
+        self._conn.commit()
+        self._entries = self._count()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    @staticmethod
+    def make_key(messages: List[BaseMessage]) -> str:
+        """
+        Build the cache key for a rendered prompt.
+        
+        Args:
+            messages (List[BaseMessage]): Rendered prompt messages
+            
+        Returns:
+            str: Hex SHA-256 digest of the prompt and model settings
+        """
+        payload = {
+            "model": LLM_MODEL,
+            "temperature": LLM_TEMPERATURE,
+            "max_tokens": LLM_MAX_TOKENS,
+            "messages": [[message.type, message.content] for message in messages]
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response, counting the hit or miss.
+        
+        Args:
+            key (str): Cache key from ``make_key``
+            
+        Returns:
+            Optional[str]: The cached response text, or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (self.ttl and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self._entries -= 1
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str):
+        """
+        Store a response, evicting least recently used entries once the size limit is exceeded.
+        
+        Args:
+            key (str): Cache key from ``make_key``
+            response (str): Response text to cache
+        """
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now)
+            )
+            if not exists:
+                self._entries += 1
+            if self.max_entries and self._entries > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Evict the least recently used entries down to below the size limit."""
+        keep = max(int(self.max_entries * (1 - _EVICT_FRACTION)), 1)
+        self._conn.execute(
+            """
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (keep,)
+        )
+        # Other processes sharing the file change the count too
+        self._entries = self._count()
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and the current number of entries."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache.
+    
+    Returns:
+        Optional[ResponseCache]: The cache, or None when ``LLM_CACHE_ENABLED`` is off
+    """
+    global _cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
@@ -0,0 +1,43 @@
+"""
+Durable checkpointing helpers for resuming analysis runs.
+"""
+
+import os
+import time
+import uuid
+from typing import Optional
+
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from ..config.settings import CHECKPOINT_PATH
+
+# Remembers the most recent run so --resume works without a thread id
+_LAST_THREAD_FILE = f"{CHECKPOINT_PATH}.last"
+
+def open_checkpointer(path: str = CHECKPOINT_PATH):
+    """
+    Open the SQLite-backed checkpointer.
+    
+    Args:
+        path (str): SQLite database holding checkpoints
+        
+    Returns:
+        AsyncContextManager[AsyncSqliteSaver]: Use with ``async with``
+    """
+    return AsyncSqliteSaver.from_conn_string(path)
+
+def new_thread_id() -> str:
+    """Create a unique thread id for a fresh analysis run."""
+    return f"analysis-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+def save_last_thread_id(thread_id: str):
+    """Record the thread id of the current run."""
+    with open(_LAST_THREAD_FILE, "w", encoding="utf-8") as f:
+        f.write(thread_id)
+
+def load_last_thread_id() -> Optional[str]:
+    """Get the thread id of the most recent run, if any."""
+    if not os.path.exists(_LAST_THREAD_FILE):
+        return None
+    with open(_LAST_THREAD_FILE, "r", encoding="utf-8") as f:
+        return f.read().strip() or None
@@ -2,21 +2,40 @@
 LangGraph workflow configuration for LinkedIn profile analysis.
 """
 
-from typing import Dict
+from typing import Dict, Optional
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
 
+from ..config.settings import ANALYSIS_MODE, PREFILTER_ENABLED
 from .states import ProfileAnalysisState
 from .nodes import (
     load_profiles_node,
+    prefilter_profiles_node,
     analyze_profile_node,
+    analyze_all_profiles_node,
+    analyze_profile_batches_node,
+    next_review_node,
     execute_action_node,
     summarize_results_node
 )
 
-def create_workflow() -> StateGraph:
+def create_workflow(
+    mode: str = ANALYSIS_MODE,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    prefilter: bool = PREFILTER_ENABLED
+) -> StateGraph:
     """
     Creates and configures the profile analysis workflow graph.
     
+    Args:
+        mode (str): "sequential" analyzes one profile per step; "parallel"
+            analyzes every profile concurrently and "batch" packs several
+            profiles into each request, both then review the results
+        checkpointer (Optional[BaseCheckpointSaver]): Persists state after every
+            node so an interrupted run can resume from its last completed step
+        prefilter (bool): Score each loaded chunk locally and skip profiles
+            below the ideal customer profile threshold before analysis
+    
     Returns:
         StateGraph: Compiled workflow graph
     """
@@ -25,30 +44,59 @@ def create_workflow() -> StateGraph:
 
     # Add nodes
     workflow.add_node("load", load_profiles_node)
-    workflow.add_node("analyze", analyze_profile_node)
     workflow.add_node("execute", execute_action_node)
     workflow.add_node("summarize", summarize_results_node)
 
     # Set entry point
     workflow.set_entry_point("load")
 
-    # Add edges
-    workflow.add_edge("load", "analyze")
-
-    def route_action(state: ProfileAnalysisState) -> str:
-        """Routes workflow based on the action decision."""
-        action = state.get("action_taken")
-        
-        if action == "done_processing":
-            return "summarize"
-        elif action in ["send_message", "send_connection"]:
-            return "execute"
-        elif action in ["processed", "skipped", "rejected"]:
-            return "analyze"
-        elif action == "completed":
-            return END
-        
+    # Analysis starts right after loading, or after the pre-filter
+    loaded = "load"
+    if prefilter:
+        workflow.add_node("prefilter", prefilter_profiles_node)
+        workflow.add_edge("load", "prefilter")
+        loaded = "prefilter"
+
+    if mode == "parallel":
+        _add_parallel_analysis(workflow, analyze_all_profiles_node, loaded)
+    elif mode == "batch":
+        _add_parallel_analysis(workflow, analyze_profile_batches_node, loaded)
+    else:
+        _add_sequential_analysis(workflow, loaded)
+
+    workflow.add_conditional_edges(
+        "summarize",
+        route_action,
+        {
+            END: END
+        }
+    )
+
+    return workflow.compile(checkpointer=checkpointer)
+
+def route_action(state: ProfileAnalysisState) -> str:
+    """Routes workflow based on the action decision."""
+    action = state.get("action_taken")
+    
+    if action == "done_processing":
+        return "summarize"
+    elif action == "load_more":
+        return "load"
+    elif action in ["send_message", "send_connection"]:
+        return "execute"
+    elif action in ["processed", "skipped", "rejected", "queued"]:
         return "analyze"
+    elif action == "completed":
+        return END
+    
+    return "analyze"
+
+def _add_sequential_analysis(workflow: StateGraph, loaded: str = "load"):
+    """Analyze and review one profile per step."""
+    workflow.add_node("analyze", analyze_profile_node)
+
+    # Add edges
+    workflow.add_edge(loaded, "analyze")
 
     # Add conditional edges
     workflow.add_conditional_edges(
@@ -57,6 +105,7 @@ def create_workflow() -> StateGraph:
         {
             "execute": "execute",
             "analyze": "analyze",
+            "load": "load",
             "summarize": "summarize",
             END: END
         }
@@ -71,12 +120,32 @@ def create_workflow() -> StateGraph:
         }
     )
 
+def _add_parallel_analysis(workflow: StateGraph, analyze_node, loaded: str = "load"):
+    """Analyze every profile up front, then review flagged profiles one by one."""
+    workflow.add_node("analyze_all", analyze_node)
+    workflow.add_node("review", next_review_node)
+
+    # Add edges
+    workflow.add_edge(loaded, "analyze_all")
+    workflow.add_edge("analyze_all", "review")
+
+    # After an action is reviewed, move on to the next flagged profile
     workflow.add_conditional_edges(
-        "summarize",
+        "review",
         route_action,
         {
-            END: END
+            "execute": "execute",
+            "load": "load",
+            "summarize": "summarize",
+            "analyze": "review"
         }
     )
 
-    return workflow.compile() 
\ No newline at end of file
+    workflow.add_conditional_edges(
+        "execute",
+        route_action,
+        {
+            "analyze": "review",
+            END: END
+        }
+    )
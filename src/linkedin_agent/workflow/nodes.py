@@ -2,43 +2,126 @@
 LangGraph workflow nodes for LinkedIn profile analysis.
 """
 
-from typing import Dict
-from langchain_google_genai import ChatGoogleGenerativeAI
-from ..config.settings import GEMINI_API_KEY, LLM_MODEL, LLM_TEMPERATURE, LLM_MAX_TOKENS
-from .states import ProfileAnalysisState
-from .prompts import ANALYZE_PROFILE_PROMPT, SUMMARIZE_RESULTS_PROMPT
-
-# Initialize LLM with error handling
-if not GEMINI_API_KEY:
-    raise ValueError("GEMINI_API_KEY is not set. Please check your .env-dev file.")
-
-try:
-    llm = ChatGoogleGenerativeAI(
-        google_api_key=GEMINI_API_KEY,
-        model=LLM_MODEL,
-        temperature=LLM_TEMPERATURE,
-        max_output_tokens=LLM_MAX_TOKENS
-    )
-except Exception as e:
-    raise Exception(f"Failed to initialize ChatGoogleGenerativeAI: {str(e)}")
+import os
+from typing import Dict, List
+from ..config.settings import ANALYSIS_CONCURRENCY, ANALYSIS_BATCH_SIZE, ANALYSIS_CHUNK_SIZE, REVIEW_MODE
+from ..storage.jsonl import read_profiles, iter_profiles
+from ..storage.profile_store import is_profile_store, get_profile_store
+from ..storage.review_queue import get_review_queue
+from ..monitoring.metrics import METRICS
+from .states import ProfileAnalysisState, record_results, find_result, result_key
+from .prefilter import prefilter_profiles
+from .summary import summarize_results
+from .analysis import analyze_profile, analyze_profiles_concurrently, analyze_profiles_batched
+
+def _end_of_chunk(state: ProfileAnalysisState) -> str:
+    """Action to take once every profile of the current chunk is handled."""
+    if not state.get("profiles_exhausted"):
+        return "load_more"
+    return "done_processing"
+
+def _record_failures(state: ProfileAnalysisState, failed: List[Dict]) -> Dict:
+    """
+    Build the state update that reports profiles whose analysis failed.
+
+    Failed profiles get no result, so they stay pending in a profile store;
+    the entry point saves them for a retry when profiles come from JSONL.
+
+    Args:
+        state (ProfileAnalysisState): Current workflow state
+        failed (List[Dict]): Profiles whose analysis failed in this step
+
+    Returns:
+        Dict: Partial state update for ``failed_profiles`` and ``analysis_failures``
+    """
+    return {
+        "failed_profiles": failed,
+        "analysis_failures": state.get("analysis_failures", 0) + len(failed)
+    }
+
+def _failed_profiles(profiles: List[Dict], results: List[Dict]) -> List[Dict]:
+    """Profiles of a chunk left without a result by a concurrent or batched analysis."""
+    analyzed = {result_key(result) for result in results}
+    return [profile for profile in profiles if result_key(profile) not in analyzed]
 
 async def load_profiles_node(state: ProfileAnalysisState) -> Dict:
     """
-    Node to initialize profile analysis with data from JSON.
+    Node to load the next chunk of profiles to analyze.
+    
+    Profiles are streamed from ``profiles_source`` ANALYSIS_CHUNK_SIZE at a
+    time so memory stays bounded regardless of the file size. From a profile
+    store only profiles still pending analysis are read. Profiles given in
+    memory are analyzed in chunks of the same size, so each step only handles
+    the current chunk's results however large the input.
     """
     print("\n--- NODE: load_profiles_node ---")
-    if not state["profiles_data"]:
-        return {"error": "No profiles data provided"}
+    source = state.get("profiles_source")
+
+    if source:
+        offset = state.get("profiles_offset", 0)
+        if is_profile_store(source):
+            profiles, offset = get_profile_store(source).read_unanalyzed(
+                offset, ANALYSIS_CHUNK_SIZE, **(state.get("profiles_filter") or {})
+            )
+        else:
+            profiles, offset = read_profiles(source, offset, ANALYSIS_CHUNK_SIZE)
+        print(f"DEBUG: Loaded {len(profiles)} profiles from {source}")
+        update = {
+            "profiles_data": profiles,
+            "profiles_offset": offset,
+            "profiles_exhausted": len(profiles) < ANALYSIS_CHUNK_SIZE
+        }
+    else:
+        profiles_input = state.get("profiles_input")
+        update = {}
+        if profiles_input is None:
+            # profiles_data given without a source is the whole input; written once so
+            # checkpoints do not store it again with every chunk
+            profiles_input = update["profiles_input"] = state.get("profiles_data") or []
+        offset = state.get("profiles_offset", 0)
+        profiles = profiles_input[offset:offset + ANALYSIS_CHUNK_SIZE]
+        offset += len(profiles)
+        update.update({
+            "profiles_data": profiles,
+            "profiles_offset": offset,
+            "profiles_exhausted": offset >= len(profiles_input)
+        })
+
+    if not profiles and not state.get("profiles_offset"):
+        return {**update, "error": "No profiles data provided"}
     
+    # Results of earlier chunks are already in results_source, only this chunk's are kept
     return {
-        **state,
-        "current_profile_index": 0,
+        **update,
         "analysis_results": [],
+        "analysis_index": {},
+        "failed_profiles": [],
+        "current_profile_index": 0,
         "action_taken": "",
         "current_profile": None,
         "message_to_send": ""
     }
 
+async def prefilter_profiles_node(state: ProfileAnalysisState) -> Dict:
+    """
+    Node to skip profiles not worth an LLM call, scoring the chunk locally.
+    
+    Skipped profiles get their analysis results right away; only the rest
+    are left in ``profiles_data`` for the analyze node.
+    """
+    print("\n--- NODE: prefilter_profiles_node ---")
+    profiles = state["profiles_data"]
+
+    with METRICS.timer("prefilter"):
+        keep, skipped = prefilter_profiles(profiles)
+    METRICS.incr("prefilter_skipped", len(skipped))
+    print(f"DEBUG: Pre-filter kept {len(keep)} of {len(profiles)} profiles")
+
+    return {
+        "profiles_data": keep,
+        **record_results(state, skipped)
+    }
+
 async def analyze_profile_node(state: ProfileAnalysisState) -> Dict:
     """
     Node to analyze a single profile using LLM.
@@ -48,50 +131,122 @@ async def analyze_profile_node(state: ProfileAnalysisState) -> Dict:
     idx = state["current_profile_index"]
 
     if idx >= len(profiles):
-        print("DEBUG: No more profiles to analyze. Ending.")
-        return {"action_taken": "done_processing"}
+        print("DEBUG: No more profiles in this chunk.")
+        return {"action_taken": _end_of_chunk(state)}
 
     current_profile = profiles[idx]
     print(f"DEBUG: Analyzing profile: {current_profile.get('name')}")
 
     # Get LLM analysis
-    chain = ANALYZE_PROFILE_PROMPT | llm
-    response = await chain.ainvoke(current_profile)
-    
-    # Parse LLM response
-    lines = response.content.strip().split('\n')
-    action = next((line.split(':', 1)[1].strip() for line in lines if line.startswith('ACTION:')), 'skip')
-    reason = next((line.split(':', 1)[1].strip() for line in lines if line.startswith('REASON:')), '')
-    message = next((line.split(':', 1)[1].strip() for line in lines if line.startswith('MESSAGE:')), '')
-
-    analysis_result = {
-        **current_profile,
-        "action": action,
-        "reason": reason,
-        "message": message
-    }
+    try:
+        with METRICS.timer("profile_analysis"):
+            analysis_result = await analyze_profile(current_profile)
+    except Exception as e:
+        # Handled like a failed profile of a concurrent or batched analysis: reported, not fatal
+        METRICS.incr("analysis_failures")
+        print(f"❌ Analysis failed for {current_profile.get('name')}: {e}")
+        return {
+            "current_profile_index": idx + 1,
+            "action_taken": "skipped",
+            **_record_failures(state, [current_profile])
+        }
+    action = analysis_result["action"]
 
-    return {
+    update = {
         "current_profile": current_profile,
-        "message_to_send": message,
+        "message_to_send": analysis_result["message"],
         "action_taken": action,
-        "analysis_results": state["analysis_results"] + [analysis_result]
+        **record_results(state, [analysis_result])
+    }
+
+    # Profiles that need no review move straight on to the next one
+    if action not in ["send_message", "send_connection"]:
+        update["current_profile_index"] = idx + 1
+        update["action_taken"] = "skipped"
+
+    return update
+
+async def analyze_all_profiles_node(state: ProfileAnalysisState) -> Dict:
+    """
+    Node to analyze every profile concurrently using LLM.
+    """
+    print("\n--- NODE: analyze_all_profiles_node ---")
+    profiles = state["profiles_data"]
+    print(f"DEBUG: Analyzing {len(profiles)} profiles (concurrency {ANALYSIS_CONCURRENCY})")
+
+    with METRICS.timer("chunk_analysis", mode="parallel"):
+        results = await analyze_profiles_concurrently(profiles, ANALYSIS_CONCURRENCY)
+
+    # Review starts at the first result of this chunk
+    return {
+        "current_profile_index": len(state["analysis_results"]),
+        "action_taken": "analyzed",
+        **record_results(state, results),
+        **_record_failures(state, _failed_profiles(profiles, results))
+    }
+
+async def analyze_profile_batches_node(state: ProfileAnalysisState) -> Dict:
+    """
+    Node to analyze every profile in batched LLM requests.
+    """
+    print("\n--- NODE: analyze_profile_batches_node ---")
+    profiles = state["profiles_data"]
+    print(f"DEBUG: Analyzing {len(profiles)} profiles (batch size {ANALYSIS_BATCH_SIZE})")
+
+    with METRICS.timer("chunk_analysis", mode="batch"):
+        results = await analyze_profiles_batched(profiles, ANALYSIS_BATCH_SIZE, ANALYSIS_CONCURRENCY)
+
+    # Review starts at the first result of this chunk
+    return {
+        "current_profile_index": len(state["analysis_results"]),
+        "action_taken": "analyzed",
+        **record_results(state, results),
+        **_record_failures(state, _failed_profiles(profiles, results))
     }
 
+async def next_review_node(state: ProfileAnalysisState) -> Dict:
+    """
+    Node to select the next analyzed profile whose action needs human review.
+    """
+    print("\n--- NODE: next_review_node ---")
+    results = state["analysis_results"]
+
+    for idx in range(state["current_profile_index"], len(results)):
+        result = results[idx]
+        if result["action"] in ["send_message", "send_connection"]:
+            return {
+                "current_profile_index": idx,
+                "current_profile": result,
+                "message_to_send": result["message"],
+                "action_taken": result["action"]
+            }
+
+    print("DEBUG: No more profiles to review in this chunk.")
+    return {"current_profile_index": len(results), "action_taken": _end_of_chunk(state)}
+
 async def execute_action_node(state: ProfileAnalysisState) -> Dict:
     """
     Node to execute the decided action with human review.
+    
+    In ``queue`` review mode the decision is stored in the review queue and
+    the workflow moves on at once; ``inline`` mode prompts for approval.
     """
     print("\n--- NODE: execute_action_node ---")
     action = state["action_taken"]
     profile = state["current_profile"]
     message = state["message_to_send"]
 
+    if action in ["send_message", "send_connection"] and REVIEW_MODE == "queue":
+        result = find_result(state, profile) or {**profile, "action": action, "message": message}
+        get_review_queue().enqueue(result)
+        print(f"📥 Queued {action} for {profile['name']} for review")
+        return {"current_profile_index": state["current_profile_index"] + 1, "action_taken": "queued"}
+
     if action in ["send_message", "send_connection"]:
         print(f"\n--- HUMAN REVIEW ---")
         print(f"Profile: {profile['name']} ({profile['headline']})")
         print(f"Action: {action}")
-        print(f"Reason: {next((r['reason'] for r in state['analysis_results'] if r['name'] == profile['name']), '')}")
+        print(f"Reason: {(find_result(state, profile) or {}).get('reason', '')}")
         print(f"Message:\n{message}")
         
         user_input = input("Approve action? (y/n/s for skip): ").strip().lower()
@@ -111,21 +266,25 @@ async def execute_action_node(state: ProfileAnalysisState) -> Dict:
 async def summarize_results_node(state: ProfileAnalysisState) -> Dict:
     """
     Node to generate summary of analysis results.
+    
+    Reads every result of the run from ``results_source``; without one only
+    the current chunk's results are summarized.
     """
     print("\n--- NODE: summarize_results_node ---")
-    results = state["analysis_results"]
-    
-    stats = {
-        "total_profiles": len(results),
-        "messages_sent": sum(1 for r in results if r["action"] == "send_message"),
-        "connections_requested": sum(1 for r in results if r["action"] == "send_connection"),
-        "skipped": sum(1 for r in results if r["action"] == "skip")
-    }
-    
-    chain = SUMMARIZE_RESULTS_PROMPT | llm
-    response = await chain.ainvoke({**stats, "analysis_results": results})
+    source = state.get("results_source")
+    if source and os.path.exists(source):
+        # The run's results are streamed back from where they were appended
+        results = iter_profiles(source, offset=state.get("results_offset", 0))
+    else:
+        results = state["analysis_results"]
+
+    with METRICS.timer("summarize"):
+        summary, stats = await summarize_results(results)
     
     print("\n=== Analysis Summary ===")
-    print(response.content)
+    print(f"Profiles: {stats['total_profiles']} | Messages: {stats['messages_sent']} | "
+          f"Connections: {stats['connections_requested']} | Skipped: {stats['skipped']} | "
+          f"Failed: {state.get('analysis_failures', 0)}")
+    print(summary)
     
-    return {"action_taken": "completed"} 
\ No newline at end of file
+    return {"action_taken": "completed"} 
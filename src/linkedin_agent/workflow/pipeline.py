@@ -0,0 +1,113 @@
+"""
+Streaming pipeline that analyzes profiles while the crawl is still running.
+"""
+
+import asyncio
+import functools
+from typing import Callable, Dict, List, Optional
+
+from ..config.settings import ANALYSIS_CONCURRENCY, PIPELINE_QUEUE_SIZE, PREFILTER_ENABLED, SEARCH_MAX_PAGES
+from ..models.types import LinkedInProfile
+from ..monitoring.metrics import METRICS
+from ..tools.crawler import crawl_profiles
+from .analysis import analyze_profile
+from .prefilter import prefilter_profiles
+
+# Tells an analysis worker that the crawl has finished
+_DONE = object()
+
+async def prefilter_and_analyze(profile: Dict, prefilter: bool = PREFILTER_ENABLED) -> Dict:
+    """
+    Analyze one scraped profile, unless the local pre-filter already rejects it.
+
+    Args:
+        profile (Dict): Profile data with name, headline, company and designation
+        prefilter (bool): Score the profile locally before any LLM call
+
+    Returns:
+        Dict: Profile data merged with action, reason and message
+    """
+    if prefilter:
+        _, skipped = prefilter_profiles([profile])
+        if skipped:
+            METRICS.incr("prefilter_skipped")
+            return skipped[0]
+    with METRICS.timer("profile_analysis"):
+        return await analyze_profile(profile)
+
+async def run_pipeline(
+    query: str,
+    max_pages: int = SEARCH_MAX_PAGES,
+    url_filter: Optional[Callable[[str], bool]] = None,
+    on_profile: Optional[Callable[[LinkedInProfile], None]] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    concurrency: int = ANALYSIS_CONCURRENCY,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    prefilter: bool = PREFILTER_ENABLED
+) -> List[Dict]:
+    """
+    Crawl search results and analyze each profile as soon as it is extracted.
+
+    The blocking Selenium crawl runs in a thread executor; its extraction
+    workers hand every profile to the event loop through a bounded queue that
+    ``concurrency`` analysis workers drain. Scraping and LLM calls overlap, so
+    the run takes about as long as the slower of the two stages. When the
+    queue is full the extraction workers wait, so scraping never runs far
+    ahead of analysis.
+
+    Args:
+        query (str): Search query for finding LinkedIn members
+        max_pages (int): Maximum number of results pages to walk
+        url_filter (Optional[Callable[[str], bool]]): Returns False for URLs to skip
+        on_profile (Optional[Callable[[LinkedInProfile], None]]): Called from an
+            extraction thread with each profile before it is queued
+        on_result (Optional[Callable[[Dict], None]]): Called on the event loop
+            with each analysis result; profiles whose analysis fails are
+            reported and never passed on, and an exception it raises counts
+            as a failed analysis
+        concurrency (int): Maximum number of concurrent LLM requests
+        queue_size (int): Maximum number of profiles waiting for analysis
+        prefilter (bool): Skip profiles the local pre-filter rejects without an LLM call
+
+    Returns:
+        List[Dict]: Analysis results in completion order, without failed analyses
+            or results ``on_result`` failed to record
+    """
+    loop = asyncio.get_running_loop()
+    profile_queue: asyncio.Queue = asyncio.Queue(maxsize=max(queue_size, 1))
+    workers = max(concurrency, 1)
+    results: List[Dict] = []
+
+    def _enqueue(profile: LinkedInProfile):
+        if on_profile:
+            on_profile(profile)
+        asyncio.run_coroutine_threadsafe(profile_queue.put(profile), loop).result()
+
+    async def _consume():
+        while True:
+            profile = await profile_queue.get()
+            if profile is _DONE:
+                return
+            try:
+                result = await prefilter_and_analyze(profile, prefilter)
+                if on_result:
+                    on_result(result)
+            except Exception as e:
+                # Not recorded as a result, so the profile stays pending for a later run;
+                # the worker keeps draining the queue so the crawl never blocks on it
+                METRICS.incr("analysis_failures")
+                print(f"❌ Analysis failed for {profile.get('name')}: {e}")
+                continue
+            results.append(result)
+
+    consumers = [asyncio.create_task(_consume()) for _ in range(workers)]
+    try:
+        crawl = functools.partial(crawl_profiles, query, max_pages=max_pages, url_filter=url_filter, on_profile=_enqueue)
+        with METRICS.timer("pipeline_crawl"):
+            await loop.run_in_executor(None, crawl)
+    finally:
+        for _ in consumers:
+            await profile_queue.put(_DONE)
+        await asyncio.gather(*consumers)
+
+    return results
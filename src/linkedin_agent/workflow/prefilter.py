@@ -0,0 +1,99 @@
+"""
+Local keyword-coverage pre-scoring of profiles against the ideal customer profile.
+"""
+
+import re
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..config.settings import ICP_KEYWORDS, PREFILTER_THRESHOLD
+from ..tools.field_selectors import FIELD_NOT_FOUND
+
+# Profile fields scored against the ideal customer profile
+SCORED_FIELDS = ("headline", "designation", "company")
+
+# Words carrying no signal about the role or company
+_STOPWORDS = frozenset({"a", "an", "and", "at", "for", "in", "of", "on", "the", "to", "with"})
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+def _tokens(text: str) -> List[str]:
+    tokens = (token.strip(".") for token in _TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if token and token not in _STOPWORDS]
+
+def _profile_text(profile: Dict) -> str:
+    """Scored fields of a profile, without scraper placeholders."""
+    parts = []
+    for field in SCORED_FIELDS:
+        value = (profile.get(field) or "").strip()
+        if value and value != FIELD_NOT_FOUND.get(field):
+            parts.append(value)
+    return " ".join(parts)
+
+def score_profiles(profiles: Sequence[Dict], keywords: Sequence[str] = ICP_KEYWORDS) -> np.ndarray:
+    """
+    Score every profile against the ideal customer profile in one pass.
+    
+    A profile's score is its best coverage of a single keyword: the fraction
+    of that keyword's words found in its headline, designation and company.
+    The score depends only on the profile and the keywords, never on the
+    other profiles scored with it, so a profile scores the same in a workflow
+    chunk as on its own in the pipeline.
+    
+    Args:
+        profiles (Sequence[Dict]): Profiles to score
+        keywords (Sequence[str]): Ideal customer profile keywords or phrases
+        
+    Returns:
+        np.ndarray: One score in [0, 1] per profile
+    """
+    phrases = [set(tokens) for tokens in map(_tokens, keywords) if tokens]
+    if not profiles or not phrases:
+        return np.zeros(len(profiles))
+
+    vocabulary = {token: idx for idx, token in enumerate(dict.fromkeys(t for phrase in phrases for t in phrase))}
+    # Column k holds the weight of each word in keyword k, summing to 1
+    weights = np.zeros((len(vocabulary), len(phrases)))
+    for col, phrase in enumerate(phrases):
+        weights[[vocabulary[token] for token in phrase], col] = 1.0 / len(phrase)
+
+    present = np.zeros((len(profiles), len(vocabulary)))
+    for row, profile in enumerate(profiles):
+        cols = [vocabulary[token] for token in set(_tokens(_profile_text(profile))) if token in vocabulary]
+        present[row, cols] = 1.0
+
+    return (present @ weights).max(axis=1)
+
+def prefilter_profiles(
+    profiles: Sequence[Dict],
+    keywords: Sequence[str] = ICP_KEYWORDS,
+    threshold: float = PREFILTER_THRESHOLD
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Split profiles into those worth an LLM call and local skip decisions.
+    
+    Profiles with only placeholder fields are always skipped. With keywords
+    configured, so is every profile scoring below ``threshold``.
+    
+    Args:
+        profiles (Sequence[Dict]): Profiles to filter
+        keywords (Sequence[str]): Ideal customer profile keywords or phrases
+        threshold (float): Minimum score to reach the LLM
+        
+    Returns:
+        Tuple[List[Dict], List[Dict]]: Profiles to analyze, and skip results
+            for the others in the analysis result format
+    """
+    scores = score_profiles(profiles, keywords)
+    keep, skipped = [], []
+    for profile, score in zip(profiles, scores):
+        if not _profile_text(profile):
+            reason = "Pre-filter: no headline, designation or company to analyze"
+        elif keywords and score < threshold:
+            reason = f"Pre-filter: ideal customer profile score {score:.2f} below {threshold:.2f}"
+        else:
+            keep.append(profile)
+            continue
+        skipped.append({**profile, "action": "skip", "reason": reason, "message": ""})
+    return keep, skipped
@@ -26,18 +26,74 @@ ANALYZE_PROFILE_PROMPT = ChatPromptTemplate.from_messages([
     Based on this information, what action should be taken?""")
 ])
 
+BATCH_ANALYZE_PROFILES_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an AI assistant analyzing LinkedIn profiles for potential business opportunities.
+    For EACH profile, decide if this person would be a good fit for outreach.
+    If yes, suggest either 'send_message' or 'send_connection' and generate a personalized message.
+    If no, suggest 'skip'.
+    
+    Respond ONLY with a JSON array containing one object per profile, in the same order:
+    [{{"profile_url": "<profile_url>", "action": "<action_type>", "reason": "<brief reason for your decision>", "message": "<your_personalized_message>"}}]
+    
+    Copy each profile_url exactly as given. Keep messages professional and concise (max 150 words).
+    """),
+    ("user", """Profiles (JSON):
+    {profiles}
+    
+    Based on this information, what action should be taken for each profile?""")
+])
+
 SUMMARIZE_RESULTS_PROMPT = ChatPromptTemplate.from_messages([
     ("system", """You are an AI assistant summarizing the results of LinkedIn profile analysis.
     Create a concise summary of the profiles analyzed and actions taken.
     Include key statistics and any notable patterns or insights found.
     """),
-    ("user", """Analysis Results:
+    ("user", """Analysis Results (name | designation | company | action | reason):
     {analysis_results}
     
     Total Profiles: {total_profiles}
     Messages Sent: {messages_sent}
     Connections Requested: {connections_requested}
     Skipped: {skipped}
+    Top Companies: {top_companies}
+    Top Designations: {top_designations}
     
     Please provide a summary of the results.""")
-]) 
\ No newline at end of file
+])
+
+SUMMARIZE_CHUNK_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an AI assistant summarizing one part of the results of a LinkedIn profile analysis.
+    Describe the notable patterns in this part: who was targeted or skipped and why.
+    Keep it under 150 words; the statistics of the whole run are reported separately.
+    """),
+    ("user", """Analysis Results (name | designation | company | action | reason):
+    {analysis_results}
+    
+    Total Profiles: {total_profiles}
+    Messages Sent: {messages_sent}
+    Connections Requested: {connections_requested}
+    Skipped: {skipped}
+    Top Companies: {top_companies}
+    Top Designations: {top_designations}
+    
+    Please summarize this part of the results.""")
+])
+
+MERGE_SUMMARIES_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an AI assistant summarizing the results of LinkedIn profile analysis.
+    Combine the summaries of the parts of a run into one concise summary of the profiles analyzed
+    and actions taken. Include key statistics and any notable patterns or insights found.
+    """),
+    ("user", """Partial Summaries:
+    {summaries}
+    
+    Statistics of the whole run:
+    Total Profiles: {total_profiles}
+    Messages Sent: {messages_sent}
+    Connections Requested: {connections_requested}
+    Skipped: {skipped}
+    Top Companies: {top_companies}
+    Top Designations: {top_designations}
+    
+    Please provide a summary of the results.""")
+])
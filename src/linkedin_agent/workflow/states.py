@@ -2,14 +2,96 @@
 State definitions for the LinkedIn agent workflow.
 """
 
-from typing import TypedDict, List, Dict, Union
+from typing import TypedDict, List, Dict, Optional, Tuple, Union
 
 class ProfileAnalysisState(TypedDict):
-    """State for profile analysis workflow."""
-    profiles_data: List[Dict]  # List of profiles from JSON
+    """
+    State for profile analysis workflow.
+
+    Profiles are analyzed ANALYSIS_CHUNK_SIZE at a time, whether they are
+    streamed from ``profiles_source`` or given in memory. Only the current
+    chunk's results are kept in the state, which is checkpointed after every
+    step; the full record of a run lives in ``results_source`` (and the
+    profile store), so every step costs the same however many profiles are
+    analyzed. Without a ``results_source`` the summary covers the last chunk.
+    """
+    profiles_data: List[Dict]  # Current chunk of profiles being analyzed; the whole input on the first load without profiles_source
+    profiles_input: List[Dict]  # In-memory profiles to analyze when there is no profiles_source
+    profiles_source: str  # JSONL file or profile store profiles are streamed from, empty to use profiles_data as-is
+    profiles_filter: Dict[str, str]  # company/designation filters applied when reading a profile store
+    profiles_offset: int  # Read position in profiles_source (byte offset, or last row id of a store) or profiles_input
+    profiles_exhausted: bool  # Whether profiles_source has no more profiles
     current_profile_index: int  # Current profile being processed
-    analysis_results: List[Dict]  # Analysis results for each profile
+    analysis_results: List[Dict]  # Analysis results of the current chunk, reset on every load
+    analysis_index: Dict[str, int]  # profile_url -> position in analysis_results
+    results_source: str  # JSONL file the run's results are appended to, read back for the summary
+    results_offset: int  # Byte offset in results_source where this run's results start
+    failed_profiles: List[Dict]  # Profiles whose analysis failed in the last analyze step
+    analysis_failures: int  # Profiles whose analysis failed in this run
     action_taken: str  # Current action status
     error: str  # Error message if any
     current_profile: Union[Dict, None]  # Current profile being analyzed
-    message_to_send: str  # Generated message if any 
\ No newline at end of file
+    message_to_send: str  # Generated message if any
+
+def result_key(profile: Dict) -> str:
+    """Key identifying a profile in the analysis index."""
+    return profile.get("profile_url") or profile.get("name", "")
+
+def record_results(state: ProfileAnalysisState, results: List[Dict]) -> Dict:
+    """
+    Build the state update that adds analysis results to the chunk and indexes them.
+
+    The chunk's results are at most ANALYSIS_CHUNK_SIZE, so copying them
+    costs the same on every step regardless of the run size.
+
+    Args:
+        state (ProfileAnalysisState): Current workflow state
+        results (List[Dict]): New analysis results
+
+    Returns:
+        Dict: Partial state update for ``analysis_results`` and ``analysis_index``
+    """
+    chunk_results = state.get("analysis_results") or []
+    start = len(chunk_results)
+    return {
+        "analysis_results": chunk_results + results,
+        "analysis_index": {
+            **(state.get("analysis_index") or {}),
+            **{result_key(result): start + offset for offset, result in enumerate(results)}
+        }
+    }
+
+def new_results(update: Dict, written: int) -> Tuple[List[Dict], int]:
+    """
+    Get the results a streamed node update adds to the current chunk.
+
+    Nodes write the chunk's whole result list, and loading a chunk resets
+    it, so the results not seen yet are those past ``written``.
+
+    Args:
+        update (Dict): State update of one node, as streamed by the workflow
+        written (int): Results of the current chunk already handled
+
+    Returns:
+        Tuple[List[Dict], int]: The new results and the updated ``written`` count
+    """
+    if "analysis_results" not in update:
+        return [], written
+    chunk_results = update["analysis_results"] or []
+    return chunk_results[written:], len(chunk_results)
+
+def find_result(state: ProfileAnalysisState, profile: Dict) -> Optional[Dict]:
+    """
+    Look up the analysis result of a profile of the current chunk in O(1).
+
+    Args:
+        state (ProfileAnalysisState): Current workflow state
+        profile (Dict): Profile to look up
+
+    Returns:
+        Optional[Dict]: The analysis result, or None if the profile was not analyzed
+    """
+    position = (state.get("analysis_index") or {}).get(result_key(profile))
+    if position is None:
+        return None
+    return state["analysis_results"][position]
@@ -0,0 +1,187 @@
+"""
+Map-reduce summarization of analysis results.
+
+Statistics are computed locally in a single pass; the LLM only sees compact
+chunks of results, summarized concurrently, and then merges the partial
+summaries, so the size of every prompt, and the memory used, stays bounded
+however large the run.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..config.settings import ANALYSIS_CONCURRENCY, SUMMARY_CHUNK_SIZE, SUMMARY_MERGE_FANIN, SUMMARY_TOP_N
+from ..tools.field_selectors import FIELD_NOT_FOUND
+from .analysis import get_llm, invoke_llm
+from .prompts import SUMMARIZE_RESULTS_PROMPT, SUMMARIZE_CHUNK_PROMPT, MERGE_SUMMARIES_PROMPT
+
+# Fields of a result shown to the LLM; messages are left out to keep prompts small
+_SUMMARY_FIELDS = ("name", "designation", "company", "action", "reason")
+
+def _known(result: Dict, field: str) -> str:
+    """Field value of a result, empty for scraper placeholders."""
+    value = (result.get(field) or "").strip()
+    return "" if value == FIELD_NOT_FOUND.get(field) else value
+
+class SummaryStats:
+    """
+    Run statistics accumulated one result at a time.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.actions: Counter = Counter()
+        self.companies: Counter = Counter()
+        self.designations: Counter = Counter()
+
+    def add(self, result: Dict):
+        """Count one analysis result."""
+        self.total += 1
+        self.actions[result.get("action", "skip")] += 1
+        company = _known(result, "company")
+        if company:
+            self.companies[company] += 1
+        designation = _known(result, "designation")
+        if designation:
+            self.designations[designation] += 1
+
+    def as_dict(self, top_n: int = SUMMARY_TOP_N) -> Dict:
+        """
+        Total and per-action counts, plus the most frequent companies and
+        designations as (value, count) pairs.
+        """
+        return {
+            "total_profiles": self.total,
+            "messages_sent": self.actions["send_message"],
+            "connections_requested": self.actions["send_connection"],
+            "skipped": self.actions["skip"],
+            "top_companies": self.companies.most_common(top_n),
+            "top_designations": self.designations.most_common(top_n)
+        }
+
+def compute_summary_stats(results: Iterable[Dict], top_n: int = SUMMARY_TOP_N) -> Dict:
+    """
+    Compute the statistics of a run in one pass over its results.
+
+    Args:
+        results (Iterable[Dict]): Analysis results
+        top_n (int): Number of companies and designations to rank
+
+    Returns:
+        Dict: See ``SummaryStats.as_dict``
+    """
+    stats = SummaryStats()
+    for result in results:
+        stats.add(result)
+    return stats.as_dict(top_n)
+
+def _format_ranking(ranking: List[Tuple[str, int]]) -> str:
+    return ", ".join(f"{value} ({count})" for value, count in ranking) or "none"
+
+def _format_results(results: Sequence[Dict]) -> str:
+    """One compact line per result."""
+    return "\n".join(" | ".join(_known(result, field) or "-" for field in _SUMMARY_FIELDS) for result in results)
+
+def _prompt_stats(stats: Dict) -> Dict:
+    """Statistics as prompt template variables."""
+    return {
+        **stats,
+        "top_companies": _format_ranking(stats["top_companies"]),
+        "top_designations": _format_ranking(stats["top_designations"])
+    }
+
+async def summarize_results(
+    results: Iterable[Dict],
+    chunk_size: int = SUMMARY_CHUNK_SIZE,
+    merge_fanin: int = SUMMARY_MERGE_FANIN,
+    concurrency: int = ANALYSIS_CONCURRENCY
+) -> Tuple[str, Dict]:
+    """
+    Summarize analysis results with a bounded prompt size.
+
+    Results are consumed in a single pass, so they can be streamed from a
+    file with at most a few chunks in memory. Runs of at most ``chunk_size``
+    results are summarized in one request. Larger runs are split into chunks
+    summarized concurrently; the partial summaries are then merged
+    ``merge_fanin`` at a time until one remains.
+
+    Args:
+        results (Iterable[Dict]): Analysis results
+        chunk_size (int): Results per summary request
+        merge_fanin (int): Partial summaries per merge request
+        concurrency (int): Maximum number of concurrent LLM requests
+
+    Returns:
+        Tuple[str, Dict]: The summary text and the locally computed statistics
+    """
+    chunk_size = max(chunk_size, 1)
+    merge_fanin = max(merge_fanin, 2)
+    stats = SummaryStats()
+    # Bounds the chunks held by in-flight requests as well as the requests themselves
+    slots = asyncio.Semaphore(max(concurrency, 1))
+    tasks: List[asyncio.Task] = []
+
+    async def _summarize_chunk(chunk: Sequence[Dict]) -> str:
+        try:
+            messages = SUMMARIZE_CHUNK_PROMPT.format_messages(
+                **_prompt_stats(compute_summary_stats(chunk)),
+                analysis_results=_format_results(chunk)
+            )
+            response = await invoke_llm(get_llm(), messages, kind="summarize_chunk")
+            return response.content
+        finally:
+            slots.release()
+
+    async def _submit(chunk: Sequence[Dict]):
+        await slots.acquire()
+        tasks.append(asyncio.create_task(_summarize_chunk(chunk)))
+
+    # The first full chunk is held back until a second one shows the run needs more than one request
+    held: Optional[List[Dict]] = None
+    chunk: List[Dict] = []
+    for result in results:
+        stats.add(result)
+        chunk.append(result)
+        if len(chunk) < chunk_size:
+            continue
+        if held is None and not tasks:
+            held = chunk
+        else:
+            if held is not None:
+                await _submit(held)
+                held = None
+            await _submit(chunk)
+        chunk = []
+
+    prompt_stats = _prompt_stats(stats.as_dict())
+    if not tasks and not (held and chunk):
+        messages = SUMMARIZE_RESULTS_PROMPT.format_messages(
+            **prompt_stats,
+            analysis_results=_format_results(held or chunk)
+        )
+        response = await invoke_llm(get_llm(), messages, kind="summarize")
+        return response.content, stats.as_dict()
+
+    for remaining in (held, chunk):
+        if remaining:
+            await _submit(remaining)
+    print(f"DEBUG: Summarizing {stats.total} results in {len(tasks)} chunks")
+    summaries = list(await asyncio.gather(*tasks))
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _merge(group: Sequence[str]) -> str:
+        messages = MERGE_SUMMARIES_PROMPT.format_messages(
+            **prompt_stats,
+            summaries="\n\n".join(f"Part {idx}:\n{summary}" for idx, summary in enumerate(group, 1))
+        )
+        async with semaphore:
+            response = await invoke_llm(get_llm(), messages, kind="summarize_merge")
+        return response.content
+
+    while len(summaries) > 1:
+        groups = [summaries[i:i + merge_fanin] for i in range(0, len(summaries), merge_fanin)]
+        summaries = list(await asyncio.gather(*(_merge(group) for group in groups)))
+
+    return summaries[0], stats.as_dict()
@@ -0,0 +1,106 @@
+"""
+Entry point for the streaming scrape-and-analyze pipeline.
+Profiles are analyzed as soon as they are scraped instead of after the whole crawl.
+"""
+
+import asyncio
+import argparse
+from typing import Dict, Optional
+from linkedin_agent.workflow.pipeline import run_pipeline
+from linkedin_agent.workflow.summary import summarize_results
+from linkedin_agent.browser.selenium_manager import SeleniumManager
+from linkedin_agent.storage.jsonl import JsonlWriter
+from linkedin_agent.storage.profile_store import get_profile_store
+from linkedin_agent.storage.review_queue import get_review_queue
+from linkedin_agent.storage.seen_index import SeenProfileIndex
+from linkedin_agent.monitoring.metrics import METRICS
+from linkedin_agent.config.settings import OUTPUT_FILE, ANALYSIS_OUTPUT_FILE, PROFILE_STORAGE
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn profiles and analyze them as they arrive.")
+    parser.add_argument("--query", help="Search query (prompted for if omitted)")
+    return parser.parse_args()
+
+async def pipeline(query: str):
+    """
+    Scrape the profiles found for ``query`` and analyze them concurrently.
+
+    Each profile is saved (upserted into the profile store or appended to
+    JSONL) as soon as it is scraped; each result is appended to
+    ANALYSIS_OUTPUT_FILE, recorded on its stored profile, and suggested
+    messages/connection requests are queued for review.
+
+    Args:
+        query (str): Search query for finding LinkedIn members
+    """
+    seen_index = SeenProfileIndex()
+    store = get_profile_store() if PROFILE_STORAGE == "sqlite" else None
+    profile_writer: Optional[JsonlWriter] = None if store else JsonlWriter(OUTPUT_FILE)
+    review_queue = get_review_queue()
+    queued = 0
+    scraped = 0
+
+    def _save(profile: Dict):
+        nonlocal scraped
+        if store:
+            store.upsert_profile(profile)
+        else:
+            profile_writer.write(profile)
+        seen_index.mark_scraped(profile["profile_url"])
+        scraped += 1
+
+    try:
+        with JsonlWriter(ANALYSIS_OUTPUT_FILE) as writer:
+            def _record(result: Dict):
+                nonlocal queued
+                writer.write(result)
+                if store:
+                    store.record_analysis(result)
+                # Inline review would stall the pipeline, so decisions always go to the queue
+                if result["action"] in ["send_message", "send_connection"]:
+                    review_queue.enqueue(result)
+                    queued += 1
+
+            results = await run_pipeline(
+                query,
+                url_filter=lambda url: not seen_index.is_fresh(url),
+                on_profile=_save,
+                on_result=_record
+            )
+
+        failed = scraped - len(results)
+        if not scraped:
+            print("❌ No new profiles scraped.")
+            return
+        if failed:
+            print(f"\n⚠️ {failed} of {scraped} scraped profiles failed analysis; they are saved and can be "
+                  f"analyzed again with python src/analyze_profiles.py")
+        if not results:
+            return
+
+        print(f"\n✅ {len(results)} profiles analyzed, results saved to {ANALYSIS_OUTPUT_FILE}.")
+        print(f"📥 {queued} actions queued for review: python src/review_queue.py list")
+
+        summary, _ = await summarize_results(results)
+        print("\n=== Analysis Summary ===")
+        print(summary)
+
+    except Exception as e:
+        print("❌ An error occurred during execution:")
+        print(e)
+    finally:
+        if profile_writer:
+            profile_writer.close()
+        seen_index.close()
+        SeleniumManager.close()
+        json_path, prom_path = METRICS.write_reports("pipeline")
+        print(f"📊 Metrics written to {json_path} and {prom_path}")
+
+if __name__ == "__main__":
+    args = parse_args()
+    search_input = args.query or input("Enter the search query: ")
+    try:
+        asyncio.run(pipeline(search_input))
+    except KeyboardInterrupt:
+        print("\n⏸️ Interrupted. Profiles and results saved so far are kept.")
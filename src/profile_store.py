@@ -0,0 +1,54 @@
+"""
+Profile store CLI.
+Imports legacy JSON/JSONL files into the profile store and exports it back.
+"""
+
+import argparse
+from linkedin_agent.storage.profile_store import ProfileStore, ANALYSIS_STATUSES
+from linkedin_agent.config.settings import OUTPUT_FILE
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Manage the local LinkedIn profile store.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Upsert profiles from a JSON/JSONL file")
+    import_parser.add_argument("path", nargs="?", default=OUTPUT_FILE, help="File to import")
+
+    export_parser = subparsers.add_parser("export", help="Export profiles to a JSON/JSONL file")
+    export_parser.add_argument("path", nargs="?", default=OUTPUT_FILE, help="Output file; .json writes a JSON array")
+    export_parser.add_argument("--status", choices=ANALYSIS_STATUSES, help="Only profiles with this analysis status")
+    export_parser.add_argument("--company", help="Only profiles at this company (case-insensitive)")
+    export_parser.add_argument("--designation", help="Only profiles with this designation (case-insensitive)")
+    export_parser.add_argument("--with-analysis", action="store_true", help="Include action, reason and message")
+
+    subparsers.add_parser("stats", help="Show profile counts per analysis status")
+    return parser.parse_args()
+
+def main():
+    """Main function to run the profile store CLI."""
+    args = parse_args()
+    store = ProfileStore()
+    try:
+        if args.command == "import":
+            count = store.import_file(args.path)
+            print(f"✅ Imported {count} profiles from {args.path} into {store.path}.")
+
+        elif args.command == "export":
+            count = store.export(
+                args.path,
+                status=args.status,
+                include_analysis=args.with_analysis,
+                company=args.company,
+                designation=args.designation
+            )
+            print(f"✅ Exported {count} profiles to {args.path}.")
+
+        elif args.command == "stats":
+            for status, count in sorted(store.counts().items()):
+                print(f"{status}: {count}")
+    finally:
+        store.close()
+
+if __name__ == "__main__":
+    main()
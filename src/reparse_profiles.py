@@ -0,0 +1,42 @@
+"""
+Re-parse archived profile pages with the current selectors.
+Rebuilds the stored profiles without revisiting LinkedIn.
+"""
+
+from linkedin_agent.tools.html_parser import reparse_archive
+from linkedin_agent.storage.jsonl import JsonlWriter
+from linkedin_agent.storage.profile_store import ProfileStore
+from linkedin_agent.config.settings import HTML_ARCHIVE_DIR, OUTPUT_FILE, PROFILE_STORAGE, PROFILE_STORE_PATH
+
+def main():
+    """Re-parse every archived page and save the results to the profile store or JSONL."""
+    try:
+        print(f"\n📂 Re-parsing archived pages from {HTML_ARCHIVE_DIR}...")
+        profiles = reparse_archive(HTML_ARCHIVE_DIR)
+
+        if not profiles:
+            print("❌ No archived pages found.")
+            return
+
+        if PROFILE_STORAGE == "sqlite":
+            # Profiles whose fields changed go back to pending analysis
+            store = ProfileStore(PROFILE_STORE_PATH)
+            try:
+                store.upsert_profiles(profiles)
+            finally:
+                store.close()
+            output = PROFILE_STORE_PATH
+        else:
+            with JsonlWriter(OUTPUT_FILE, append=False) as writer:
+                for profile in profiles:
+                    writer.write(profile)
+            output = OUTPUT_FILE
+
+        print(f"\n✅ Re-parsed {len(profiles)} profiles into {output}.")
+
+    except Exception as e:
+        print("❌ An error occurred during re-parsing:")
+        print(e)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Review CLI for queued outreach decisions.
+Lets an operator approve or reject analysis decisions in batches.
+"""
+
+import argparse
+from linkedin_agent.storage.review_queue import ReviewQueue
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Review queued LinkedIn outreach decisions.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def _add_filters(sub: argparse.ArgumentParser):
+        sub.add_argument("--company", help="Only items for this company (case-insensitive)")
+        sub.add_argument("--action", choices=["send_message", "send_connection"], help="Only items proposing this action")
+
+    list_parser = subparsers.add_parser("list", help="List queued items")
+    _add_filters(list_parser)
+    list_parser.add_argument("--status", default="pending", help="Item status, or 'all'")
+    list_parser.add_argument("--limit", type=int, help="Maximum number of items")
+
+    for decision in ("approve", "reject"):
+        decision_parser = subparsers.add_parser(decision, help=f"{decision.capitalize()} pending items in bulk")
+        _add_filters(decision_parser)
+        decision_parser.add_argument("--id", type=int, nargs="+", dest="ids", help="Item ids")
+        decision_parser.add_argument("--all", action="store_true", help="Apply to every pending item")
+
+    interactive_parser = subparsers.add_parser("interactive", help="Review pending items one by one")
+    _add_filters(interactive_parser)
+
+    subparsers.add_parser("stats", help="Show item counts per status")
+    return parser.parse_args()
+
+def print_item(item: dict):
+    """Print a single review item."""
+    print(f"\n[{item['id']}] {item['name']} ({item['headline']})")
+    print(f"Company: {item['company']} | Designation: {item['designation']}")
+    print(f"Action: {item['action']} | Status: {item['status']}")
+    print(f"Reason: {item['reason']}")
+    print(f"Message:\n{item['message']}")
+
+def review_interactively(queue: ReviewQueue, company: str = None, action: str = None):
+    """Walk through pending items, prompting for a decision on each."""
+    decisions = {"y": "approved", "n": "rejected", "s": "skipped"}
+    for item in queue.list_items(company=company, action=action):
+        print_item(item)
+        user_input = input("Approve action? (y/n/s for skip, q to quit): ").strip().lower()
+        if user_input == "q":
+            break
+        decision = decisions.get(user_input, "rejected")
+        queue.decide(decision, ids=[item["id"]])
+        print(f"{'✅' if decision == 'approved' else '⏭️' if decision == 'skipped' else '❌'} {item['name']}: {decision}")
+
+def main():
+    """Main function to run the review CLI."""
+    args = parse_args()
+    queue = ReviewQueue()
+    try:
+        if args.command == "list":
+            status = None if args.status == "all" else args.status
+            items = queue.list_items(status=status, company=args.company, action=args.action, limit=args.limit)
+            for item in items:
+                print_item(item)
+            print(f"\n{len(items)} items.")
+
+        elif args.command in ("approve", "reject"):
+            if not (args.all or args.ids or args.company or args.action):
+                print("❌ Specify --id, --company, --action or --all.")
+                return
+            decision = "approved" if args.command == "approve" else "rejected"
+            count = queue.decide(decision, company=args.company, action=args.action, ids=args.ids)
+            print(f"✅ {count} items {decision}.")
+
+        elif args.command == "interactive":
+            review_interactively(queue, company=args.company, action=args.action)
+
+        elif args.command == "stats":
+            for status, count in sorted(queue.counts().items()):
+                print(f"{status}: {count}")
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    main()
@@ -3,46 +3,59 @@ LinkedIn profile scraper main script.
 Searches and extracts profile information based on search query.
 """
 
-import json
-from linkedin_agent.tools.linkedin_tools import search_linkedin_profiles, extract_profile_data
+from linkedin_agent.tools.crawler import crawl_profiles
 from linkedin_agent.browser.selenium_manager import SeleniumManager
-from linkedin_agent.config.settings import OUTPUT_FILE
+from linkedin_agent.storage.jsonl import JsonlWriter
+from linkedin_agent.storage.profile_store import ProfileStore
+from linkedin_agent.storage.seen_index import SeenProfileIndex
+from linkedin_agent.monitoring.metrics import METRICS
+from linkedin_agent.config.settings import OUTPUT_FILE, PROFILE_STORAGE, PROFILE_STORE_PATH
 
 def main():
     """Main function to run the LinkedIn profile scraper."""
+    seen_index = SeenProfileIndex()
     try:
         # Get search query from user
         search_input = input("Enter the search query: ")
 
-        # Step 1: Search and collect profile URLs
-        profile_urls = search_linkedin_profiles(search_input)
-        
-        if not profile_urls:
-            print("❌ No profile links found.")
-            return
+        # Search result pages and profiles are processed concurrently; profiles
+        # scraped within the freshness window are skipped, and each extracted
+        # profile is saved (upserted into the profile store or appended to
+        # JSONL) as soon as it completes
+        if PROFILE_STORAGE == "sqlite":
+            output, sink = PROFILE_STORE_PATH, ProfileStore(PROFILE_STORE_PATH)
+            save_profile = sink.upsert_profile
+        else:
+            output, sink = OUTPUT_FILE, JsonlWriter(OUTPUT_FILE)
+            save_profile = sink.write
+
+        try:
+            def _save(profile):
+                save_profile(profile)
+                seen_index.mark_scraped(profile["profile_url"])
 
-        # Step 2: Process each profile
-        all_profiles_data = []
-        
-        for href in profile_urls:
-            try:
-                profile_data = extract_profile_data(href)
-                all_profiles_data.append(profile_data)
-            except Exception as e:
-                print(f"❌ Error processing profile {href}:")
-                print(e)
+            all_profiles_data = crawl_profiles(
+                search_input,
+                url_filter=lambda url: not seen_index.is_fresh(url),
+                on_profile=_save
+            )
+        finally:
+            sink.close()
 
-        # Step 3: Save results to JSON
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            json.dump(all_profiles_data, f, ensure_ascii=False, indent=4)
+        if not all_profiles_data:
+            print("❌ No new profiles scraped.")
+            return
 
-        print(f"\n✅ All data saved to {OUTPUT_FILE}.")
+        print(f"\n✅ {len(all_profiles_data)} profiles saved to {output}.")
 
     except Exception as e:
         print("❌ An error occurred during execution:")
         print(e)
     finally:
+        seen_index.close()
         SeleniumManager.close()
+        json_path, prom_path = METRICS.write_reports("scrape")
+        print(f"📊 Metrics written to {json_path} and {prom_path}")
 
 if __name__ == "__main__":
     main() 
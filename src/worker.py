@@ -0,0 +1,257 @@
+"""
+Distributed scrape and analysis workers over the shared job queue.
+Any number of workers of each role can run, on one machine or several
+containers sharing the queue and profile store databases.
+"""
+
+import os
+import time
+import socket
+import asyncio
+import argparse
+import threading
+from typing import Dict
+from linkedin_agent.workflow.pipeline import prefilter_and_analyze
+from linkedin_agent.tools.html_parser import ProfileParserPool
+from linkedin_agent.tools.linkedin_tools import (
+    iter_search_result_pages,
+    extract_pooled_profile,
+    capture_pooled_profile,
+    finish_parsed_profile
+)
+from linkedin_agent.browser.selenium_manager import SeleniumManager
+from linkedin_agent.storage.job_queue import JOB_KINDS, get_job_queue
+from linkedin_agent.storage.jsonl import JsonlWriter
+from linkedin_agent.storage.profile_store import get_profile_store
+from linkedin_agent.storage.review_queue import get_review_queue
+from linkedin_agent.storage.seen_index import SeenProfileIndex
+from linkedin_agent.monitoring.metrics import METRICS
+from linkedin_agent.scheduling.rate_scheduler import SCHEDULER
+from linkedin_agent.config.settings import (
+    OUTPUT_FILE,
+    ANALYSIS_OUTPUT_FILE,
+    PROFILE_STORAGE,
+    SEARCH_MAX_PAGES,
+    SCRAPE_CONCURRENCY,
+    ANALYSIS_CONCURRENCY,
+    EXTRACTION_MODE,
+    WORKER_POLL_INTERVAL,
+    JOB_QUEUE_PATH
+)
+
+# Identifies this process in the leases it holds
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}"
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run scrape/analysis workers over the shared job queue.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = subparsers.add_parser("search", help="Queue a search query for the scrape workers")
+    search_parser.add_argument("query", help="Search query for finding LinkedIn members")
+    search_parser.add_argument("--max-pages", type=int, default=SEARCH_MAX_PAGES, help="Results pages to walk")
+
+    for role in ("scrape", "analyze"):
+        role_parser = subparsers.add_parser(role, help=f"Run a {role} worker")
+        role_parser.add_argument("--exit-when-idle", action="store_true", help="Stop once no job is ready")
+
+    retry_parser = subparsers.add_parser("retry", help="Queue failed jobs again")
+    retry_parser.add_argument("--kind", choices=JOB_KINDS, help="Only jobs of this kind")
+
+    subparsers.add_parser("stats", help="Show job counts per kind and status")
+    return parser.parse_args()
+
+def run_scrape_worker(exit_when_idle: bool = False):
+    """
+    Lease search and scrape jobs until stopped.
+
+    One thread pages through the results of leased search jobs and queues a
+    scrape job per profile URL not scraped within the freshness window; one
+    thread per pooled tab extracts the profiles of leased scrape jobs, saves
+    them and queues their analysis. Page loads draw on rate limits shared
+    with the other workers through the job queue database.
+
+    Args:
+        exit_when_idle (bool): Return once no search or scrape job is ready
+    """
+    queue = get_job_queue()
+    SCHEDULER.share(JOB_QUEUE_PATH)
+    # Other workers mark profiles too, so every check goes to the shared database
+    seen_index = SeenProfileIndex(bloom=False)
+    store = get_profile_store() if PROFILE_STORAGE == "sqlite" else None
+    profile_writer = None if store else JsonlWriter(OUTPUT_FILE)
+    pool = SeleniumManager.get_pool()
+    pool.start()
+    workers = max(min(SCRAPE_CONCURRENCY or pool.size, pool.size), 1)
+    parser = ProfileParserPool() if EXTRACTION_MODE == "offline" else None
+    searching = threading.Event()
+    searching.set()
+
+    def _search():
+        try:
+            while True:
+                job = queue.lease("search", WORKER_ID)
+                if job is None:
+                    if exit_when_idle:
+                        return
+                    time.sleep(WORKER_POLL_INTERVAL)
+                    continue
+                query = job["payload"]["query"]
+                print(f"🔎 Searching: {query}")
+                try:
+                    found = queued = 0
+                    pages = iter_search_result_pages(
+                        query, job["payload"].get("max_pages", SEARCH_MAX_PAGES), raise_errors=True
+                    )
+                    for page_urls in pages:
+                        for profile_url in sorted(page_urls):
+                            found += 1
+                            if seen_index.is_fresh(profile_url):
+                                continue
+                            if queue.enqueue("scrape", profile_url, {"profile_url": profile_url}, requeue=True):
+                                queued += 1
+                        if not queue.extend(job):
+                            # The lease expired, so the search may already be running elsewhere
+                            print(f"⚠️ Lost the lease on search {query}, stopping")
+                            pages.close()
+                            break
+                    else:
+                        queue.complete(job, {"found": found, "queued": queued})
+                        print(f"🔎 {query}: {found} profiles found, {queued} queued for scraping")
+                except Exception as e:
+                    print(f"❌ Search failed for {query}: {e}")
+                    queue.fail(job, str(e))
+        finally:
+            searching.clear()
+
+    def _extract():
+        while True:
+            job = queue.lease("scrape", WORKER_ID)
+            if job is None:
+                if exit_when_idle and not searching.is_set():
+                    return
+                time.sleep(WORKER_POLL_INTERVAL)
+                continue
+            profile_url = job["payload"]["profile_url"]
+            if parser:
+                # The tab is back in the pool while the page is parsed
+                future = capture_pooled_profile(pool, parser, profile_url)
+                profile = finish_parsed_profile(profile_url, future) if future else None
+            else:
+                profile = extract_pooled_profile(pool, profile_url)
+            if profile is None:
+                queue.fail(job, "Profile extraction failed")
+                continue
+            # Saves are keyed by profile URL, so a job retried elsewhere writes the same rows
+            if store:
+                store.upsert_profile(profile)
+            else:
+                profile_writer.write(profile)
+            seen_index.mark_scraped(profile["profile_url"])
+            queue.enqueue("analyze", profile["profile_url"], profile, requeue=True)
+            queue.complete(job)
+
+    threads = [threading.Thread(target=_search, name="search-worker", daemon=True)]
+    threads += [threading.Thread(target=_extract, name=f"scrape-worker-{i}", daemon=True) for i in range(workers)]
+    print(f"🚀 Scrape worker {WORKER_ID} started with {workers} extraction threads")
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if parser:
+            parser.close()
+        if profile_writer:
+            profile_writer.close()
+        seen_index.close()
+
+async def run_analyze_worker(exit_when_idle: bool = False, concurrency: int = ANALYSIS_CONCURRENCY):
+    """
+    Lease analysis jobs until stopped, analyzing up to ``concurrency`` profiles at once.
+
+    Results are recorded on the stored profile, suggested actions are queued
+    for review, and each completed job appends its result to
+    ANALYSIS_OUTPUT_FILE. Failed analyses are retried by the job queue. LLM
+    calls draw on rate limits shared with the other workers, and queue calls
+    run in a thread so they never block the event loop.
+
+    Args:
+        exit_when_idle (bool): Return once no analysis job is ready
+        concurrency (int): Maximum number of concurrent LLM requests
+    """
+    queue = get_job_queue()
+    SCHEDULER.share(JOB_QUEUE_PATH)
+    store = get_profile_store() if PROFILE_STORAGE == "sqlite" else None
+    review_queue = get_review_queue()
+
+    async def _work(writer: JsonlWriter):
+        while True:
+            job = await asyncio.to_thread(queue.lease, "analyze", WORKER_ID)
+            if job is None:
+                if exit_when_idle:
+                    return
+                await asyncio.sleep(WORKER_POLL_INTERVAL)
+                continue
+            profile: Dict = job["payload"]
+            try:
+                result = await prefilter_and_analyze(profile)
+            except Exception as e:
+                status = await asyncio.to_thread(queue.fail, job, str(e))
+                print(f"❌ Analysis failed for {profile.get('name')} ({status or 'lease lost'}): {e}")
+                continue
+            # Store and review queue writes are keyed by profile URL, so retries are harmless
+            if store:
+                await asyncio.to_thread(store.record_analysis, result)
+            if result["action"] in ["send_message", "send_connection"]:
+                await asyncio.to_thread(review_queue.enqueue, result)
+            analysis = {key: result[key] for key in ("action", "reason", "message")}
+            if await asyncio.to_thread(queue.complete, job, analysis):
+                writer.write(result)
+                print(f"✅ {profile.get('name')}: {result['action']}")
+
+    print(f"🚀 Analyze worker {WORKER_ID} started with concurrency {concurrency}")
+    with JsonlWriter(ANALYSIS_OUTPUT_FILE) as writer:
+        await asyncio.gather(*(_work(writer) for _ in range(max(concurrency, 1))))
+
+def main():
+    """Main function to run the worker CLI."""
+    args = parse_args()
+    queue = get_job_queue()
+    try:
+        if args.command == "search":
+            payload = {"query": args.query, "max_pages": args.max_pages}
+            if queue.enqueue("search", args.query, payload, requeue=True):
+                print(f"✅ Queued search: {args.query}")
+            else:
+                print(f"⏳ Search already queued or running: {args.query}")
+
+        elif args.command == "scrape":
+            try:
+                run_scrape_worker(args.exit_when_idle)
+            finally:
+                SeleniumManager.close()
+                json_path, prom_path = METRICS.write_reports("scrape_worker")
+                print(f"📊 Metrics written to {json_path} and {prom_path}")
+
+        elif args.command == "analyze":
+            try:
+                asyncio.run(run_analyze_worker(args.exit_when_idle))
+            finally:
+                json_path, prom_path = METRICS.write_reports("analyze_worker")
+                print(f"📊 Metrics written to {json_path} and {prom_path}")
+
+        elif args.command == "retry":
+            count = queue.retry_failed(args.kind)
+            print(f"✅ Queued {count} failed jobs again.")
+
+        elif args.command == "stats":
+            for kind, counts in sorted(queue.counts().items()):
+                print(f"{kind}: " + ", ".join(f"{status} {count}" for status, count in sorted(counts.items())))
+    except KeyboardInterrupt:
+        print("\n⏸️ Worker stopped. Its leased jobs become available again after the visibility timeout.")
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    main()